@@ -26,26 +26,72 @@ Interface avançada:
     nota = calc.calcular_nota(2023, 'MT', 1211, respostas)
 """
 
-from .simulador import SimuladorNota, ResultadoNota
-from .calculador import CalculadorTRI, ItemTRI
-from .coeficientes import (
-    aplicar_transformacao,
-    obter_transformacao,
-)
-from .tradutor import obter_config_lc, filtrar_itens_lc, ConfiguracaoLC
-from .mapeador_provas import MapeadorProvas, InfoProva
-from .precisao import formatar_resumo_validacao, verificar_precisao_prova
+import importlib
+from typing import TYPE_CHECKING
+
+# Os nomes públicos são resolvidos sob demanda (PEP 562): ``import tri_enem``
+# não carrega NumPy, pandas nem PyYAML, e quem usa só
+# ``verificar_precisao_prova`` ou ``MapeadorProvas`` não paga pelo motor.
+_ORIGEM = {
+    'SimuladorNota': 'simulador',
+    'ResultadoNota': 'simulador',
+    'ResultadoLote': 'simulador',
+    'CalculadorTRI': 'calculador',
+    'ItemTRI': 'calculador',
+    'BancoItens': 'banco_itens',
+    'Transformacao': 'coeficientes',
+    'aplicar_transformacao': 'coeficientes',
+    'obter_transformacao': 'coeficientes',
+    'obter_config_lc': 'tradutor',
+    'filtrar_itens_lc': 'tradutor',
+    'ConfiguracaoLC': 'tradutor',
+    'MapeadorProvas': 'mapeador_provas',
+    'InfoProva': 'mapeador_provas',
+    'obter_mapeador': 'mapeador_provas',
+    'formatar_resumo_validacao': 'precisao',
+    'verificar_precisao_prova': 'precisao',
+}
+
+if TYPE_CHECKING:
+    from .simulador import SimuladorNota, ResultadoNota, ResultadoLote
+    from .calculador import CalculadorTRI, ItemTRI
+    from .banco_itens import BancoItens
+    from .coeficientes import (
+        Transformacao,
+        aplicar_transformacao,
+        obter_transformacao,
+    )
+    from .tradutor import obter_config_lc, filtrar_itens_lc, ConfiguracaoLC
+    from .mapeador_provas import MapeadorProvas, InfoProva, obter_mapeador
+    from .precisao import formatar_resumo_validacao, verificar_precisao_prova
+
+
+def __getattr__(nome: str):
+    modulo = _ORIGEM.get(nome)
+    if modulo is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {nome!r}")
+    valor = getattr(importlib.import_module(f".{modulo}", __name__), nome)
+    globals()[nome] = valor
+    return valor
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
 
 __all__ = [
     # Interface simplificada (recomendada)
     'SimuladorNota',
     'ResultadoNota',
+    'ResultadoLote',
     # Interface avançada
     'CalculadorTRI',
     'ItemTRI',
+    'BancoItens',
     # Transformações de escala
     'obter_transformacao',
     'aplicar_transformacao',
+    'Transformacao',
     # Tradutor LC
     'obter_config_lc',
     'filtrar_itens_lc',
@@ -53,6 +99,7 @@ __all__ = [
     # Mapeador de códigos
     'MapeadorProvas',
     'InfoProva',
+    'obter_mapeador',
     # Verificação de precisão
     'verificar_precisao_prova',
     'formatar_resumo_validacao',
@@ -0,0 +1,375 @@
+# SPDX-License-Identifier: PolyForm-Noncommercial-1.0.0
+# Copyright (c) 2026 Henrique Lindemann
+"""
+Banco de itens compilado de uma prova.
+
+O motor de cálculo percorre os mesmos 45 itens para cada ponto de quadratura
+e para cada participante. Manter os parâmetros em objetos ``ItemTRI`` obriga
+esse laço a acessar atributos em Python; ``BancoItens`` guarda a prova como
+arrays NumPy contíguos (estrutura de arrays), na ordem de CO_POSICAO, que é a
+mesma ordem de TX_RESPOSTAS.
+
+O banco é imutável: os arrays são marcados como somente leitura, o que permite
+compartilhá-lo pelo cache de ``CalculadorTRI`` sem cópias defensivas. Para
+compatibilidade, ele continua se comportando como a lista de ``ItemTRI``
+devolvida até a v4 (``len``, indexação e iteração).
+
+As cores de uma mesma aplicação (azul, amarela, rosa, cinza...) trazem os
+mesmos itens em outra ordem de CO_POSICAO. ``ordem_canonica`` e
+``assinatura`` descrevem o conjunto de itens independentemente dessa ordem,
+para que tabelas e caches sejam compartilhados entre as cores.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import (
+    TYPE_CHECKING, Iterable, Optional, Sequence, Tuple, Union, overload,
+)
+
+import numpy as np
+
+from .pacote_itens import ColunasItens
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+@dataclass
+class ItemTRI:
+    """Representa um item da prova com seus parâmetros TRI na escala (0,1)"""
+    posicao: int
+    gabarito: str
+    param_a: float  # Discriminação
+    param_b: float  # Dificuldade
+    param_c: float  # Acerto casual (probabilidade)
+    co_item: int
+    abandonado: bool = False
+    tp_lingua: Optional[float] = None  # 0=inglês, 1=espanhol, NaN=comum
+
+
+# Gabaritos que não cabem em um byte ASCII (por exemplo 'nan', de células
+# vazias) recebem este código, que nunca é tratado como acerto.
+SEM_GABARITO = 0
+
+# Caracteres aceitos em TX_RESPOSTAS ('.' em branco, '*' dupla marcação).
+ALFABETO_RESPOSTAS = "ABCDE.*"
+# Tabela de consulta por código (< 256): True para caracteres do alfabeto,
+# em maiúscula ou minúscula.
+_CARACTERE_VALIDO = np.zeros(256, dtype=bool)
+_CARACTERE_VALIDO[[ord(c) for c in ALFABETO_RESPOSTAS + ALFABETO_RESPOSTAS.lower()]] = True
+
+
+def codificar_gabarito(gabarito: str) -> int:
+    """Código uint8 do gabarito, em maiúscula; ``SEM_GABARITO`` se inválido."""
+    texto = str(gabarito).upper()
+    if len(texto) != 1 or ord(texto) > 0x7F:
+        return SEM_GABARITO
+    return ord(texto)
+
+
+def _somente_leitura(valores, dtype) -> np.ndarray:
+    array = np.ascontiguousarray(valores, dtype=dtype)
+    if array.ndim != 1:
+        raise ValueError("os campos do banco de itens devem ser vetores")
+    array.setflags(write=False)
+    return array
+
+
+@dataclass(frozen=True, eq=False)
+class BancoItens(Sequence):
+    """
+    Itens de uma prova em arrays contíguos, ordenados por CO_POSICAO.
+
+    Attributes:
+        posicao: CO_POSICAO de cada item (int64)
+        gabarito: código ASCII maiúsculo do gabarito (uint8)
+        param_a, param_b, param_c: parâmetros ML3 (float64; 0.0 se ausentes)
+        co_item: identificador do item (int64; 0 quando ausente)
+        abandonado: máscara de itens anulados (bool)
+        tp_lingua: 0=inglês, 1=espanhol, NaN=comum (float64)
+        gabarito_texto: gabarito original, preservado para exibição
+        chave: identidade (ano, area, co_prova, tp_lingua), quando conhecida
+        ordem_canonica: índices que levam a ordem da prova à ordem canônica
+            (por CO_ITEM e parâmetros), comum a todas as cores
+        ordem_inversa: índices que levam a ordem canônica de volta à da prova
+        assinatura: bytes dos itens na ordem canônica (CO_ITEM, parâmetros e
+            anulação); provas com a mesma assinatura têm a mesma
+            verossimilhança a menos da permutação
+    """
+    posicao: np.ndarray
+    gabarito: np.ndarray
+    param_a: np.ndarray
+    param_b: np.ndarray
+    param_c: np.ndarray
+    co_item: np.ndarray
+    abandonado: np.ndarray
+    tp_lingua: np.ndarray
+    gabarito_texto: Tuple[str, ...]
+    chave: Optional[Tuple] = None
+    ativos: np.ndarray = field(init=False, repr=False)
+    ordem_canonica: np.ndarray = field(init=False, repr=False)
+    ordem_inversa: np.ndarray = field(init=False, repr=False)
+    assinatura: bytes = field(init=False, repr=False)
+
+    def __post_init__(self):
+        tipos = {
+            "posicao": np.int64,
+            "gabarito": np.uint8,
+            "param_a": np.float64,
+            "param_b": np.float64,
+            "param_c": np.float64,
+            "co_item": np.int64,
+            "abandonado": np.bool_,
+            "tp_lingua": np.float64,
+        }
+        for nome, dtype in tipos.items():
+            object.__setattr__(
+                self, nome, _somente_leitura(getattr(self, nome), dtype)
+            )
+        object.__setattr__(self, "gabarito_texto", tuple(self.gabarito_texto))
+        n = len(self.posicao)
+        if any(len(getattr(self, nome)) != n for nome in tipos) or (
+            len(self.gabarito_texto) != n
+        ):
+            raise ValueError("campos do banco de itens com tamanhos diferentes")
+        object.__setattr__(
+            self, "ativos", _somente_leitura(~self.abandonado, np.bool_)
+        )
+        # Empates (itens repetidos ou anulados sem CO_ITEM) só ocorrem entre
+        # linhas idênticas nos campos usados, então a ordem entre elas é
+        # irrelevante para a verossimilhança.
+        ordem = np.lexsort((
+            self.abandonado, self.param_c, self.param_b, self.param_a,
+            self.co_item,
+        ))
+        object.__setattr__(
+            self, "ordem_canonica", _somente_leitura(ordem, np.intp)
+        )
+        object.__setattr__(
+            self, "ordem_inversa", _somente_leitura(np.argsort(ordem), np.intp)
+        )
+        object.__setattr__(self, "assinatura", b"".join(
+            getattr(self, nome)[ordem].tobytes()
+            for nome in ("co_item", "param_a", "param_b", "param_c", "abandonado")
+        ))
+
+    @classmethod
+    def de_itens(
+        cls, itens: Iterable[ItemTRI], chave: Optional[Tuple] = None
+    ) -> "BancoItens":
+        """Compila uma sequência de ``ItemTRI``, mantendo a ordem recebida."""
+        itens = list(itens)
+        return cls(
+            posicao=[item.posicao for item in itens],
+            gabarito=[codificar_gabarito(item.gabarito) for item in itens],
+            param_a=[item.param_a for item in itens],
+            param_b=[item.param_b for item in itens],
+            param_c=[item.param_c for item in itens],
+            co_item=[item.co_item for item in itens],
+            abandonado=[bool(item.abandonado) for item in itens],
+            tp_lingua=[
+                np.nan if item.tp_lingua is None else item.tp_lingua
+                for item in itens
+            ],
+            gabarito_texto=[str(item.gabarito) for item in itens],
+            chave=chave,
+        )
+
+    @classmethod
+    def de_dataframe(
+        cls, df_prova: pd.DataFrame, chave: Optional[Tuple] = None
+    ) -> "BancoItens":
+        """Compila as linhas de uma prova já filtrada (ver ``de_colunas``)."""
+        return cls.de_colunas(
+            ColunasItens.de_dataframe(df_prova), np.arange(len(df_prova)), chave
+        )
+
+    @classmethod
+    def de_colunas(
+        cls,
+        colunas: ColunasItens,
+        linhas: np.ndarray,
+        chave: Optional[Tuple] = None,
+    ) -> "BancoItens":
+        """
+        Compila as ``linhas`` de uma prova já filtrada (ver ``carregar_itens``).
+
+        Item anulado é excluído da verossimilhança. A sinalização varia
+        conforme o ano, daí as quatro condições: flag explícita, parâmetros
+        TRI ausentes ou gabarito marcado como anulado ('X', '.', '*' ou
+        vazio).
+        """
+        linhas = np.asarray(linhas, dtype=np.int64)
+        linhas = linhas[np.argsort(colunas["CO_POSICAO"][linhas], kind="stable")]
+        params = {
+            nome: colunas.numerico(nome)[linhas]
+            for nome in ("NU_PARAM_A", "NU_PARAM_B", "NU_PARAM_C")
+        }
+        gabarito_bruto = colunas["TX_GABARITO"][linhas].tolist()
+        gabarito_texto = [str(valor) for valor in gabarito_bruto]
+
+        abandonado = np.zeros(len(linhas), dtype=bool)
+        if "IN_ITEM_ABAN" in colunas:
+            abandonado |= np.asarray(colunas["IN_ITEM_ABAN"][linhas] == 1, dtype=bool)
+        for valores in params.values():
+            abandonado |= np.isnan(valores)
+        abandonado |= np.asarray(
+            [valor is None or valor != valor for valor in gabarito_bruto], dtype=bool
+        )
+        abandonado |= np.asarray(
+            [texto.upper() == "X" or texto in (".", "*") for texto in gabarito_texto],
+            dtype=bool,
+        )
+
+        # CO_ITEM é só identificador e falta em itens anulados (LC 2009 tem
+        # um por prova). Descartar a linha desalinharia as posições seguintes.
+        co_item = colunas.numerico("CO_ITEM")[linhas]
+        if "TP_LINGUA" in colunas:
+            tp_lingua = colunas.numerico("TP_LINGUA")[linhas]
+        else:
+            tp_lingua = np.full(len(linhas), np.nan)
+
+        return cls(
+            posicao=colunas["CO_POSICAO"][linhas].astype(np.int64),
+            gabarito=[codificar_gabarito(texto) for texto in gabarito_texto],
+            param_a=np.nan_to_num(params["NU_PARAM_A"], nan=0.0),
+            param_b=np.nan_to_num(params["NU_PARAM_B"], nan=0.0),
+            param_c=np.nan_to_num(params["NU_PARAM_C"], nan=0.0),
+            co_item=np.nan_to_num(co_item, nan=0.0).astype(np.int64),
+            abandonado=abandonado,
+            tp_lingua=tp_lingua,
+            gabarito_texto=gabarito_texto,
+            chave=chave,
+        )
+
+    @property
+    def n_ativos(self) -> int:
+        """Número de itens que entram na verossimilhança."""
+        return int(np.count_nonzero(self.ativos))
+
+    def conferir(self, valores) -> np.ndarray:
+        """``valores`` como array, com um valor por item no último eixo.
+
+        Levanta ``ValueError`` se o tamanho não for o da prova (não trunca).
+        """
+        valores = np.asarray(valores)
+        if valores.ndim == 0 or valores.shape[-1] != len(self):
+            recebidos = 0 if valores.ndim == 0 else valores.shape[-1]
+            raise ValueError(
+                f"esperado um valor por item da prova ({len(self)}), "
+                f"recebidos {recebidos}"
+            )
+        return valores
+
+    def canonico(self, acertos: np.ndarray) -> np.ndarray:
+        """Reordena o último eixo de ``acertos`` para a ordem canônica."""
+        return self.conferir(acertos)[..., self.ordem_canonica]
+
+    def da_prova(self, valores: np.ndarray) -> np.ndarray:
+        """Inverso de ``canonico``: volta o último eixo à ordem da prova."""
+        return np.asarray(valores)[..., self.ordem_inversa]
+
+    def __len__(self) -> int:
+        return len(self.posicao)
+
+    def _item(self, idx: int) -> ItemTRI:
+        tp_lingua = float(self.tp_lingua[idx])
+        return ItemTRI(
+            posicao=int(self.posicao[idx]),
+            gabarito=self.gabarito_texto[idx],
+            param_a=float(self.param_a[idx]),
+            param_b=float(self.param_b[idx]),
+            param_c=float(self.param_c[idx]),
+            co_item=int(self.co_item[idx]),
+            abandonado=bool(self.abandonado[idx]),
+            tp_lingua=tp_lingua,
+        )
+
+    @overload
+    def __getitem__(self, idx: int) -> ItemTRI: ...
+
+    @overload
+    def __getitem__(self, idx: slice) -> list: ...
+
+    def __getitem__(self, idx: Union[int, slice]):
+        """Materializa ``ItemTRI`` sob demanda; alterá-lo não altera o banco."""
+        if isinstance(idx, slice):
+            return [self._item(i) for i in range(*idx.indices(len(self)))]
+        n = len(self)
+        idx = int(idx)
+        if idx < 0:
+            idx += n
+        if not 0 <= idx < n:
+            raise IndexError("índice de item fora do intervalo")
+        return self._item(idx)
+
+    def __repr__(self) -> str:
+        return f"BancoItens(chave={self.chave!r}, itens={len(self)}, ativos={self.n_ativos})"
+
+    def acertos(self, respostas_str: str) -> np.ndarray:
+        """
+        Pareia a string de respostas com o gabarito (1=acerto, 0=erro).
+
+        O caractere de índice ``i`` corresponde ao i-ésimo item em ordem de
+        CO_POSICAO. Respostas ausentes no fim da string contam como erro.
+        """
+        n = len(self)
+        codigos = np.frombuffer(
+            respostas_str[:n].encode("utf-32-le", "surrogatepass"),
+            dtype="<u4",
+        )
+        # Só letras ASCII podem coincidir com um gabarito; as minúsculas
+        # são comparadas como maiúsculas.
+        minusculas = (codigos >= ord("a")) & (codigos <= ord("z"))
+        codigos = np.where(minusculas, codigos - 32, codigos)
+        gabarito = self.gabarito[:len(codigos)]
+        resultado = np.zeros(n, dtype=np.int8)
+        resultado[:len(codigos)] = (codigos == gabarito) & (gabarito != SEM_GABARITO)
+        return resultado
+
+    def acertos_lote(
+        self, respostas: Union[Sequence[str], np.ndarray]
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Pareia um lote de strings com o gabarito de uma vez.
+
+        As strings são vistas como uma matriz de códigos (N × itens) de
+        largura fixa; o alfabeto é conferido por tabela de consulta e o
+        gabarito por uma única comparação com broadcast. Também aceita a
+        matriz de códigos já montada (inteiros N × itens), como a devolvida
+        por ``tradutor.filtrar_respostas_lc_lote``.
+
+        Returns:
+            (acertos, erros): matriz int8 (N × itens) e máscara (N,) das linhas
+            com comprimento diferente do número de itens ou com caracteres
+            fora de ``ALFABETO_RESPOSTAS``. Linhas com erro ficam zeradas.
+        """
+        n = len(self)
+        if isinstance(respostas, np.ndarray) and respostas.dtype.kind in "iu":
+            if respostas.ndim != 2 or respostas.shape[1] != n:
+                raise ValueError(f"a matriz de códigos deve ter {n} colunas")
+            codigos = respostas.astype(np.uint32, copy=False)
+            longas = np.zeros(len(codigos), dtype=bool)
+        else:
+            # Uma coluna extra denuncia strings mais longas que a prova (a
+            # conversão para U{n+1} trunca o restante).
+            textos = np.asarray(respostas, dtype=f"<U{n + 1}").reshape(-1)
+            codigos = textos.view(np.uint32).reshape(len(textos), n + 1)
+            longas = codigos[:, n] != 0
+            codigos = codigos[:, :n]
+        validos = _CARACTERE_VALIDO[np.minimum(codigos, 255)] & (codigos < 256)
+        erros = longas | ~validos.all(axis=1)
+
+        minusculas = (codigos >= ord("a")) & (codigos <= ord("z"))
+        codigos = np.where(minusculas, codigos - 32, codigos)
+        acertos = (codigos == self.gabarito) & (self.gabarito != SEM_GABARITO)
+        acertos[erros] = False
+        return acertos.astype(np.int8), erros
+
+
+def como_banco(itens: Union[BancoItens, Sequence[ItemTRI]]) -> BancoItens:
+    """Aceita um ``BancoItens`` ou uma lista de ``ItemTRI`` (API até a v4)."""
+    if isinstance(itens, BancoItens):
+        return itens
+    return BancoItens.de_itens(itens)
@@ -0,0 +1,85 @@
+# SPDX-License-Identifier: PolyForm-Noncommercial-1.0.0
+# Copyright (c) 2026 Henrique Lindemann
+"""Contêiner binário mapeável em memória para dados empacotados.
+
+Formato: ``MAGICO`` (8 bytes), tamanho do cabeçalho (uint64 little-endian),
+cabeçalho JSON em UTF-8 e, alinhados em 8 bytes, os arrays descritos em
+``cabecalho["arrays"]`` (dtype, shape e deslocamento). A leitura faz um
+``mmap`` do arquivo e devolve views ``np.frombuffer`` sem copiar os dados.
+"""
+
+from __future__ import annotations
+
+import json
+import mmap
+import struct
+from pathlib import Path
+from typing import Any, Dict, Tuple
+
+import numpy as np
+
+MAGICO = b"TRIBIN\x00\x01"
+_ALINHAMENTO = 8
+
+
+def _alinhar(posicao: int) -> int:
+    return -(-posicao // _ALINHAMENTO) * _ALINHAMENTO
+
+
+def escrever_pacote(
+    destino: Path, cabecalho: Dict[str, Any], arrays: Dict[str, np.ndarray]
+) -> None:
+    """Grava ``cabecalho`` (serializável em JSON) e ``arrays`` em ``destino``."""
+    arrays = {
+        nome: np.ascontiguousarray(valor, dtype=valor.dtype.newbyteorder("<"))
+        for nome, valor in arrays.items()
+    }
+    descricao = {}
+    deslocamento = 0
+    for nome, valor in arrays.items():
+        descricao[nome] = {
+            "dtype": valor.dtype.str,
+            "shape": list(valor.shape),
+            "offset": deslocamento,
+        }
+        deslocamento = _alinhar(deslocamento + valor.nbytes)
+    bruto = json.dumps(
+        {**cabecalho, "arrays": descricao},
+        ensure_ascii=False, allow_nan=False, separators=(",", ":"),
+    ).encode("utf-8")
+    inicio = _alinhar(len(MAGICO) + 8 + len(bruto))
+    with Path(destino).open("wb") as saida:
+        saida.write(MAGICO + struct.pack("<Q", len(bruto)) + bruto)
+        saida.write(b"\0" * (inicio - saida.tell()))
+        for nome, valor in arrays.items():
+            saida.write(b"\0" * (inicio + descricao[nome]["offset"] - saida.tell()))
+            saida.write(valor.tobytes())
+
+
+def ler_pacote(caminho: Path) -> Tuple[Dict[str, Any], Dict[str, np.ndarray]]:
+    """Cabeçalho e arrays (somente leitura, mapeados) de um pacote.
+
+    Levanta ``ValueError`` se o arquivo não for um pacote válido.
+    """
+    with Path(caminho).open("rb") as arquivo:
+        mapa = mmap.mmap(arquivo.fileno(), 0, access=mmap.ACCESS_READ)
+    cabecalho_fim = len(MAGICO) + 8
+    if len(mapa) < cabecalho_fim or mapa[:len(MAGICO)] != MAGICO:
+        raise ValueError(f"não é um pacote binário do tri_enem: {caminho}")
+    (tamanho,) = struct.unpack("<Q", mapa[len(MAGICO):cabecalho_fim])
+    try:
+        cabecalho = json.loads(
+            mapa[cabecalho_fim:cabecalho_fim + tamanho].decode("utf-8")
+        )
+        inicio = _alinhar(cabecalho_fim + tamanho)
+        arrays = {}
+        for nome, info in cabecalho.pop("arrays").items():
+            dtype = np.dtype(info["dtype"])
+            shape = tuple(info["shape"])
+            arrays[nome] = np.frombuffer(
+                mapa, dtype=dtype, count=int(np.prod(shape, dtype=np.int64)),
+                offset=inicio + info["offset"],
+            ).reshape(shape)
+    except (KeyError, TypeError, ValueError) as exc:
+        raise ValueError(f"pacote binário corrompido: {caminho}: {exc}") from None
+    return cabecalho, arrays
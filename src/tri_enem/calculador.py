@@ -63,27 +63,64 @@ Limitações conhecidas estão documentadas em precisao.py, que classifica cada
 prova por erro medido contra notas oficiais.
 """
 
+from __future__ import annotations
+
+import threading
+
 import numpy as np
-import pandas as pd
+from collections import OrderedDict, namedtuple
 from importlib.resources import files
 from pathlib import Path
-from typing import Iterable, Tuple, List, Dict, Optional
-from dataclasses import dataclass
+from typing import (
+    TYPE_CHECKING, Any, Callable, Iterable, Tuple, List, Dict, Optional, Sequence,
+    Union,
+)
+
+from .banco_itens import BancoItens, ItemTRI, como_banco
+from .coeficientes import Transformacao, obter_transformacao
+from .pacote_itens import (
+    ColunasItens,
+    IndiceProvas,
+    carregar_pacote_itens,
+    ler_csv_colunas,
+    ler_csv_itens,
+)
+from .eap import (
+    TabelaItensAno,
+    TabelaVerossimilhanca,
+    log_probabilidades_ml3,
+    log_verossimilhanca_invertida,
+    log_verossimilhancas,
+    resumo_posterior,
+    theta_eap,
+)
+from .segmento import SegmentoItens, abrir_segmento
 
-from .coeficientes import aplicar_transformacao, obter_transformacao
+if TYPE_CHECKING:
+    import pandas as pd
 
+# Aceito pelos métodos de estimação: o banco compilado ou, como até a v4,
+# uma lista de ItemTRI (convertida a cada chamada).
+Itens = Union[BancoItens, Sequence[ItemTRI]]
 
-@dataclass
-class ItemTRI:
-    """Representa um item da prova com seus parâmetros TRI na escala (0,1)"""
-    posicao: int
-    gabarito: str
-    param_a: float  # Discriminação
-    param_b: float  # Dificuldade
-    param_c: float  # Acerto casual (probabilidade)
-    co_item: int
-    abandonado: bool = False
-    tp_lingua: Optional[float] = None  # 0=inglês, 1=espanhol, NaN=comum
+# Mesmos campos de functools.lru_cache().cache_info().
+InfoCache = namedtuple("InfoCache", ["hits", "misses", "maxsize", "currsize"])
+
+
+def _padroes_unicos(matriz: np.ndarray, ativos: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Linhas distintas da matriz de acertos e o índice inverso.
+
+    As posições de itens anulados (``~ativos``) são zeradas antes da
+    comparação (não afetam θ). Cada linha é empacotada em bits e comparada
+    como um único valor, o que evita a ordenação lexicográfica de
+    ``np.unique(axis=0)``.
+    """
+    mascarada = np.where(ativos, matriz, 0).astype(np.uint8)
+    bits = np.ascontiguousarray(np.packbits(mascarada, axis=1))
+    chaves = bits.view(np.dtype((np.void, bits.shape[1]))).ravel()
+    _, indices, inversa = np.unique(chaves, return_index=True, return_inverse=True)
+    return matriz[indices], inversa.ravel()
 
 
 class CalculadorTRI:
@@ -105,16 +142,34 @@ class CalculadorTRI:
     
     D = 1.0  # Fator de escala
     N_QUADRATURA = 80  # 80 pontos melhora precisão para notas altas
+    # Cada tabela de verossimilhança ocupa ~29 KB (80 pontos × 45 itens);
+    # 1024 cobrem todas as provas e idiomas do catálogo com folga.
+    MAX_TABELAS = 1024
+    # Nível do intervalo de credibilidade a posteriori (quantis 2,5% e 97,5%).
+    NIVEL_CREDIBILIDADE = 0.95
     
     # Coeficientes carregados de coeficientes.py
     # Ver coeficientes.py para adicionar novos coeficientes
     
-    def __init__(self, itens_path: str = None):
+    def __init__(self, itens_path: str = None, max_tabelas: int = MAX_TABELAS,
+                 cache_padroes: int = 0, segmento: Optional[str] = None):
         """
         Args:
             itens_path: Caminho externo opcional para a pasta de itens.
                 Quando omitido, usa os parâmetros empacotados com ``tri_enem``.
+            max_tabelas: Capacidade do cache LRU de tabelas de
+                verossimilhança por prova (ver ``_tabela``).
+            cache_padroes: Capacidade do cache LRU de padrões de resposta
+                (θ e inversões já estimados por prova). 0 desativa.
+            segmento: Arquivo gerado por ``publicar_segmento`` (ver
+                ``segmento.py``). Bancos e tabelas das provas passam a ser
+                lidos dele, compartilhados entre processos. Levanta
+                ``ValueError`` se não conferir com a pasta de itens.
         """
+        if max_tabelas < 1:
+            raise ValueError("max_tabelas deve ser positivo")
+        if cache_padroes < 0:
+            raise ValueError("cache_padroes não pode ser negativo")
         self._packaged_base = Path(
             str(files("tri_enem").joinpath("data", "itens"))
         )
@@ -122,10 +177,41 @@ class CalculadorTRI:
             self.base_path = self._packaged_base
         else:
             self.base_path = Path(itens_path)
-        self._cache_itens: Dict[str, List[ItemTRI]] = {}
-        self._cache_df_itens: Dict[str, pd.DataFrame] = {}
+        self._cache_itens: Dict[str, BancoItens] = {}
+        self._cache_colunas: Dict[int, ColunasItens] = {}
+        # ano -> (área, prova) -> linhas das colunas; ver _indice_provas.
+        self._cache_indices: Dict[int, IndiceProvas] = {}
+        # ano -> log Q / delta de todos os itens distintos; ver _tabela_ano.
+        self._cache_anos: Dict[int, TabelaItensAno] = {}
+        # assinatura do banco -> tabela na ordem canônica; ver _tabela.
+        self._cache_tabelas: OrderedDict = OrderedDict()
+        self._max_tabelas = int(max_tabelas)
+        # (assinatura do banco, bits do padrão canônico) -> {campo: valor}.
+        self._cache_padroes: OrderedDict = OrderedDict()
+        self._max_padroes = int(cache_padroes)
+        self._padroes_hits = 0
+        self._padroes_misses = 0
+        # Carga única por chave sob concorrência; ver _carregar_uma_vez.
+        self._trava = threading.Lock()
+        self._cargas: Dict[tuple, threading.Lock] = {}
         self._pontos_quad, self._pesos_quad = self._calcular_quadratura()
+        self._segmento: Optional[SegmentoItens] = None
+        self._caminho_segmento = None if segmento is None else str(segmento)
+        if segmento is not None:
+            self._segmento = abrir_segmento(
+                segmento, self.base_path, self._pontos_quad, self._pesos_quad,
+                self.D,
+            )
     
+    def _configuracao(self) -> Dict[str, Any]:
+        """Argumentos que recriam este calculador (por exemplo, num worker)."""
+        return {
+            "itens_path": str(self.base_path),
+            "max_tabelas": self._max_tabelas,
+            "cache_padroes": self._max_padroes,
+            "segmento": self._caminho_segmento,
+        }
+
     def _calcular_quadratura(self) -> Tuple[np.ndarray, np.ndarray]:
         """Calcula pontos e pesos para quadratura Gauss-Hermite sobre N(0,1)"""
         pontos_h, pesos_h = np.polynomial.hermite.hermgauss(self.N_QUADRATURA)
@@ -133,42 +219,114 @@ class CalculadorTRI:
         pesos = pesos_h / np.sqrt(np.pi)
         return pontos, pesos
     
-    def _carregar_df_itens(self, ano: int) -> pd.DataFrame:
-        """Carrega DataFrame de itens de um ano (com cache)."""
-        if ano in self._cache_df_itens:
-            return self._cache_df_itens[ano]
-        
+    def _carregar_uma_vez(self, cache: dict, chave, carregar: Callable[[], Any],
+                          limite: Optional[int] = None):
+        """
+        Valor de ``cache[chave]``, calculado por ``carregar`` uma única vez.
+
+        A leitura de uma entrada já presente não toma trava. Na falta,
+        threads que pedem a mesma chave esperam numa trava própria dela
+        enquanto a primeira carrega (chaves diferentes carregam em paralelo);
+        a gravação e, com ``limite``, o descarte LRU ficam sob ``_trava``.
+        Os valores guardados são imutáveis e compartilhados entre threads.
+        Se ``carregar`` levanta, nada é guardado e a exceção se propaga.
+        """
+        valor = cache.get(chave)
+        if valor is not None:
+            return valor
+        marca = (id(cache), chave)
+        with self._trava:
+            trava = self._cargas.setdefault(marca, threading.Lock())
+        try:
+            with trava:
+                valor = cache.get(chave)
+                if valor is None:
+                    valor = carregar()
+                    with self._trava:
+                        cache[chave] = valor
+                        if limite is not None:
+                            while len(cache) > limite:
+                                cache.popitem(last=False)
+        finally:
+            with self._trava:
+                if self._cargas.get(marca) is trava:
+                    del self._cargas[marca]
+        return valor
+
+    @staticmethod
+    def _renovar(cache: OrderedDict, chave) -> None:
+        """Marca ``chave`` como recente no LRU, sem trava."""
+        try:
+            cache.move_to_end(chave)
+        except KeyError:  # Descartada por outra thread entre a leitura e aqui.
+            pass
+
+    def _carregar_colunas(self, ano: int) -> ColunasItens:
+        """Carrega as colunas de itens de um ano (com cache), sem pandas.
+
+        Usa o pacote binário da pasta (``itens.bin``, conferido com o
+        manifesto) quando existe; senão, o CSV do ano, lido com o módulo
+        ``csv``. O índice de provas do ano é montado na mesma carga (ver
+        ``_indice_provas``). Sob concorrência, o arquivo do ano é lido uma
+        só vez (ver ``_carregar_uma_vez``).
+        """
+        return self._carregar_uma_vez(
+            self._cache_colunas, ano, lambda: self._ler_colunas(ano)
+        )
+
+    def _ler_colunas(self, ano: int) -> ColunasItens:
+        pacote = carregar_pacote_itens(self.base_path)
+        if pacote is not None and ano in pacote.anos:
+            colunas = pacote.colunas(ano)
+            grupos = pacote.provas(ano)
+        else:
+            colunas = ler_csv_colunas(self._caminho_csv(ano))
+            grupos = colunas.grupos()
+        # Gravado antes das colunas: quem vê as colunas no cache vê o índice.
+        self._cache_indices[ano] = IndiceProvas.de_grupos(grupos)
+        return colunas
+
+    def _caminho_csv(self, ano: int) -> Path:
         itens_path = self.base_path / str(ano) / f"ITENS_PROVA_{ano}.csv"
         if not itens_path.exists():
             raise FileNotFoundError(f"Arquivo não encontrado: {itens_path}")
+        return itens_path
 
-        # O gerador do pacote normaliza para UTF-8. Caminhos externos podem
-        # apontar aos CSVs oficiais antigos em Latin-1, por isso o fallback de
-        # codificação é explícito e não muda a origem solicitada.
-        try:
-            df = pd.read_csv(itens_path, encoding="utf-8", sep=";")
-        except UnicodeDecodeError:
-            df = pd.read_csv(itens_path, encoding="latin1", sep=";")
-        self._cache_df_itens[ano] = df
-        return df
+    def _carregar_df_itens(self, ano: int) -> pd.DataFrame:
+        """``DataFrame`` de itens do ano, para inspeção; exige pandas.
+
+        O motor usa ``_carregar_colunas``. Este é o mesmo conteúdo que
+        ``pd.read_csv`` do CSV do ano (ou o do pacote, idêntico).
+        """
+        pacote = carregar_pacote_itens(self.base_path)
+        if pacote is not None and ano in pacote.anos:
+            return pacote.dataframe(ano)
+        return ler_csv_itens(self._caminho_csv(ano))
+
+    def _indice_provas(self, ano: int) -> IndiceProvas:
+        """(área, prova) -> linhas e área -> provas do ano, sem varrer as colunas."""
+        self._carregar_colunas(ano)
+        return self._cache_indices[ano]
     
     def listar_provas(self, ano: int, area: str = None) -> Dict[str, List[int]]:
         """Lista todas as provas disponíveis para um ano."""
-        df = self._carregar_df_itens(ano)
-        
+        provas = None
+        if self._segmento is not None:
+            provas = self._segmento.provas(ano)
+        if provas is None:
+            provas = self._indice_provas(ano).provas_por_area
         if area:
-            df = df[df['SG_AREA'] == area.upper()]
-            return {area.upper(): sorted(df['CO_PROVA'].unique().tolist())}
-        else:
-            resultado = {}
-            for a in df['SG_AREA'].unique():
-                resultado[a] = sorted(df[df['SG_AREA'] == a]['CO_PROVA'].unique().tolist())
-            return resultado
+            return {area.upper(): list(provas.get(area.upper(), []))}
+        return {a: list(lista) for a, lista in provas.items()}
     
     def carregar_itens(self, ano: int, area: str, co_prova: int, 
-                       tp_lingua: Optional[int] = None) -> List[ItemTRI]:
+                       tp_lingua: Optional[int] = None) -> BancoItens:
         """
         Carrega os itens de uma prova específica.
+
+        Devolve um ``BancoItens`` imutável, compartilhado pelo cache: os
+        parâmetros ficam em arrays contíguos ordenados por CO_POSICAO. Cada
+        prova é montada uma só vez, mesmo com várias threads pedindo-a.
         
         Args:
             ano: Ano do ENEM
@@ -194,10 +352,16 @@ class CalculadorTRI:
             tp_lingua = None
         
         cache_key = f"{ano}_{area}_{co_prova}_{tp_lingua}"
-        
-        if cache_key in self._cache_itens:
-            return self._cache_itens[cache_key]
-        
+        itens = self._cache_itens.get(cache_key)
+        if itens is not None:
+            return itens
+        return self._carregar_uma_vez(
+            self._cache_itens, cache_key,
+            lambda: self._montar_itens(ano, area, co_prova, tp_lingua),
+        )
+
+    def _montar_itens(self, ano: int, area: str, co_prova: int,
+                      tp_lingua: Optional[int]) -> BancoItens:
         # Traduzir códigos BAM2 (Segunda Oportunidade) de 2025 para códigos PPL equivalentes
         # que possuem itens definidos no ITENS_PROVA_2025.csv
         co_prova_busca = co_prova
@@ -215,68 +379,31 @@ class CalculadorTRI:
             if co_prova in TRADUCAO_BAM2:
                 co_prova_busca = TRADUCAO_BAM2[co_prova]
 
+        chave = (ano, area, co_prova, tp_lingua)
+        if self._segmento is not None:
+            itens = self._segmento.banco(ano, area, co_prova_busca, tp_lingua, chave)
+            if itens is not None:
+                return itens
+
         from .tradutor import (
-            obter_config_lc, filtrar_itens_lc, deduplicar_itens_por_posicao,
+            obter_config_lc, filtrar_linhas_lc, deduplicar_linhas_por_posicao,
         )
 
-        df = self._carregar_df_itens(ano)
+        colunas = self._carregar_colunas(ano)
+        linhas = self._indice_provas(ano).linhas(area, co_prova_busca)
 
         if area == 'LC':
             # Filtro de idioma e dedup vivem em tradutor.py, um só lugar.
-            df_prova = filtrar_itens_lc(
-                df, co_prova_busca, tp_lingua, obter_config_lc(ano)
+            linhas = filtrar_linhas_lc(
+                colunas, linhas, co_prova_busca, tp_lingua, obter_config_lc(ano)
             )
         else:
-            df_prova = deduplicar_itens_por_posicao(
-                df[(df['SG_AREA'] == area.upper()) & (df['CO_PROVA'] == co_prova_busca)]
-            )
+            linhas = deduplicar_linhas_por_posicao(colunas, linhas)
 
-        if df_prova.empty:
+        if len(linhas) == 0:
             raise ValueError(f"Prova não encontrada: {ano}/{area}/{co_prova}")
 
-        itens = []
-        for _, row in df_prova.iterrows():
-            # Item anulado: excluído da verossimilhança (ver estimar_theta_eap).
-            # A sinalização varia conforme o ano, daí as quatro condições: flag
-            # explícita, parâmetros TRI ausentes ou gabarito marcado como
-            # anulado ('X', '.', '*' ou vazio).
-            is_abandonado = (
-                row.get('IN_ITEM_ABAN') == 1
-            ) or (
-                pd.isna(row['NU_PARAM_A']) or
-                pd.isna(row['NU_PARAM_B']) or
-                pd.isna(row['NU_PARAM_C'])
-            ) or (
-                str(row['TX_GABARITO']).upper() == 'X'
-            ) or (
-                pd.isna(row['TX_GABARITO']) or
-                str(row['TX_GABARITO']) == '.' or
-                str(row['TX_GABARITO']) == '*'
-            )
-
-            # CO_ITEM é só identificador e falta em itens anulados (LC 2009
-            # tem um por prova). Descartar a linha desalinharia todas as
-            # posições seguintes.
-            try:
-                co_item_val = int(row['CO_ITEM'])
-            except (ValueError, TypeError):
-                co_item_val = 0
-
-            item = ItemTRI(
-                posicao=int(row['CO_POSICAO']),
-                gabarito=str(row['TX_GABARITO']),
-                param_a=float(row['NU_PARAM_A']) if pd.notna(row['NU_PARAM_A']) else 0.0,
-                param_b=float(row['NU_PARAM_B']) if pd.notna(row['NU_PARAM_B']) else 0.0,
-                param_c=float(row['NU_PARAM_C']) if pd.notna(row['NU_PARAM_C']) else 0.0,
-                co_item=co_item_val,
-                abandonado=is_abandonado,
-                tp_lingua=row.get('TP_LINGUA'),
-            )
-            itens.append(item)
-        
-        itens.sort(key=lambda x: x.posicao)
-        self._cache_itens[cache_key] = itens
-        return itens
+        return BancoItens.de_colunas(colunas, linhas, chave=chave)
     
     def probabilidade_acerto(self, theta: float, item: ItemTRI) -> float:
         """Calcula P(u=1|θ) usando modelo ML3."""
@@ -290,96 +417,311 @@ class CalculadorTRI:
         
         return c + (1 - c) / (1 + np.exp(-exp_arg))
     
-    def log_verossimilhanca(self, theta: float, respostas: List[int], 
-                           itens: List[ItemTRI]) -> float:
+    def _log_probabilidades(
+        self, banco: BancoItens, pontos: Optional[np.ndarray] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Tabelas log P / log Q (pontos × itens ativos) do banco."""
+        return log_probabilidades_ml3(
+            self._pontos_quad if pontos is None else pontos,
+            banco.param_a[banco.ativos],
+            banco.param_b[banco.ativos],
+            banco.param_c[banco.ativos],
+            self.D,
+        )
+
+    def _tabela(self, banco: BancoItens) -> TabelaVerossimilhanca:
+        """
+        Tabela de verossimilhança do banco na ordem canônica, com cache LRU.
+
+        As tabelas dependem só dos parâmetros dos itens e da grade fixa de
+        quadratura. O cache é indexado pela assinatura do banco, de modo que
+        todas as cores de uma aplicação compartilham a mesma tabela; as
+        colunas seguem ``banco.ordem_canonica`` e os acertos devem passar por
+        ``banco.canonico``. Bancos sem chave (listas de ItemTRI) não entram
+        no cache.
+        """
+        if banco.chave is None:
+            return self._compilar_tabela(banco)
+        chave = banco.assinatura
+        tabela = self._cache_tabelas.get(chave)
+        if tabela is not None:
+            self._renovar(self._cache_tabelas, chave)
+            return tabela
+        return self._carregar_uma_vez(
+            self._cache_tabelas, chave, lambda: self._compilar_tabela(banco),
+            limite=self._max_tabelas,
+        )
+
+    def _compilar_tabela(self, banco: BancoItens) -> TabelaVerossimilhanca:
+        if self._segmento is not None and banco.chave is not None:
+            tabela = self._segmento.tabela(banco)
+            if tabela is not None:
+                return tabela
+        campos = {
+            nome: banco.canonico(getattr(banco, nome))
+            for nome in ("co_item", "param_a", "param_b", "param_c", "ativos")
+        }
+        indices = None
+        if banco.chave is not None:
+            indices = self._tabela_ano(banco.chave[0]).indices(**campos)
+        if indices is not None:
+            return self._tabela_ano(banco.chave[0]).tabela(indices)
+        campos.pop("co_item")
+        return TabelaVerossimilhanca.compilar(self._pontos_quad, **campos, d=self.D)
+
+    def _tabela_ano(self, ano: int) -> TabelaItensAno:
+        """
+        Tabela de todos os itens distintos do ano, calculada uma vez.
+
+        Com ela, a tabela de cada prova do ano é uma seleção de colunas: um
+        arquivo de microdados com dezenas de provas não reavalia o ML3 por
+        prova. Linhas sem parâmetros (itens anulados) ficam de fora.
+        """
+        tabela = self._cache_anos.get(ano)
+        if tabela is not None:
+            return tabela
+        return self._carregar_uma_vez(
+            self._cache_anos, ano, lambda: self._compilar_tabela_ano(ano)
+        )
+
+    def _compilar_tabela_ano(self, ano: int) -> TabelaItensAno:
+        colunas = self._carregar_colunas(ano)
+        valores = {
+            nome: colunas.numerico(nome)
+            for nome in ("CO_ITEM", "NU_PARAM_A", "NU_PARAM_B", "NU_PARAM_C")
+        }
+        # Mesma convenção de BancoItens: CO_ITEM ausente vira 0.
+        valores["CO_ITEM"] = np.nan_to_num(valores["CO_ITEM"], nan=0.0)
+        validos = ~np.isnan(np.column_stack([
+            valores[nome] for nome in ("NU_PARAM_A", "NU_PARAM_B", "NU_PARAM_C")
+        ])).any(axis=1)
+        return TabelaItensAno.compilar(
+            self._pontos_quad,
+            *(valores[nome][validos] for nome in valores),
+            d=self.D,
+        )
+
+    def _chave_padrao(self, banco: BancoItens, acertos: np.ndarray) -> Optional[tuple]:
+        """
+        Chave do cache de padrões, ou None quando o cache não se aplica.
+
+        ``acertos`` já deve estar na ordem canônica: o mesmo padrão respondido
+        em cores diferentes da prova cai na mesma entrada.
+        """
+        if self._max_padroes == 0 or banco.chave is None:
+            return None
+        ativos = banco.canonico(banco.ativos)
+        return banco.assinatura, np.packbits(acertos & ativos).tobytes()
+
+    def _consultar_padrao(self, chave: Optional[tuple], campo: str):
+        if chave is None:
+            return None
+        entrada = self._cache_padroes.get(chave)
+        valor = None if entrada is None else entrada.get(campo)
+        # Os contadores mudam sob a trava: ``+= 1`` não é atômico entre threads.
+        if valor is not None:
+            self._renovar(self._cache_padroes, chave)
+            with self._trava:
+                self._padroes_hits += 1
+            return valor
+        with self._trava:
+            self._padroes_misses += 1
+        return None
+
+    def _guardar_padrao(self, chave: Optional[tuple], campo: str, valor) -> None:
+        if chave is None:
+            return
+        with self._trava:
+            self._cache_padroes.setdefault(chave, {})[campo] = valor
+            self._cache_padroes.move_to_end(chave)
+            while len(self._cache_padroes) > self._max_padroes:
+                self._cache_padroes.popitem(last=False)
+
+    def info_cache_padroes(self) -> InfoCache:
+        """Contadores do cache de padrões, no formato de ``lru_cache``."""
+        with self._trava:
+            return InfoCache(
+                self._padroes_hits,
+                self._padroes_misses,
+                self._max_padroes,
+                len(self._cache_padroes),
+            )
+
+    def limpar_cache_padroes(self) -> None:
+        """Esvazia o cache de padrões e zera os contadores."""
+        with self._trava:
+            self._cache_padroes.clear()
+            self._padroes_hits = 0
+            self._padroes_misses = 0
+
+    def log_verossimilhanca(self, theta: float, respostas: Iterable[int],
+                           itens: Itens) -> float:
         """Calcula log da verossimilhança L(x|η,θ)."""
-        log_L = 0.0
-        
-        for u, item in zip(respostas, itens):
-            if item.abandonado:
-                continue
-            
-            p = self.probabilidade_acerto(theta, item)
-            p = np.clip(p, 1e-15, 1 - 1e-15)
-            
-            log_L += np.log(p) if u == 1 else np.log(1 - p)
-        
-        return log_L
+        banco = como_banco(itens)
+        respostas = banco.conferir(np.asarray(respostas, dtype=float))
+        acertos = respostas[banco.ativos] == 1
+        log_p, log_q = self._log_probabilidades(banco, np.asarray([theta]))
+        return float(log_verossimilhancas(acertos[None, :], log_p, log_q)[0, 0])
     
-    def estimar_theta_eap(self, respostas: List[int], itens: List[ItemTRI]) -> float:
+    def estimar_theta_eap(
+        self,
+        respostas: Iterable[int],
+        itens: Itens,
+        posterior: bool = False,
+        nivel: float = NIVEL_CREDIBILIDADE,
+    ) -> Union[float, Dict[str, float]]:
         """
         Estima θ usando Expected a Posteriori (EAP).
         
         θ_EAP = Σ(X_k * L_k * W_k) / Σ(L_k * W_k)
+
+        A verossimilhança dos 80 pontos sai da tabela pré-computada da prova
+        (ver ``_tabela``) em um único produto matriz-vetor. Com
+        ``cache_padroes`` ativo, padrões já vistos não são reestimados.
+
+        Args:
+            posterior: Se True, devolve também o desvio padrão e o intervalo
+                de credibilidade, calculados sobre a mesma posterior
+            nivel: Probabilidade do intervalo de credibilidade
+
+        Returns:
+            θ, ou, com ``posterior=True``, dict com 'theta', 'dp',
+            'theta_inf' e 'theta_sup'
         """
-        log_L = np.array([
-            self.log_verossimilhanca(theta_k, respostas, itens) 
-            for theta_k in self._pontos_quad
-        ])
-        
-        log_L_max = np.max(log_L)
-        L = np.exp(log_L - log_L_max)
-        
-        numerador = np.sum(self._pontos_quad * L * self._pesos_quad)
-        denominador = np.sum(L * self._pesos_quad)
-        
-        return numerador / denominador if denominador > 0 else 0.0
+        banco = como_banco(itens)
+        acertos = banco.canonico(np.asarray(respostas, dtype=float) == 1)
+        chave = self._chave_padrao(banco, acertos)
+        campo = ('posterior', nivel) if posterior else 'theta'
+        guardado = self._consultar_padrao(chave, campo)
+        if guardado is not None:
+            return dict(guardado) if posterior else guardado
 
-    def estimar_theta_eap_batch(
-        self,
-        respostas: Iterable[Iterable[int]],
-        itens: List[ItemTRI],
-        batch_size: int = 4096,
-    ) -> np.ndarray:
-        """Estima EAP em lotes pelo mesmo modelo do caminho escalar.
+        log_L = self._tabela(banco).log_verossimilhanca(acertos)
+        if not posterior:
+            theta = float(theta_eap(log_L, self._pontos_quad, self._pesos_quad)[0])
+            self._guardar_padrao(chave, 'theta', theta)
+            return theta
 
-        A matriz de respostas deve ter uma coluna por item. Itens anulados são
-        retirados antes da multiplicação matricial. O processamento em blocos
-        limita memória sem alterar o resultado matemático.
+        resumo = {
+            nome: float(valores[0])
+            for nome, valores in self._resumo_posterior(log_L, nivel).items()
+        }
+        self._guardar_padrao(chave, 'theta', resumo['theta'])
+        self._guardar_padrao(chave, campo, resumo)
+        return dict(resumo)
+
+    def _resumo_posterior(self, log_l: np.ndarray, nivel: float) -> Dict[str, np.ndarray]:
+        """θ, desvio padrão e limites do intervalo de credibilidade por linha."""
+        if not 0 < nivel < 1:
+            raise ValueError("nivel deve estar entre 0 e 1")
+        theta, dp, quantis = resumo_posterior(
+            log_l, self._pontos_quad, self._pesos_quad,
+            ((1 - nivel) / 2, (1 + nivel) / 2),
+        )
+        return {
+            'theta': theta,
+            'dp': dp,
+            'theta_inf': quantis[:, 0],
+            'theta_sup': quantis[:, 1],
+        }
+
+    def estimar_thetas_invertidos(
+        self, respostas: Iterable[int], itens: Itens
+    ) -> Tuple[float, np.ndarray]:
+        """
+        θ original e θ de cada cenário com um único item invertido.
+
+        Equivale a reestimar o EAP uma vez por item com o acerto trocado por
+        erro (ou o contrário), mas resolve os I cenários em uma operação
+        matricial I × K sobre o log L do padrão original.
+
+        Returns:
+            (theta, thetas_invertidos); ``thetas_invertidos[i]`` é o θ com o
+            item i invertido. Para itens anulados o valor é o próprio θ.
         """
-        matriz = np.asarray(respostas, dtype=float)
-        if matriz.ndim != 2 or matriz.shape[1] != len(itens):
+        banco = como_banco(itens)
+        acertos = banco.canonico(np.asarray(respostas, dtype=float) == 1)
+        chave = self._chave_padrao(banco, acertos)
+        guardado = self._consultar_padrao(chave, 'invertidos')
+        if guardado is not None:
+            theta, invertidos = guardado
+            return theta, banco.da_prova(invertidos)
+
+        tabela = self._tabela(banco)
+        log_l = tabela.log_verossimilhanca(acertos)[0]
+        theta = float(theta_eap(log_l, self._pontos_quad, self._pesos_quad)[0])
+        invertidos = theta_eap(
+            log_verossimilhanca_invertida(log_l, tabela.delta, acertos),
+            self._pontos_quad,
+            self._pesos_quad,
+        )
+        invertidos[banco.canonico(banco.abandonado)] = theta
+        invertidos.setflags(write=False)
+        self._guardar_padrao(chave, 'theta', theta)
+        self._guardar_padrao(chave, 'invertidos', (theta, invertidos))
+        # A indexação devolve uma cópia gravável, na ordem da prova.
+        return theta, banco.da_prova(invertidos)
+
+    @staticmethod
+    def _matriz_binaria(respostas: Iterable[Iterable[int]],
+                        banco: BancoItens) -> np.ndarray:
+        """Valida a matriz de acertos (N × itens da prova, só 0 e 1)."""
+        matriz = np.asarray(respostas)
+        if matriz.ndim != 2 or matriz.shape[1] != len(banco):
             raise ValueError(
                 "A matriz de respostas deve ser bidimensional e ter "
-                f"{len(itens)} colunas"
+                f"{len(banco)} colunas"
             )
         if not np.all((matriz == 0) | (matriz == 1)):
             raise ValueError("Respostas binárias devem conter somente 0 ou 1")
+        return matriz
+
+    def estimar_theta_eap_batch(
+        self,
+        respostas: Iterable[Iterable[int]],
+        itens: Itens,
+        batch_size: int = 4096,
+        posterior: bool = False,
+        nivel: float = NIVEL_CREDIBILIDADE,
+    ) -> Union[np.ndarray, Dict[str, np.ndarray]]:
+        """Estima EAP em lotes pelo mesmo modelo do caminho escalar.
+
+        A matriz de respostas deve ter uma coluna por item. Itens anulados
+        têm peso zero na tabela da prova. O processamento em blocos limita
+        memória sem alterar o resultado matemático; dentro de cada bloco,
+        padrões repetidos são estimados uma única vez.
+
+        Com ``posterior=True`` devolve um dict de arrays ('theta', 'dp',
+        'theta_inf', 'theta_sup'), como em ``estimar_theta_eap``.
+        """
+        banco = como_banco(itens)
+        matriz = banco.canonico(self._matriz_binaria(respostas, banco).astype(float))
         if batch_size <= 0:
             raise ValueError("batch_size deve ser positivo")
 
-        ativos = np.asarray([not item.abandonado for item in itens])
-        matriz = matriz[:, ativos]
-        itens_ativos = [item for item in itens if not item.abandonado]
-        if not itens_ativos:
-            return np.zeros(matriz.shape[0], dtype=float)
-
-        probabilidades = np.asarray([
-            [self.probabilidade_acerto(theta, item) for item in itens_ativos]
-            for theta in self._pontos_quad
-        ])
-        probabilidades = np.clip(probabilidades, 1e-15, 1 - 1e-15)
-        log_p = np.log(probabilidades)
-        log_q = np.log(1 - probabilidades)
-
-        resultado = np.empty(matriz.shape[0], dtype=float)
-        for inicio in range(0, matriz.shape[0], batch_size):
-            fim = min(inicio + batch_size, matriz.shape[0])
-            bloco = matriz[inicio:fim]
-            log_l = bloco @ log_p.T + (1 - bloco) @ log_q.T
-            log_l -= np.max(log_l, axis=1, keepdims=True)
-            posterior = np.exp(log_l) * self._pesos_quad
-            denominador = posterior.sum(axis=1)
-            numerador = posterior @ self._pontos_quad
-            resultado[inicio:fim] = np.divide(
-                numerador,
-                denominador,
-                out=np.zeros_like(numerador),
-                where=denominador > 0,
-            )
-        return resultado
+        if posterior and not 0 < nivel < 1:
+            raise ValueError("nivel deve estar entre 0 e 1")
+
+        campos = ('theta', 'dp', 'theta_inf', 'theta_sup') if posterior else ('theta',)
+        resultado = {nome: np.zeros(matriz.shape[0], dtype=float) for nome in campos}
+        if banco.n_ativos > 0:
+            tabela = self._tabela(banco)
+            ativos = banco.canonico(banco.ativos)
+            for inicio in range(0, matriz.shape[0], batch_size):
+                fim = min(inicio + batch_size, matriz.shape[0])
+                unicos, inversa = _padroes_unicos(matriz[inicio:fim], ativos)
+                log_l = tabela.log_verossimilhanca(unicos)
+                if posterior:
+                    bloco = self._resumo_posterior(log_l, nivel)
+                else:
+                    bloco = {'theta': theta_eap(
+                        log_l, self._pontos_quad, self._pesos_quad
+                    )}
+                for nome in campos:
+                    resultado[nome][inicio:fim] = bloco[nome][inversa]
+        return resultado if posterior else resultado['theta']
     
-    def converter_respostas(self, respostas_str: str, itens: List[ItemTRI]) -> List[int]:
+    def converter_respostas(self, respostas_str: str, itens: Itens) -> List[int]:
         """
         Converte string de respostas em vetor binário (1=acerto, 0=erro).
         
@@ -389,18 +731,7 @@ class CalculadorTRI:
         Nota: CO_POSICAO representa posição global na prova (ex: MT vai de 136-180),
         mas TX_RESPOSTAS_MT tem 45 caracteres indexados de 0-44.
         """
-        respostas = []
-        
-        for idx, item in enumerate(itens):
-            if idx >= len(respostas_str):
-                respostas.append(0)
-                continue
-            
-            resposta = respostas_str[idx].upper()
-            gabarito = item.gabarito.upper()
-            respostas.append(1 if resposta == gabarito else 0)
-        
-        return respostas
+        return como_banco(itens).acertos(respostas_str).tolist()
     
     def normalizar_respostas(self, respostas_str: str, area: str, ano: int,
                              tp_lingua: Optional[int] = None) -> str:
@@ -463,16 +794,60 @@ class CalculadorTRI:
         co_prova: int,
         respostas: Iterable[str],
         tp_lingua: Optional[int] = None,
-    ) -> Tuple[List[ItemTRI], np.ndarray]:
-        """Normaliza e converte um lote de respostas da mesma prova/idioma."""
+    ) -> Tuple[BancoItens, np.ndarray]:
+        """
+        Normaliza e converte um lote de respostas da mesma prova/idioma.
+
+        Levanta o mesmo erro de ``_preparar_calculo`` para a primeira linha
+        inválida; ``parear_respostas_batch`` devolve a máscara em vez disso.
+        """
+        respostas = list(respostas)
+        itens, matriz, erros = self.parear_respostas_batch(
+            ano, area, co_prova, respostas, tp_lingua
+        )
+        if erros.any():
+            self._preparar_calculo(
+                ano, area, co_prova, respostas[int(np.argmax(erros))], tp_lingua
+            )
+        return itens, matriz
+
+    def parear_respostas_batch(
+        self,
+        ano: int,
+        area: str,
+        co_prova: int,
+        respostas: Iterable[str],
+        tp_lingua: Optional[int] = None,
+    ) -> Tuple[BancoItens, np.ndarray, np.ndarray]:
+        """
+        Normaliza e pareia um lote sem interromper na primeira linha inválida.
+
+        Mesmas regras de ``_preparar_calculo``, aplicadas ao lote inteiro por
+        ``BancoItens.acertos_lote``.
+
+        Returns:
+            (itens, acertos, erros): matriz int8 N × itens (zerada nas linhas
+            com erro) e máscara (N,) das linhas inválidas (tipo, comprimento,
+            caractere ou padding LC)
+        """
         itens = self.carregar_itens(ano, area, co_prova, tp_lingua)
-        binarias = []
-        for resposta in respostas:
-            _, vetor, _ = self._preparar_calculo(
-                ano, area, co_prova, resposta, tp_lingua
+        respostas = list(respostas)
+        erros_normalizacao = np.zeros(len(respostas), dtype=bool)
+        for i, resposta in enumerate(respostas):
+            if not isinstance(resposta, str):
+                respostas[i] = ""
+                erros_normalizacao[i] = True
+        if area.upper() == 'LC':
+            from .tradutor import obter_config_lc, filtrar_respostas_lc_lote
+            # Mesmo padrão de normalizar_respostas (o idioma já foi exigido
+            # por carregar_itens nos anos que o registram).
+            respostas, erros_padding = filtrar_respostas_lc_lote(
+                respostas, tp_lingua if tp_lingua is not None else 0,
+                obter_config_lc(ano),
             )
-            binarias.append(vetor)
-        return itens, np.asarray(binarias, dtype=np.int8)
+            erros_normalizacao |= erros_padding
+        matriz, erros = itens.acertos_lote(respostas)
+        return itens, matriz, erros | erros_normalizacao
 
     def transformar_escala(self, theta: float, ano: int = None, area: str = None,
                           co_prova: int = None) -> float:
@@ -481,11 +856,22 @@ class CalculadorTRI:
         
         Usa a transformação validada por prova, com fallback por área.
         """
-        transformacao = obter_transformacao(ano or 2023, area or 'MT', co_prova)
-        return aplicar_transformacao(theta, transformacao)
+        return float(self._transformacao(ano, area, co_prova)(theta))
+
+    def transformar_escala_batch(self, thetas: Iterable[float], ano: int = None,
+                                 area: str = None, co_prova: int = None) -> np.ndarray:
+        """``transformar_escala`` aplicada a um array de θ (qualquer shape)."""
+        thetas = np.asarray(thetas, dtype=float)
+        return np.asarray(self._transformacao(ano, area, co_prova)(thetas))
+
+    def _transformacao(self, ano: int = None, area: str = None,
+                       co_prova: int = None) -> Transformacao:
+        """Transformação θ -> nota usada por ``transformar_escala``."""
+        return obter_transformacao(ano or 2023, area or 'MT', co_prova)
     
     def calcular_nota(self, ano: int, area: str, co_prova: int, 
-                     respostas_str: str, tp_lingua: Optional[int] = None) -> Dict:
+                     respostas_str: str, tp_lingua: Optional[int] = None,
+                     intervalo: bool = False) -> Dict:
         """
         Calcula a nota TRI completa.
         
@@ -495,6 +881,9 @@ class CalculadorTRI:
             co_prova: Código da prova
             respostas_str: String com as respostas
             tp_lingua: Para LC: 0=inglês, 1=espanhol
+            intervalo: Acrescenta ``dp_theta`` (desvio padrão a posteriori de
+                θ) e ``nota_inf``/``nota_sup`` (intervalo de credibilidade
+                ``NIVEL_CREDIBILIDADE`` já na escala ENEM).
             
         Returns:
             Dicionário com resultado completo
@@ -503,22 +892,34 @@ class CalculadorTRI:
             ano, area, co_prova, respostas_str, tp_lingua
         )
 
-        itens_validos = [i for i in itens if not i.abandonado]
-        respostas_validas = [r for r, i in zip(respostas_bin, itens) if not i.abandonado]
+        acertos = np.asarray(respostas_bin)[itens.ativos]
 
-        theta = self.estimar_theta_eap(respostas_bin, itens)
-        nota = self.transformar_escala(theta, ano, area, co_prova)
+        if not intervalo:
+            theta = self.estimar_theta_eap(respostas_bin, itens)
+            nota = self.transformar_escala(theta, ano, area, co_prova)
+        else:
+            resumo = self.estimar_theta_eap(respostas_bin, itens, posterior=True)
+            theta = resumo['theta']
+            nota, nota_inf, nota_sup = self.transformar_escala_batch(
+                [theta, resumo['theta_inf'], resumo['theta_sup']],
+                ano, area, co_prova,
+            ).tolist()
         
-        return {
+        resultado = {
             'ano': ano,
             'area': area,
             'co_prova': co_prova,
-            'total_itens': len(itens_validos),
-            'acertos': sum(respostas_validas),
+            'total_itens': itens.n_ativos,
+            'acertos': int(acertos.sum()),
             'theta': theta,
             'nota': nota,
             'tp_lingua': tp_lingua,
         }
+        if intervalo:
+            resultado.update(
+                dp_theta=resumo['dp'], nota_inf=nota_inf, nota_sup=nota_sup
+            )
+        return resultado
     
     def analisar_impacto_erros(self, ano: int, area: str, co_prova: int,
                                respostas_str: str, tp_lingua: Optional[int] = None) -> List[Dict]:
@@ -563,23 +964,26 @@ class CalculadorTRI:
             ano, area, co_prova, respostas_str, tp_lingua
         )
 
-        theta_original = self.estimar_theta_eap(respostas_bin, itens)
-        nota_original = self.transformar_escala(theta_original, ano, area, co_prova)
+        # Todos os cenários "e se eu invertesse esta questão" de uma vez.
+        theta_original, thetas_mod = self.estimar_thetas_invertidos(
+            respostas_bin, itens
+        )
+        # Uma única conversão vetorizada: θ original seguido dos invertidos.
+        posicoes = np.flatnonzero(itens.ativos)
+        notas = self.transformar_escala_batch(
+            np.concatenate(([theta_original], thetas_mod[posicoes])),
+            ano, area, co_prova,
+        ).tolist()
+        nota_original = notas[0]
 
         acertos = []
         erros = []
 
-        for idx, (resp, item) in enumerate(zip(respostas_bin, itens)):
-            if item.abandonado:
-                continue
-
+        # nota_mod: cenário oposto (acerto vira erro e erro vira acerto)
+        for idx, nota_mod in zip(posicoes.tolist(), notas[1:]):
+            resp = respostas_bin[idx]
+            item = itens[idx]
             resposta_dada = respostas_norm[idx] if idx < len(respostas_norm) else '?'
-
-            # Simular o cenário oposto
-            respostas_mod = respostas_bin.copy()
-            respostas_mod[idx] = 1 - resp  # Inverter acerto/erro
-            theta_mod = self.estimar_theta_eap(respostas_mod, itens)
-            nota_mod = self.transformar_escala(theta_mod, ano, area, co_prova)
             
             questao = {
                 'posicao': item.posicao,  # Posição original no microdado
@@ -613,3 +1017,78 @@ class CalculadorTRI:
             'acertos': acertos,
             'erros': erros,
         }
+
+    def analisar_todas_questoes_batch(
+        self,
+        ano: int,
+        area: str,
+        co_prova: int,
+        respostas: Iterable[Iterable[int]],
+        tp_lingua: Optional[int] = None,
+        memoria_mb: float = 256.0,
+    ) -> Dict[str, np.ndarray]:
+        """
+        Impacto de inverter cada questão para muitos participantes da prova.
+
+        Versão em lote de `analisar_todas_questoes`: recebe a matriz binária
+        de acertos (N × 45, como ``preparar_respostas_batch``) e resolve os
+        N × 45 cenários de inversão por atualização de posto um, em blocos.
+
+        Args:
+            ano, area, co_prova, tp_lingua: Identificam a prova, como em
+                `calcular_nota`
+            respostas: Matriz N × itens com 1=acerto e 0=erro
+            memoria_mb: Orçamento aproximado do tensor temporário
+                (participantes × itens × pontos de quadratura) de cada bloco.
+                Define o tamanho do bloco; não altera o resultado.
+
+        Returns:
+            Dict com 'theta' e 'nota' (N,) do padrão original e 'delta_nota'
+            (N × itens): nota com a questão invertida menos a nota original.
+            Positivo para erros (ganho se acertasse), negativo para acertos
+            (perda se errasse) e zero para itens anulados.
+        """
+        if memoria_mb <= 0:
+            raise ValueError("memoria_mb deve ser positivo")
+        banco = self.carregar_itens(ano, area, co_prova, tp_lingua)
+        matriz = banco.canonico(self._matriz_binaria(respostas, banco))
+        ativos = banco.canonico(banco.ativos)
+        tabela = self._tabela(banco)
+
+        def notas(thetas: np.ndarray) -> np.ndarray:
+            return self.transformar_escala_batch(thetas, ano, area, co_prova)
+
+        n, n_itens = matriz.shape
+        # O tensor do bloco e seus temporários (exp, posterior) somam cerca de
+        # quatro arrays float64 de blocos × itens × pontos.
+        bytes_por_linha = 4 * n_itens * self.N_QUADRATURA * 8
+        bloco_max = max(1, int(memoria_mb * 2**20 // bytes_por_linha))
+
+        thetas = np.empty(n, dtype=float)
+        notas_base = np.empty(n, dtype=float)
+        delta_nota = np.zeros((n, n_itens), dtype=float)
+        for inicio in range(0, n, bloco_max):
+            fim = min(inicio + bloco_max, n)
+            unicos, inversa = _padroes_unicos(matriz[inicio:fim], ativos)
+            unicos = unicos.astype(float)
+            log_l = tabela.log_verossimilhanca(unicos)
+            theta_unicos = theta_eap(log_l, self._pontos_quad, self._pesos_quad)
+            invertidos = theta_eap(
+                log_verossimilhanca_invertida(log_l, tabela.delta, unicos),
+                self._pontos_quad,
+                self._pesos_quad,
+            )
+            nota_unicos = notas(theta_unicos)
+            thetas[inicio:fim] = theta_unicos[inversa]
+            notas_base[inicio:fim] = nota_unicos[inversa]
+            delta_nota[inicio:fim] = (
+                notas(invertidos) - nota_unicos[:, None]
+            )[inversa]
+        delta_nota = banco.da_prova(delta_nota)
+        delta_nota[:, banco.abandonado] = 0.0
+
+        return {
+            'theta': thetas,
+            'nota': notas_base,
+            'delta_nota': delta_nota,
+        }
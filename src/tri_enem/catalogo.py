@@ -0,0 +1,316 @@
+# SPDX-License-Identifier: PolyForm-Noncommercial-1.0.0
+# Copyright (c) 2026 Henrique Lindemann
+"""Carregamento único e preguiçoso de ``coeficientes_data.json``.
+
+O catálogo é lido na primeira consulta, não na importação, e o resultado é
+compartilhado por ``coeficientes`` e ``precisao``. Três visões:
+
+- seção quente: só o necessário para ``obter_transformacao`` (slope,
+  intercept e transformação por prova, coeficientes por área e metadados);
+- seção de validação: as métricas usadas por ``verificar_precisao_prova``;
+- seção fria: o catálogo completo (``obter_catalogo``).
+
+Quando existe ``coeficientes_data.bin`` ao lado do JSON (gerado por
+``escrever_catalogo_binario`` na publicação) e o sha256 gravado nele confere
+com o JSON, as seções quente e de validação vêm do binário: nós e
+coeficientes em arrays mapeados em memória e métricas decodificadas por prova
+sob demanda. O JSON completo só é lido para ``secao_fria``.
+
+A chave do cache inclui ``mtime`` e tamanho dos arquivos, de modo que a
+substituição atômica do catálogo é percebida sem reiniciar o processo.
+Os objetos devolvidos são compartilhados: trate-os como somente leitura.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from collections.abc import Mapping
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, Optional
+
+# numpy e o contêiner binário só são importados ao ler ou gravar o binário:
+# consultar a validação a partir do JSON não depende deles.
+if TYPE_CHECKING:
+    import numpy as np
+
+DATA_FILE = Path(__file__).parent / "coeficientes_data.json"
+
+CAMPOS_QUENTES = ("slope", "intercept", "transformacao")
+FORMATO_BINARIO = "catalogo-v1"
+# Códigos de ``tipo`` no binário; 0 marca prova sem transformação própria.
+TIPOS_BINARIO = (None, "linear", "monotonica_linear")
+
+
+def caminho_binario(caminho_json: Path) -> Path:
+    """Catálogo binário correspondente a um ``coeficientes_data.json``."""
+    return Path(caminho_json).with_suffix(".bin")
+
+
+def _sha256(caminho: Path) -> str:
+    return hashlib.sha256(Path(caminho).read_bytes()).hexdigest()
+
+
+@lru_cache(maxsize=8)
+def _ler_json(
+    caminho: str, mtime_ns: int, tamanho: int
+) -> Optional[Dict[str, Any]]:
+    del mtime_ns, tamanho  # Fazem parte da chave e invalidam após substituição.
+    try:
+        data = json.loads(Path(caminho).read_text(encoding="utf-8"))
+    except (OSError, ValueError, TypeError):
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def _chave(caminho: Optional[Path]) -> Optional[tuple]:
+    caminho = Path(caminho or DATA_FILE)
+    try:
+        stat = caminho.stat()
+    except OSError:
+        return None
+    return str(caminho.resolve()), stat.st_mtime_ns, stat.st_size
+
+
+class _Provas(Mapping):
+    """Mapeamento ``"ano,area,prova"`` -> dict decodificado do binário."""
+
+    def __init__(
+        self, indices: Dict[str, int], decodificar: Callable[[int], Dict[str, Any]]
+    ) -> None:
+        self._indices = indices
+        self._decodificar = decodificar
+
+    def __getitem__(self, chave: str) -> Dict[str, Any]:
+        return self._decodificar(self._indices[chave])
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._indices)
+
+    def __len__(self) -> int:
+        return len(self._indices)
+
+
+class _CatalogoBinario:
+    """Seções quente e de validação servidas a partir do pacote mapeado."""
+
+    def __init__(self, cabecalho: Dict[str, Any], arrays: Dict[str, np.ndarray]):
+        self.cabecalho = cabecalho
+        self.arrays = arrays
+        chaves = cabecalho["chaves"]
+        tipo = arrays["tipo"]
+        if len(chaves) != len(tipo):
+            raise ValueError("índice do catálogo binário inconsistente")
+        self.indices = {chave: i for i, chave in enumerate(chaves)}
+        self.indices_quentes = {
+            chave: i for chave, i in self.indices.items() if tipo[i]
+        }
+
+    def _quente(self, i: int) -> Dict[str, Any]:
+        a = self.arrays
+        tipo = TIPOS_BINARIO[a["tipo"][i]]
+        slope, intercept = float(a["slope"][i]), float(a["intercept"][i])
+        transformacao = {"tipo": tipo, "slope": slope, "intercept": intercept}
+        if tipo == "monotonica_linear":
+            nos = slice(int(a["inicio_nos"][i]), int(a["inicio_nos"][i + 1]))
+            transformacao["theta_knots"] = a["theta_nos"][nos]
+            transformacao["score_knots"] = a["nota_nos"][nos]
+        return {"slope": slope, "intercept": intercept, "transformacao": transformacao}
+
+    def _validacao(self, i: int) -> Optional[Dict[str, Any]]:
+        inicio = self.arrays["inicio_validacao"]
+        bruto = self.arrays["validacao"][int(inicio[i]):int(inicio[i + 1])]
+        return json.loads(bruto.tobytes().decode("utf-8"))
+
+    def quente(self) -> Dict[str, Any]:
+        return {
+            "por_prova": _Provas(self.indices_quentes, self._quente),
+            "por_area": self.cabecalho["por_area"],
+            "metadata": self.cabecalho["metadata"],
+        }
+
+    def validacao(self) -> Dict[str, Any]:
+        return {
+            "schema_version": self.cabecalho["schema_version"],
+            "por_prova": _Provas(self.indices, self._validacao),
+        }
+
+
+def escrever_catalogo_binario(
+    caminho_json: Path, destino: Optional[Path] = None
+) -> Path:
+    """Gera o catálogo binário de ``caminho_json``, ligado a ele por sha256.
+
+    As transformações são gravadas já normalizadas (mesmo resultado de
+    ``obter_transformacao``); métricas de validação ficam como JSON compacto
+    por prova. Levanta ``ValueError`` se o JSON não for um catálogo.
+    """
+    import numpy as np
+
+    from .binario import escrever_pacote
+    from .coeficientes import _normalizar_transformacao
+
+    caminho_json = Path(caminho_json)
+    destino = Path(destino or caminho_binario(caminho_json))
+    data = json.loads(caminho_json.read_text(encoding="utf-8"))
+    if not isinstance(data, dict) or not isinstance(data.get("por_prova"), dict):
+        raise ValueError(f"catálogo inválido: {caminho_json}")
+
+    chaves = sorted(data["por_prova"])
+    tipo = np.zeros(len(chaves), dtype=np.int8)
+    slope = np.zeros(len(chaves))
+    intercept = np.zeros(len(chaves))
+    inicio_nos = [0]
+    theta_nos, nota_nos = [], []
+    inicio_validacao = [0]
+    validacao = []
+    for i, chave in enumerate(chaves):
+        bruta = data["por_prova"][chave]
+        info = bruta if isinstance(bruta, dict) else {}
+        if info.get("slope") is not None:
+            transformacao = _normalizar_transformacao(info, "prova")
+            tipo[i] = TIPOS_BINARIO.index(transformacao["tipo"])
+            slope[i] = transformacao["slope"]
+            intercept[i] = transformacao["intercept"]
+            theta_nos.extend(transformacao.get("theta_knots", ()))
+            nota_nos.extend(transformacao.get("score_knots", ()))
+        inicio_nos.append(len(theta_nos))
+
+        # Entrada que não é dict vira null: a validação responde igual ao JSON.
+        frio = None
+        if isinstance(bruta, dict):
+            frio = {
+                campo: info[campo]
+                for campo in ("qualidade", "validacao") if campo in info
+            }
+            if "transformacao" in info:
+                modelo = info["transformacao"]
+                frio["transformacao"] = (
+                    {"tipo": modelo.get("tipo")} if isinstance(modelo, dict) else modelo
+                )
+        bruto = json.dumps(
+            frio, ensure_ascii=False, allow_nan=False, separators=(",", ":")
+        ).encode("utf-8")
+        validacao.append(bruto)
+        inicio_validacao.append(inicio_validacao[-1] + len(bruto))
+
+    escrever_pacote(
+        destino,
+        {
+            "formato": FORMATO_BINARIO,
+            "sha256_json": _sha256(caminho_json),
+            "schema_version": data.get("schema_version"),
+            "chaves": chaves,
+            "por_area": data.get("por_area") or {},
+            "metadata": data.get("metadata") or {},
+        },
+        {
+            "tipo": tipo,
+            "slope": slope,
+            "intercept": intercept,
+            "inicio_nos": np.asarray(inicio_nos, dtype=np.int64),
+            "theta_nos": np.asarray(theta_nos, dtype=float),
+            "nota_nos": np.asarray(nota_nos, dtype=float),
+            "inicio_validacao": np.asarray(inicio_validacao, dtype=np.int64),
+            "validacao": np.frombuffer(b"".join(validacao), dtype=np.uint8),
+        },
+    )
+    return destino
+
+
+@lru_cache(maxsize=8)
+def _ler_binario(
+    caminho_json: str, mtime_ns: int, tamanho: int, chave_binario: tuple
+) -> Optional[_CatalogoBinario]:
+    del mtime_ns, tamanho, chave_binario  # Só invalidam o cache.
+    from .binario import ler_pacote
+
+    try:
+        cabecalho, arrays = ler_pacote(caminho_binario(caminho_json))
+        if (
+            cabecalho.get("formato") != FORMATO_BINARIO
+            or cabecalho.get("sha256_json") != _sha256(caminho_json)
+        ):
+            return None
+        return _CatalogoBinario(cabecalho, arrays)
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _binario(caminho: Optional[Path]) -> Optional[_CatalogoBinario]:
+    chave = _chave(caminho)
+    if chave is None:
+        return None
+    chave_binario = _chave(caminho_binario(chave[0]))
+    if chave_binario is None:
+        return None
+    return _ler_binario(*chave, chave_binario)
+
+
+def chave_catalogo(caminho: Optional[Path] = None) -> tuple:
+    """Caminho, mtime e tamanho do JSON e do binário do catálogo.
+
+    Muda quando qualquer um dos arquivos é substituído. Quem deriva dados das
+    seções e os guarda em cache deve incluí-la na chave do cache. Só faz
+    ``stat`` (sem ``resolve``): é consultada a cada transformação.
+    """
+    caminho = str(caminho or DATA_FILE)
+    chaves = []
+    for arquivo in (caminho, os.path.splitext(caminho)[0] + ".bin"):
+        try:
+            stat = os.stat(arquivo)
+        except OSError:
+            chaves.append(None)
+        else:
+            chaves.append((arquivo, stat.st_mtime_ns, stat.st_size))
+    return tuple(chaves)
+
+
+def secao_fria(caminho: Optional[Path] = None) -> Optional[Dict[str, Any]]:
+    """Catálogo completo, ou ``None`` se ausente ou ilegível."""
+    chave = _chave(caminho)
+    return None if chave is None else _ler_json(*chave)
+
+
+@lru_cache(maxsize=8)
+def _secao_quente(
+    caminho: str, mtime_ns: int, tamanho: int
+) -> Dict[str, Any]:
+    data = _ler_json(caminho, mtime_ns, tamanho) or {}
+    por_prova = data.get("por_prova")
+    quente = {}
+    if isinstance(por_prova, dict):
+        for chave, info in por_prova.items():
+            if isinstance(info, dict):
+                quente[chave] = {
+                    campo: info[campo] for campo in CAMPOS_QUENTES if campo in info
+                }
+    return {
+        "por_prova": quente,
+        "por_area": data.get("por_area") or {},
+        "metadata": data.get("metadata") or {},
+    }
+
+
+def secao_validacao(caminho: Optional[Path] = None) -> Optional[Dict[str, Any]]:
+    """``schema_version`` e, por prova, qualidade, validação e tipo do modelo.
+
+    Vem do binário quando válido; senão, do catálogo completo.
+    """
+    binario = _binario(caminho)
+    if binario is not None:
+        return binario.validacao()
+    return secao_fria(caminho)
+
+
+def secao_quente(caminho: Optional[Path] = None) -> Dict[str, Any]:
+    """Transformações por prova e coeficientes por área; vazio se indisponível."""
+    binario = _binario(caminho)
+    if binario is not None:
+        return binario.quente()
+    chave = _chave(caminho)
+    if chave is None:
+        return {"por_prova": {}, "por_area": {}, "metadata": {}}
+    return _secao_quente(*chave)
@@ -3,19 +3,21 @@
 """Transformações da escala latente para a escala de notas do ENEM.
 
 O catálogo v3 aceita uma transformação afim ou uma transformação monotônica
-linear por partes.
+linear por partes. O catálogo só é lido na primeira consulta (ver
+``catalogo``). ``obter_transformacao`` devolve uma ``Transformacao``
+compilada e compartilhada por prova: continua sendo o dicionário do contrato,
+mas também é chamável sobre escalares ou arrays de θ.
 """
 
 from __future__ import annotations
 
-import json
 from copy import deepcopy
-from pathlib import Path
-from typing import Any, Dict, Tuple
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple, Union
 
 import numpy as np
 
-_DATA_FILE = Path(__file__).parent / "coeficientes_data.json"
+from .catalogo import chave_catalogo, secao_fria, secao_quente
 
 _PADRAO_EMERGENCIA = {
     "MT": (129.63, 500.0),
@@ -25,27 +27,73 @@ _PADRAO_EMERGENCIA = {
 }
 
 
-def _carregar_catalogo() -> Dict[str, Any]:
-    try:
-        data = json.loads(_DATA_FILE.read_text(encoding="utf-8"))
-        return data if isinstance(data, dict) else {}
-    except (OSError, ValueError, TypeError):
-        return {}
+class Transformacao(dict):
+    """Transformação θ -> nota já compilada.
+
+    É o próprio dicionário do contrato (``tipo``, ``slope``, ``intercept``,
+    ``origem`` e, na monotônica, os nós), com os nós convertidos para arrays
+    e as inclinações de extrapolação calculadas uma única vez. Instâncias
+    devolvidas por ``obter_transformacao`` são compartilhadas pelo processo,
+    por isso são somente leitura: alterá-las levanta ``TypeError`` (use
+    ``dict(t)`` para uma cópia editável).
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.monotonica = self.get("tipo") == "monotonica_linear"
+        if not self.monotonica:
+            self._slope = float(self["slope"])
+            self._intercept = float(self["intercept"])
+            return
+        xs = np.asarray(self["theta_knots"], dtype=float)
+        ys = np.asarray(self["score_knots"], dtype=float)
+        self._xs, self._ys = xs, ys
+        self._inclinacao_esq = max(0.0, float((ys[1] - ys[0]) / (xs[1] - xs[0])))
+        self._inclinacao_dir = max(
+            0.0, float((ys[-1] - ys[-2]) / (xs[-1] - xs[-2]))
+        )
+
+    def __call__(self, theta: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+        """Nota para θ escalar (``float``) ou array (mesmo shape)."""
+        x = np.asarray(theta, dtype=float)
+        if not self.monotonica:
+            nota = self._slope * x + self._intercept
+        else:
+            xs, ys = self._xs, self._ys
+            nota = np.interp(x, xs, ys)
+            # Fora dos nós, prolonga o primeiro/último segmento (nunca
+            # decrescente) em vez de saturar como ``np.interp``.
+            nota = np.where(
+                x < xs[0], ys[0] + self._inclinacao_esq * (x - xs[0]), nota
+            )
+            nota = np.where(
+                x > xs[-1], ys[-1] + self._inclinacao_dir * (x - xs[-1]), nota
+            )
+        return float(nota) if nota.ndim == 0 else nota
+
+    def _somente_leitura(self, *args: Any, **kwargs: Any) -> None:
+        raise TypeError(
+            "Transformacao é somente leitura; use dict(t) para uma cópia editável"
+        )
 
+    __setitem__ = __delitem__ = __ior__ = _somente_leitura
+    update = pop = popitem = setdefault = clear = _somente_leitura
 
-_DATA = _carregar_catalogo()
+    def __reduce__(self):
+        # copy e pickle reconstroem pelo construtor, não item a item.
+        return type(self), (dict(self),)
 
 
-def _linear(slope: float, intercept: float, origem: str) -> Dict[str, Any]:
-    return {
-        "tipo": "linear",
-        "slope": float(slope),
-        "intercept": float(intercept),
-        "origem": origem,
-    }
+def _linear(slope: float, intercept: float, origem: str) -> Transformacao:
+    return Transformacao(
+        tipo="linear",
+        slope=float(slope),
+        intercept=float(intercept),
+        origem=origem,
+    )
 
 
-def _normalizar_transformacao(info: Dict[str, Any], origem: str) -> Dict[str, Any]:
+def _normalizar_transformacao(info: Dict[str, Any], origem: str) -> Transformacao:
     """Valida a transformação e a converte para o contrato usado pelo motor."""
     slope = float(info.get("slope", 100.0))
     intercept = float(info.get("intercept", 500.0))
@@ -82,19 +130,21 @@ def _normalizar_transformacao(info: Dict[str, Any], origem: str) -> Dict[str, An
     if not valida:
         return _linear(slope, intercept, origem)
 
-    return {
-        "tipo": "monotonica_linear",
-        "slope": slope,
-        "intercept": intercept,
-        "theta_knots": theta.tolist(),
-        "score_knots": notas.tolist(),
-        "origem": origem,
-    }
+    return Transformacao(
+        tipo="monotonica_linear",
+        slope=slope,
+        intercept=intercept,
+        theta_knots=theta.tolist(),
+        score_knots=notas.tolist(),
+        origem=origem,
+    )
 
 
-def _coeficientes_area() -> Dict[Tuple[int, str], Tuple[float, float]]:
+@lru_cache(maxsize=1)
+def _coeficientes_area(versao: tuple) -> Dict[Tuple[int, str], Tuple[float, float]]:
+    del versao  # Só invalida o cache; ver chave_catalogo.
     resultado: Dict[Tuple[int, str], Tuple[float, float]] = {}
-    for key, value in _DATA.get("por_area", {}).items():
+    for key, value in secao_quente()["por_area"].items():
         try:
             ano, area = key.split(",")
             resultado[(int(ano), area.upper())] = (
@@ -106,9 +156,11 @@ def _coeficientes_area() -> Dict[Tuple[int, str], Tuple[float, float]]:
     return resultado
 
 
-def _coeficientes_padrao() -> Dict[str, Tuple[float, float]]:
+@lru_cache(maxsize=1)
+def _coeficientes_padrao(versao: tuple) -> Dict[str, Tuple[float, float]]:
+    del versao  # Só invalida o cache; ver chave_catalogo.
     resultado = dict(_PADRAO_EMERGENCIA)
-    for area, meta in _DATA.get("metadata", {}).items():
+    for area, meta in secao_quente()["metadata"].items():
         if not isinstance(meta, dict):
             continue
         try:
@@ -121,52 +173,55 @@ def _coeficientes_padrao() -> Dict[str, Tuple[float, float]]:
     return resultado
 
 
-_COEF_POR_AREA = _coeficientes_area()
-_COEF_PADRAO = _coeficientes_padrao()
-
-
 def obter_transformacao(
     ano: int, area: str, co_prova: int | None = None
-) -> Dict[str, Any]:
-    """Obtém a melhor transformação disponível, com origem explícita."""
-    ano = int(ano)
-    area = area.upper()
+) -> Transformacao:
+    """Obtém a melhor transformação disponível, com origem explícita.
+
+    A transformação é compilada uma vez por (ano, área, prova) e versão do
+    catálogo (ver ``chave_catalogo``), e reutilizada até o catálogo mudar.
+    """
+    return _transformacao_compilada(
+        int(ano), area.upper(), None if co_prova is None else int(co_prova),
+        chave_catalogo(),
+    )
 
+
+# Cobre todas as provas e áreas do catálogo com folga.
+@lru_cache(maxsize=4096)
+def _transformacao_compilada(
+    ano: int, area: str, co_prova: Optional[int], versao: tuple
+) -> Transformacao:
     if co_prova is not None:
-        key = f"{ano},{area},{int(co_prova)}"
-        info = _DATA.get("por_prova", {}).get(key)
+        key = f"{ano},{area},{co_prova}"
+        info = secao_quente()["por_prova"].get(key)
         if isinstance(info, dict) and info.get("slope") is not None:
             return _normalizar_transformacao(info, "prova")
 
-    coef_area = _COEF_POR_AREA.get((ano, area))
+    coef_area = _coeficientes_area(versao).get((ano, area))
     if coef_area is not None:
         return _linear(*coef_area, origem="area_ano")
 
-    return _linear(*_COEF_PADRAO.get(area, (100.0, 500.0)), origem="area_padrao")
-
+    return _linear(
+        *_coeficientes_padrao(versao).get(area, (100.0, 500.0)),
+        origem="area_padrao",
+    )
 
-def aplicar_transformacao(theta: float, transformacao: Dict[str, Any]) -> float:
-    """Aplica transformação linear ou monotônica, incluindo extrapolação."""
-    theta = float(theta)
-    if transformacao.get("tipo") != "monotonica_linear":
-        return (
-            float(transformacao["slope"]) * theta
-            + float(transformacao["intercept"])
-        )
 
-    xs = np.asarray(transformacao["theta_knots"], dtype=float)
-    ys = np.asarray(transformacao["score_knots"], dtype=float)
-    nota = float(np.interp(theta, xs, ys))
+def aplicar_transformacao(
+    theta: Union[float, np.ndarray], transformacao: Dict[str, Any]
+) -> Union[float, np.ndarray]:
+    """Aplica transformação linear ou monotônica, incluindo extrapolação.
 
-    if theta < xs[0]:
-        slope = max(0.0, float((ys[1] - ys[0]) / (xs[1] - xs[0])))
-        nota = float(ys[0] + slope * (theta - xs[0]))
-    elif theta > xs[-1]:
-        slope = max(0.0, float((ys[-1] - ys[-2]) / (xs[-1] - xs[-2])))
-        nota = float(ys[-1] + slope * (theta - xs[-1]))
-    return nota
+    Aceita θ escalar (devolve ``float``) ou array. Dicionários simples são
+    compilados a cada chamada; prefira a ``Transformacao`` de
+    ``obter_transformacao``.
+    """
+    if not isinstance(transformacao, Transformacao):
+        transformacao = Transformacao(transformacao)
+    return transformacao(theta)
 
 
 def obter_catalogo() -> Dict[str, Any]:
     """Retorna uma cópia defensiva do catálogo carregado."""
-    return deepcopy(_DATA)
+    return deepcopy(secao_fria() or {})
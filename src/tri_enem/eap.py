@@ -0,0 +1,314 @@
+# SPDX-License-Identifier: PolyForm-Noncommercial-1.0.0
+# Copyright (c) 2026 Henrique Lindemann
+"""
+Núcleo numérico do ML3 + EAP sobre a grade de quadratura.
+
+As funções deste módulo operam sobre arrays e não conhecem provas, caches ou
+transformações de escala; ``CalculadorTRI`` as compõe. Todo caminho de
+estimação (escalar, em lote, análise por questão) passa por
+``log_probabilidades_ml3`` e ``theta_eap``, para que as guardas numéricas
+existam em um único lugar.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+# Limite do expoente logístico: acima dele P=1, abaixo P=c (sem overflow).
+LIMITE_EXPOENTE = 700.0
+# P é limitado a [EPS, 1-EPS] antes do log, como no caminho escalar original.
+EPS_PROBABILIDADE = 1e-15
+
+
+def log_probabilidades_ml3(
+    theta: np.ndarray,
+    param_a: np.ndarray,
+    param_b: np.ndarray,
+    param_c: np.ndarray,
+    d: float = 1.0,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    log P(u=1|θ) e log P(u=0|θ) de todos os itens em todos os pontos.
+
+    Args:
+        theta: pontos da grade, shape (K,)
+        param_a, param_b, param_c: parâmetros dos itens, shape (I,)
+        d: fator de escala D
+
+    Returns:
+        (log_p, log_q), cada um com shape (K, I)
+    """
+    theta = np.asarray(theta, dtype=float).reshape(-1, 1)
+    param_a = np.asarray(param_a, dtype=float)
+    param_b = np.asarray(param_b, dtype=float)
+    param_c = np.asarray(param_c, dtype=float)
+
+    exp_arg = d * param_a * (theta - param_b)
+    limitado = np.clip(exp_arg, -LIMITE_EXPOENTE, LIMITE_EXPOENTE)
+    p = param_c + (1 - param_c) / (1 + np.exp(-limitado))
+    p = np.where(exp_arg < -LIMITE_EXPOENTE, param_c, p)
+    p = np.where(exp_arg > LIMITE_EXPOENTE, 1.0, p)
+    p = np.clip(p, EPS_PROBABILIDADE, 1 - EPS_PROBABILIDADE)
+    return np.log(p), np.log(1 - p)
+
+
+def log_verossimilhancas(
+    acertos: np.ndarray, log_p: np.ndarray, log_q: np.ndarray
+) -> np.ndarray:
+    """
+    log L de cada padrão em cada ponto da grade.
+
+    Args:
+        acertos: matriz (N, I) de 0/1, só com itens ativos
+        log_p, log_q: tabelas (K, I) de ``log_probabilidades_ml3``
+
+    Returns:
+        Matriz (N, K)
+    """
+    acertos = np.asarray(acertos, dtype=float)
+    return acertos @ log_p.T + (1 - acertos) @ log_q.T
+
+
+def _posterior(log_l: np.ndarray, pesos: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Posterior não normalizada (L·W reescalada pelo máximo) e sua soma."""
+    log_l = np.atleast_2d(log_l)
+    log_l = log_l - np.max(log_l, axis=-1, keepdims=True)
+    posterior = np.exp(log_l) * pesos
+    return posterior, posterior.sum(axis=-1)
+
+
+def _razao(numerador: np.ndarray, denominador: np.ndarray) -> np.ndarray:
+    return np.divide(
+        numerador,
+        denominador,
+        out=np.zeros_like(numerador),
+        where=denominador > 0,
+    )
+
+
+def theta_eap(
+    log_l: np.ndarray, pontos: np.ndarray, pesos: np.ndarray
+) -> np.ndarray:
+    """
+    θ_EAP = Σ(X_k · L_k · W_k) / Σ(L_k · W_k) ao longo do último eixo.
+
+    A verossimilhança é reescalada pelo máximo da linha antes da exponencial;
+    linhas com denominador nulo recebem θ = 0. Um vetor (K,) é tratado como
+    uma matriz de uma linha.
+    """
+    posterior, denominador = _posterior(log_l, pesos)
+    return _razao(posterior @ pontos, denominador)
+
+
+def resumo_posterior(
+    log_l: np.ndarray,
+    pontos: np.ndarray,
+    pesos: np.ndarray,
+    probabilidades: Tuple[float, ...] = (0.025, 0.975),
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    θ_EAP, desvio padrão e quantis a posteriori a partir da mesma posterior.
+
+    O θ é calculado exatamente como em ``theta_eap``. Para os quantis, a
+    massa de cada ponto da grade é espalhada uniformemente na célula entre os
+    pontos médios vizinhos, e a distribuição acumulada é interpolada nas
+    bordas das células. Linhas com denominador nulo recebem zeros.
+
+    Returns:
+        (theta, dp, quantis), com shapes (N,), (N,) e (N, len(probabilidades))
+    """
+    posterior, denominador = _posterior(log_l, pesos)
+    theta = _razao(posterior @ pontos, denominador)
+    desvio = pontos - theta[..., None]
+    variancia = _razao((posterior * desvio**2).sum(axis=-1), denominador)
+    dp = np.sqrt(np.maximum(variancia, 0.0))
+
+    bordas = np.concatenate([
+        [pontos[0] - (pontos[1] - pontos[0]) / 2],
+        (pontos[1:] + pontos[:-1]) / 2,
+        [pontos[-1] + (pontos[-1] - pontos[-2]) / 2],
+    ])
+    acumulada = _razao(np.cumsum(posterior, axis=-1), denominador[..., None])
+    acumulada = np.concatenate(
+        [np.zeros(acumulada.shape[:-1] + (1,)), acumulada], axis=-1
+    )
+    quantis = np.zeros(theta.shape + (len(probabilidades),))
+    for j, probabilidade in enumerate(probabilidades):
+        # Célula que contém o quantil: primeira borda com acumulada >= p.
+        fim = np.clip((acumulada < probabilidade).sum(axis=-1), 1, len(pontos))
+        massa_fim = np.take_along_axis(acumulada, fim[..., None], -1)[..., 0]
+        massa_inicio = np.take_along_axis(acumulada, fim[..., None] - 1, -1)[..., 0]
+        fracao = _razao(probabilidade - massa_inicio, massa_fim - massa_inicio)
+        quantis[..., j] = bordas[fim - 1] + fracao * (bordas[fim] - bordas[fim - 1])
+    quantis[denominador <= 0] = 0.0
+    return theta, dp, quantis
+
+
+@dataclass(frozen=True, eq=False)
+class TabelaVerossimilhanca:
+    """
+    Verossimilhança de uma prova pré-computada na grade de quadratura.
+
+    Como log L(θ_k) = Σ_i [u_i·log P_ki + (1-u_i)·log Q_ki], basta guardar
+    ``base_k = Σ_i log Q_ki`` e ``delta_ki = log P_ki - log Q_ki``: qualquer
+    padrão de respostas vira ``base + delta @ u``. As colunas de itens
+    anulados são zero, de modo que o vetor de respostas completo (uma posição
+    por item da prova) pode ser usado sem recorte.
+
+    Attributes:
+        base: shape (K,)
+        delta: shape (K, I), I = total de itens da prova
+    """
+    base: np.ndarray
+    delta: np.ndarray
+
+    @classmethod
+    def compilar(
+        cls,
+        pontos: np.ndarray,
+        param_a: np.ndarray,
+        param_b: np.ndarray,
+        param_c: np.ndarray,
+        ativos: np.ndarray,
+        d: float = 1.0,
+    ) -> "TabelaVerossimilhanca":
+        """Avalia o núcleo ML3 uma vez para todos os itens ativos."""
+        ativos = np.asarray(ativos, dtype=bool)
+        log_p, log_q = log_probabilidades_ml3(
+            pontos, param_a[ativos], param_b[ativos], param_c[ativos], d
+        )
+        delta = np.zeros((len(pontos), len(ativos)), dtype=float)
+        delta[:, ativos] = log_p - log_q
+        base = log_q.sum(axis=1)
+        delta.setflags(write=False)
+        base.setflags(write=False)
+        return cls(base=base, delta=delta)
+
+    @property
+    def nbytes(self) -> int:
+        return int(self.base.nbytes + self.delta.nbytes)
+
+    def log_verossimilhanca(self, acertos: np.ndarray) -> np.ndarray:
+        """log L (N, K) para a matriz de acertos (N, I) ou vetor (I,)."""
+        acertos = np.atleast_2d(np.asarray(acertos, dtype=float))
+        return acertos @ self.delta.T + self.base
+
+
+@dataclass(frozen=True, eq=False)
+class TabelaItensAno:
+    """
+    log Q e delta de todos os itens distintos de um ano na grade de quadratura.
+
+    As provas de um ano (cores, reaplicações, variantes de idioma de LC)
+    reutilizam um conjunto limitado de itens. Avaliar o ML3 uma vez por item
+    distinto transforma cada prova em um vetor de índices de colunas
+    (``indices``), e a ``TabelaVerossimilhanca`` da prova em uma seleção de
+    colunas (``tabela``). A última coluna é nula e representa itens anulados.
+
+    Attributes:
+        log_q: shape (K, U + 1)
+        delta: shape (K, U + 1), U = itens distintos do ano
+        colunas: (CO_ITEM, a, b, c) -> coluna
+    """
+    log_q: np.ndarray
+    delta: np.ndarray
+    colunas: Dict[Tuple[int, float, float, float], int]
+
+    @classmethod
+    def compilar(
+        cls,
+        pontos: np.ndarray,
+        co_item: np.ndarray,
+        param_a: np.ndarray,
+        param_b: np.ndarray,
+        param_c: np.ndarray,
+        d: float = 1.0,
+    ) -> "TabelaItensAno":
+        """Avalia o núcleo ML3 para cada (CO_ITEM, a, b, c) distinto."""
+        linhas = np.unique(
+            np.column_stack([co_item, param_a, param_b, param_c]).astype(float),
+            axis=0,
+        )
+        log_p, log_q = log_probabilidades_ml3(
+            pontos, linhas[:, 1], linhas[:, 2], linhas[:, 3], d
+        )
+        nula = np.zeros((len(pontos), 1))
+        delta = np.hstack([log_p - log_q, nula])
+        log_q = np.hstack([log_q, nula])
+        delta.setflags(write=False)
+        log_q.setflags(write=False)
+        colunas = {
+            (int(co), a, b, c): coluna
+            for coluna, (co, a, b, c) in enumerate(linhas.tolist())
+        }
+        return cls(log_q=log_q, delta=delta, colunas=colunas)
+
+    @property
+    def coluna_nula(self) -> int:
+        return self.delta.shape[1] - 1
+
+    @property
+    def nbytes(self) -> int:
+        return int(self.log_q.nbytes + self.delta.nbytes)
+
+    def indices(
+        self,
+        co_item: np.ndarray,
+        param_a: np.ndarray,
+        param_b: np.ndarray,
+        param_c: np.ndarray,
+        ativos: np.ndarray,
+    ) -> Optional[np.ndarray]:
+        """
+        Coluna de cada item de uma prova; anulados apontam para a coluna nula.
+
+        Devolve None se algum item ativo não estiver na tabela (por exemplo,
+        um banco montado à mão com outros parâmetros).
+        """
+        indices = np.full(len(ativos), self.coluna_nula, dtype=np.intp)
+        for i in np.flatnonzero(ativos):
+            coluna = self.colunas.get((
+                int(co_item[i]),
+                float(param_a[i]),
+                float(param_b[i]),
+                float(param_c[i]),
+            ))
+            if coluna is None:
+                return None
+            indices[i] = coluna
+        return indices
+
+    def tabela(self, indices: np.ndarray) -> TabelaVerossimilhanca:
+        """``TabelaVerossimilhanca`` da prova por seleção de colunas."""
+        delta = self.delta[:, indices]
+        base = self.log_q[:, indices].sum(axis=1)
+        delta.setflags(write=False)
+        base.setflags(write=False)
+        return TabelaVerossimilhanca(base=base, delta=delta)
+
+
+def log_verossimilhanca_invertida(
+    log_l: np.ndarray, delta: np.ndarray, acertos: np.ndarray
+) -> np.ndarray:
+    """
+    log L de todos os padrões que diferem de ``acertos`` em um único item.
+
+    Inverter o item i troca log P_i por log Q_i (ou o contrário), ou seja,
+    soma ``(1 - 2·u_i)·delta_i`` ao vetor base. As I reestimações viram uma
+    atualização de posto um por item sobre a mesma matriz.
+
+    Args:
+        log_l: log L do padrão original, shape (K,), ou (N, K) para N padrões
+        delta: ``TabelaVerossimilhanca.delta``, shape (K, I)
+        acertos: padrão original, shape (I,), ou (N, I)
+
+    Returns:
+        Array (I, K), ou (N, I, K); o índice i corresponde ao padrão com o
+        item i invertido
+    """
+    sinal = 1.0 - 2.0 * np.asarray(acertos, dtype=float)
+    log_l = np.asarray(log_l, dtype=float)
+    return log_l[..., None, :] + sinal[..., :, None] * delta.T
@@ -17,17 +17,109 @@ Exemplo de uso:
         cor="azul"
     )
     # Retorna: 1011
+
+Os YAMLs são lidos e compilados uma vez por processo (``MapeamentoCompilado``),
+com índices diretos e reversos; instâncias de ``MapeadorProvas`` apenas os
+consultam. Os índices são ``MappingProxyType`` com tuplas, somente leitura; os
+atributos ``dados`` e ``ordem_provas`` de cada instância são cópias próprias,
+feitas no primeiro acesso. ``obter_mapeador`` devolve a instância compartilhada dos arquivos
+padrão. A substituição de um arquivo (mtime ou tamanho) é percebida na próxima
+instância.
+
+Aliases de tipo, cor e área são compilados em tabelas de consulta direta com
+chaves dobradas (minúsculas, sem acentos, espaços colapsados); as variantes
+``normalizar_tipos_aplicacao``, ``normalizar_cores`` e ``normalizar_areas``
+normalizam colunas inteiras, uma vez por valor distinto.
 """
 
 from __future__ import annotations
 
-import yaml
+import copy
+import unicodedata
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Optional, Dict, List
+from types import MappingProxyType
+from typing import (
+    TYPE_CHECKING, Callable, Dict, Iterable, List, Mapping, Optional, Tuple,
+)
 from dataclasses import dataclass
 
+if TYPE_CHECKING:
+    import numpy as np
+
+AREAS = ('MT', 'CN', 'CH', 'LC')
+
+
+# Entradas repetem-se muito (as mesmas cores e tipos em planilhas inteiras).
+@lru_cache(maxsize=4096)
+def _dobrar(texto: str) -> str:
+    """Minúsculas, espaços das pontas removidos e sem acentos ('ª' vira 'a')."""
+    texto = texto.lower().strip()
+    if texto.isascii():
+        return texto
+    decomposto = unicodedata.normalize('NFKD', texto)
+    return ''.join(c for c in decomposto if not unicodedata.combining(c))
+
+
+@lru_cache(maxsize=4096)
+def _chave_tipo(texto: str) -> str:
+    return '_'.join(_dobrar(texto).split())
+
+
+@lru_cache(maxsize=4096)
+def _chave_area(texto: str) -> str:
+    return ' '.join(_dobrar(texto).split())
+
+
+# Nomes de área aceitos, já dobrados (ver ``_chave_area``).
+_AREAS_POR_NOME = {
+    _chave_area(nome): sigla
+    for nome, sigla in (
+        *((sigla, sigla) for sigla in AREAS),
+        ('MATEMATICA', 'MT'),
+        ('MATEMÁTICA', 'MT'),
+        ('MAT', 'MT'),
+        ('CIENCIAS DA NATUREZA', 'CN'),
+        ('CIÊNCIAS DA NATUREZA', 'CN'),
+        ('NATUREZA', 'CN'),
+        ('CIENCIAS HUMANAS', 'CH'),
+        ('CIÊNCIAS HUMANAS', 'CH'),
+        ('HUMANAS', 'CH'),
+        ('LINGUAGENS', 'LC'),
+        ('LINGUAGENS E CODIGOS', 'LC'),
+        ('LINGUAGENS E CÓDIGOS', 'LC'),
+        ('CÓDIGOS', 'LC'),
+    )
+}
+
+
+def _tabela_aliases(
+    aliases: Dict[str, List[str]], chave: Callable[[str], str]
+) -> Dict[str, str]:
+    """Alias dobrado -> nome padrão; em conflito vale o primeiro padrão."""
+    tabela: Dict[str, str] = {}
+    for padrao, lista in aliases.items():
+        for alias in (*lista, padrao):
+            tabela.setdefault(chave(str(alias)), padrao)
+    return tabela
+
+
+def _normalizar_coluna(valores: Iterable[str], normalizar: Callable[[str], str]) -> np.ndarray:
+    """Aplica ``normalizar`` uma vez por valor distinto da coluna."""
+    import numpy as np
 
-@dataclass
+    normalizados: Dict[str, str] = {}
+    resultado = [
+        normalizados[valor] if valor in normalizados
+        else normalizados.setdefault(valor, normalizar(str(valor)))
+        for valor in valores
+    ]
+    saida = np.empty(len(resultado), dtype=object)
+    saida[:] = resultado
+    return saida
+
+
+@dataclass(frozen=True)
 class InfoProva:
     """Informações completas de uma prova."""
     codigo: int
@@ -39,6 +131,159 @@ class InfoProva:
     descricao_especial: Optional[str] = None
 
 
+@dataclass(frozen=True, eq=False)
+class MapeamentoCompilado:
+    """
+    Mapeamento de provas compilado a partir dos YAMLs.
+
+    Compartilhado por todas as instâncias de ``MapeadorProvas`` com os mesmos
+    arquivos. Os índices são somente leitura (``MappingProxyType`` com
+    tuplas); ``dados`` e ``ordem_provas`` são a fonte da compilação e só
+    chegam às instâncias copiados.
+
+    Attributes:
+        dados: conteúdo de mapeamento_provas.yaml
+        ordem_provas: conteúdo de ordem_provas.yaml ({} se ausente)
+        codigos: (ano, área, tipo, cor) -> código
+        provas: todas as provas, na ordem do YAML
+        por_ano: ano -> provas do ano
+        por_codigo: código -> provas com esse código (há reuso entre anos)
+        areas: ano -> áreas
+        tipos: (ano, área) -> tipos de aplicação, exceto 'especiais'
+        cores: (ano, área, tipo) -> cores
+        tipos_por_alias: alias dobrado (ver ``_chave_tipo``) -> tipo padrão
+        cores_por_alias: alias dobrado (ver ``_dobrar``) -> cor padrão
+    """
+    dados: Dict
+    ordem_provas: Dict
+    codigos: Mapping[Tuple[int, str, str, str], int]
+    provas: Tuple[InfoProva, ...]
+    por_ano: Mapping[int, Tuple[InfoProva, ...]]
+    por_codigo: Mapping[int, Tuple[InfoProva, ...]]
+    areas: Mapping[int, Tuple[str, ...]]
+    tipos: Mapping[Tuple[int, str], Tuple[str, ...]]
+    cores: Mapping[Tuple[int, str, str], Tuple[str, ...]]
+    tipos_por_alias: Mapping[str, str]
+    cores_por_alias: Mapping[str, str]
+
+    @classmethod
+    def compilar(cls, dados: Dict, ordem_provas: Dict) -> "MapeamentoCompilado":
+        codigos = {}
+        provas = []
+        areas = {}
+        tipos = {}
+        cores = {}
+        for ano_key, dados_ano in dados.items():
+            if str(ano_key).startswith('_'):
+                continue
+            ano = int(ano_key)
+            areas[ano] = tuple(dados_ano)
+            for area, dados_area in dados_ano.items():
+                tipos[(ano, area)] = tuple(k for k in dados_area if k != 'especiais')
+                for tipo, cores_tipo in dados_area.items():
+                    if not isinstance(cores_tipo, dict):
+                        continue
+                    cores[(ano, area, tipo)] = tuple(cores_tipo)
+                    for cor, codigo in cores_tipo.items():
+                        codigos[(ano, area, tipo, cor)] = codigo
+                        if area not in AREAS:
+                            continue
+                        provas.append(InfoProva(
+                            codigo=codigo,
+                            ano=ano,
+                            area=area,
+                            tipo_aplicacao=tipo,
+                            cor=cor,
+                            eh_especial=tipo == "especiais",
+                            descricao_especial=cor if tipo == "especiais" else None,
+                        ))
+
+        por_ano: Dict[int, List[InfoProva]] = {}
+        por_codigo: Dict[int, List[InfoProva]] = {}
+        for prova in provas:
+            por_ano.setdefault(prova.ano, []).append(prova)
+            por_codigo.setdefault(prova.codigo, []).append(prova)
+        metadata = dados.get('_metadata', {})
+        return cls(
+            dados=dados,
+            ordem_provas=ordem_provas,
+            codigos=MappingProxyType(codigos),
+            provas=tuple(provas),
+            por_ano=MappingProxyType(
+                {ano: tuple(lista) for ano, lista in por_ano.items()}
+            ),
+            por_codigo=MappingProxyType(
+                {codigo: tuple(lista) for codigo, lista in por_codigo.items()}
+            ),
+            areas=MappingProxyType(areas),
+            tipos=MappingProxyType(tipos),
+            cores=MappingProxyType(cores),
+            tipos_por_alias=MappingProxyType(_tabela_aliases(
+                metadata.get('aliases_tipo_aplicacao', {}), _chave_tipo
+            )),
+            cores_por_alias=MappingProxyType(
+                _tabela_aliases(metadata.get('aliases_cores', {}), _dobrar)
+            ),
+        )
+
+
+def _ler_ordem_provas(arquivo_ordem_provas: Path) -> Dict:
+    """Carrega o arquivo de ordem das provas (se existir)."""
+    if not arquivo_ordem_provas.exists():
+        return {}
+
+    import yaml
+
+    try:
+        with open(arquivo_ordem_provas, 'r', encoding='utf-8') as f:
+            return yaml.safe_load(f) or {}
+    except Exception:
+        return {}
+
+
+@lru_cache(maxsize=8)
+def _compilar(
+    arquivo_mapeamento: str, chave_mapeamento: tuple,
+    arquivo_ordem_provas: str, chave_ordem: Optional[tuple],
+) -> MapeamentoCompilado:
+    del chave_mapeamento, chave_ordem  # Só invalidam o cache.
+    import yaml
+
+    with open(arquivo_mapeamento, 'r', encoding='utf-8') as f:
+        dados = yaml.safe_load(f)
+    return MapeamentoCompilado.compilar(
+        dados, _ler_ordem_provas(Path(arquivo_ordem_provas))
+    )
+
+
+def _chave(caminho: Path) -> Optional[tuple]:
+    try:
+        stat = caminho.stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def carregar_mapeamento(
+    arquivo_mapeamento: Optional[Path] = None,
+    arquivo_ordem_provas: Optional[Path] = None,
+) -> MapeamentoCompilado:
+    """Mapeamento compilado dos arquivos, lido uma vez por processo."""
+    if arquivo_mapeamento is None:
+        arquivo_mapeamento = Path(__file__).parent / 'mapeamento_provas.yaml'
+    if arquivo_ordem_provas is None:
+        arquivo_ordem_provas = Path(__file__).parent / 'ordem_provas.yaml'
+    arquivo_mapeamento = Path(arquivo_mapeamento)
+    arquivo_ordem_provas = Path(arquivo_ordem_provas)
+    chave_mapeamento = _chave(arquivo_mapeamento)
+    if chave_mapeamento is None:
+        raise FileNotFoundError(f"Arquivo não encontrado: {arquivo_mapeamento}")
+    return _compilar(
+        str(arquivo_mapeamento.resolve()), chave_mapeamento,
+        str(arquivo_ordem_provas.resolve()), _chave(arquivo_ordem_provas),
+    )
+
+
 class MapeadorProvas:
     """
     Mapeador de códigos de prova ENEM.
@@ -75,21 +320,35 @@ class MapeadorProvas:
         Args:
             arquivo_mapeamento: Caminho para mapeamento_provas.yaml
                                Se None, usa o arquivo padrão do módulo.
+            arquivo_ordem_provas: Caminho para ordem_provas.yaml
+                               Se None, usa o arquivo padrão do módulo.
         """
-        if arquivo_mapeamento is None:
-            arquivo_mapeamento = Path(__file__).parent / 'mapeamento_provas.yaml'
-        
-        with open(arquivo_mapeamento, 'r', encoding='utf-8') as f:
-            self.dados = yaml.safe_load(f)
-        
-        self.metadata = self.dados.get('_metadata', {})
-        self.aliases_tipo = self.metadata.get('aliases_tipo_aplicacao', {})
-        self.aliases_cor = self.metadata.get('aliases_cores', {})
+        self._usar(carregar_mapeamento(arquivo_mapeamento, arquivo_ordem_provas))
+
+    def _usar(self, mapa: MapeamentoCompilado) -> None:
+        self._mapa = mapa
+
+    # Cópias desta instância, feitas no primeiro acesso: alterá-las não muda
+    # o mapeamento compartilhado nem as consultas, que usam os índices.
+    @cached_property
+    def dados(self) -> Dict:
+        return copy.deepcopy(self._mapa.dados)
 
-        if arquivo_ordem_provas is None:
-            arquivo_ordem_provas = Path(__file__).parent / 'ordem_provas.yaml'
+    @cached_property
+    def ordem_provas(self) -> Dict:
+        return copy.deepcopy(self._mapa.ordem_provas)
 
-        self.ordem_provas = self._carregar_ordem_provas(arquivo_ordem_provas)
+    @cached_property
+    def metadata(self) -> Dict:
+        return self.dados.get('_metadata', {})
+
+    @cached_property
+    def aliases_tipo(self) -> Dict:
+        return self.metadata.get('aliases_tipo_aplicacao', {})
+
+    @cached_property
+    def aliases_cor(self) -> Dict:
+        return self.metadata.get('aliases_cores', {})
     
     def normalizar_tipo_aplicacao(self, tipo: str) -> str:
         """
@@ -107,16 +366,13 @@ class MapeadorProvas:
         Returns:
             Nome normalizado do tipo
         """
-        tipo_lower = tipo.lower().strip()
-        tipo_normalizado = tipo_lower.replace('ª', 'a').replace('ç', 'c').replace('ã', 'a').replace(' ', '_')
-        
-        # Buscar em aliases
-        for tipo_padrao, aliases in self.aliases_tipo.items():
-            if tipo_normalizado in aliases or tipo_normalizado == tipo_padrao:
-                return tipo_padrao
-        
+        tipo_padrao = self._mapa.tipos_por_alias.get(_chave_tipo(tipo))
+        if tipo_padrao is not None:
+            return tipo_padrao
+
         # Se não encontrou, retornar normalizado
-        return tipo_normalizado
+        tipo_lower = tipo.lower().strip()
+        return tipo_lower.replace('ª', 'a').replace('ç', 'c').replace('ã', 'a').replace(' ', '_')
     
     def normalizar_cor(self, cor: str) -> str:
         """
@@ -133,14 +389,10 @@ class MapeadorProvas:
         Returns:
             Nome normalizado da cor
         """
-        cor_lower = cor.lower().strip()
-        
-        # Buscar em aliases
-        for cor_padrao, aliases in self.aliases_cor.items():
-            if cor_lower in aliases or cor_lower == cor_padrao:
-                return cor_padrao
-        
-        return cor_lower
+        cor_padrao = self._mapa.cores_por_alias.get(_dobrar(cor))
+        if cor_padrao is not None:
+            return cor_padrao
+        return cor.lower().strip()
     
     def normalizar_area(self, area: str) -> str:
         """
@@ -157,41 +409,28 @@ class MapeadorProvas:
         Returns:
             Sigla normalizada (MT, CN, CH, LC)
         """
-        area_upper = area.upper().strip()
-        
-        # Se já é uma sigla válida
-        if area_upper in ['MT', 'CN', 'CH', 'LC']:
-            return area_upper
-        
-        # Mapear nomes completos
-        mapa_nomes = {
-            'MATEMATICA': 'MT',
-            'MATEMÁTICA': 'MT',
-            'MAT': 'MT',
-            'CIENCIAS DA NATUREZA': 'CN',
-            'CIÊNCIAS DA NATUREZA': 'CN',
-            'NATUREZA': 'CN',
-            'CIENCIAS HUMANAS': 'CH',
-            'CIÊNCIAS HUMANAS': 'CH',
-            'HUMANAS': 'CH',
-            'LINGUAGENS': 'LC',
-            'LINGUAGENS E CODIGOS': 'LC',
-            'LINGUAGENS E CÓDIGOS': 'LC',
-            'CÓDIGOS': 'LC',
-        }
-        
-        return mapa_nomes.get(area_upper, area_upper)
+        sigla = _AREAS_POR_NOME.get(_chave_area(area))
+        return sigla if sigla is not None else area.upper().strip()
+
+    def normalizar_tipos_aplicacao(self, tipos: Iterable[str]) -> np.ndarray:
+        """
+        ``normalizar_tipo_aplicacao`` de uma coluna inteira.
 
-    def _carregar_ordem_provas(self, arquivo_ordem_provas: Path) -> Dict:
-        """Carrega o arquivo de ordem das provas (se existir)."""
-        if not arquivo_ordem_provas.exists():
-            return {}
+        Cada valor distinto é normalizado uma vez. Valores ausentes (None,
+        NaN) devem ser tratados antes: são convertidos com ``str``.
 
-        try:
-            with open(arquivo_ordem_provas, 'r', encoding='utf-8') as f:
-                return yaml.safe_load(f) or {}
-        except Exception:
-            return {}
+        Returns:
+            Array ``object`` unidimensional, na ordem da entrada
+        """
+        return _normalizar_coluna(tipos, self.normalizar_tipo_aplicacao)
+
+    def normalizar_cores(self, cores: Iterable[str]) -> np.ndarray:
+        """``normalizar_cor`` de uma coluna inteira (ver ``normalizar_tipos_aplicacao``)."""
+        return _normalizar_coluna(cores, self.normalizar_cor)
+
+    def normalizar_areas(self, areas: Iterable[str]) -> np.ndarray:
+        """``normalizar_area`` de uma coluna inteira (ver ``normalizar_tipos_aplicacao``)."""
+        return _normalizar_coluna(areas, self.normalizar_area)
 
     def listar_ordem_provas(self, ano: int) -> List[str]:
         """
@@ -205,7 +444,7 @@ class MapeadorProvas:
         except (ValueError, TypeError):
             pass
 
-        dados = self.ordem_provas or {}
+        dados = self._mapa.ordem_provas or {}
         metadata = dados.get('_metadata', {})
         fallback = metadata.get('default', ['LC', 'CH', 'CN', 'MT'])
 
@@ -272,23 +511,29 @@ class MapeadorProvas:
         area_norm = self.normalizar_area(area)
         tipo_norm = self.normalizar_tipo_aplicacao(tipo_aplicacao)
         cor_norm = self.normalizar_cor(cor)
-        
+
+        codigo = self._mapa.codigos.get((ano, area_norm, tipo_norm, cor_norm))
+        if codigo is not None:
+            return codigo
+
+        # Combinação inexistente: percorre o YAML para explicar o que falta.
         # Verificar se ano existe (pode estar como int ou str no YAML)
-        ano_key = ano if ano in self.dados else str(ano)
-        if ano_key not in self.dados:
+        dados = self._mapa.dados
+        ano_key = ano if ano in dados else str(ano)
+        if ano_key not in dados:
             raise KeyError(
                 f"Ano {ano} não encontrado no mapeamento. "
                 f"Anos disponíveis: {self.listar_anos_disponiveis()}"
             )
         
         # Verificar se área existe
-        if area_norm not in self.dados[ano_key]:
+        if area_norm not in dados[ano_key]:
             raise KeyError(
                 f"Área {area_norm} não encontrada para ano {ano}. "
-                f"Áreas disponíveis: {list(self.dados[ano_key].keys())}"
+                f"Áreas disponíveis: {list(dados[ano_key].keys())}"
             )
         
-        dados_area = self.dados[ano_key][area_norm]
+        dados_area = dados[ano_key][area_norm]
         
         # Tentar encontrar no tipo especificado
         if tipo_norm in dados_area:
@@ -315,9 +560,21 @@ class MapeadorProvas:
         Returns:
             Lista de anos (ordenada)
         """
-        anos = [int(k) for k in self.dados.keys() if not str(k).startswith('_')]
+        anos = [int(k) for k in self._mapa.dados if not str(k).startswith('_')]
         return sorted(anos)
     
+    def listar_areas_disponiveis(self, ano: int) -> List[str]:
+        """
+        Lista as áreas cadastradas para um ano.
+
+        Args:
+            ano: Ano do ENEM
+
+        Returns:
+            Lista de siglas, na ordem do mapeamento (vazia se o ano não existe)
+        """
+        return list(self._mapa.areas.get(int(ano), ()))
+
     def listar_tipos_disponiveis(self, ano: int, area: str) -> List[str]:
         """
         Lista tipos de aplicação disponíveis para ano/área.
@@ -333,14 +590,8 @@ class MapeadorProvas:
             >>> mapeador.listar_tipos_disponiveis(2021, "CN")
             ['1a_aplicacao', 'digital']
         """
-        ano_int = int(ano)
         area_norm = self.normalizar_area(area)
-        ano_key = ano_int if ano_int in self.dados else str(ano_int)
-        
-        if ano_key not in self.dados or area_norm not in self.dados[ano_key]:
-            return []
-        
-        return [k for k in self.dados[ano_key][area_norm].keys() if k != 'especiais']
+        return list(self._mapa.tipos.get((int(ano), area_norm), ()))
     
     def listar_cores_disponiveis(
         self, 
@@ -363,15 +614,9 @@ class MapeadorProvas:
             >>> mapeador.listar_cores_disponiveis(2021, "CN", "digital")
             ['azul', 'amarela', 'rosa', 'cinza']
         """
-        ano_int = int(ano)
         area_norm = self.normalizar_area(area)
         tipo_norm = self.normalizar_tipo_aplicacao(tipo_aplicacao)
-        ano_key = ano_int if ano_int in self.dados else str(ano_int)
-        
-        try:
-            return list(self.dados[ano_key][area_norm][tipo_norm].keys())
-        except KeyError:
-            return []
+        return list(self._mapa.cores.get((int(ano), area_norm, tipo_norm), ()))
     
     def obter_info_completa(
         self,
@@ -427,8 +672,9 @@ class MapeadorProvas:
             2021 CN digital azul
         """
         area_norm = self.normalizar_area(area) if area is not None else None
-        for prova in self.listar_todas_provas(int(ano) if ano is not None else None):
-            if prova.codigo != int(codigo):
+        ano_int = int(ano) if ano is not None else None
+        for prova in self._mapa.por_codigo.get(int(codigo), ()):
+            if ano_int is not None and prova.ano != ano_int:
                 continue
             if area_norm is not None and prova.area != area_norm:
                 continue
@@ -450,7 +696,7 @@ class MapeadorProvas:
         avisos = []
         codigos_vistos = {}
         
-        for ano_key, dados_ano in self.dados.items():
+        for ano_key, dados_ano in self._mapa.dados.items():
             if str(ano_key).startswith('_'):
                 continue
             
@@ -493,36 +739,9 @@ class MapeadorProvas:
             >>> for p in provas_2023:
             ...     print(f"{p.area} {p.tipo_aplicacao} {p.cor} = {p.codigo}")
         """
-        provas = []
-        
-        for ano_key, dados_ano in self.dados.items():
-            if str(ano_key).startswith('_'):
-                continue
-            
-            ano_int = int(ano_key)
-            if ano is not None and ano_int != ano:
-                continue
-            
-            for area, dados_area in dados_ano.items():
-                if area not in ['MT', 'CN', 'CH', 'LC']:
-                    continue
-                
-                for tipo, cores in dados_area.items():
-                    if not isinstance(cores, dict):
-                        continue
-                    
-                    for cor, codigo in cores.items():
-                        provas.append(InfoProva(
-                            codigo=codigo,
-                            ano=ano_int,
-                            area=area,
-                            tipo_aplicacao=tipo,
-                            cor=cor,
-                            eh_especial=tipo == "especiais",
-                            descricao_especial=cor if tipo == "especiais" else None,
-                        ))
-        
-        return provas
+        if ano is None:
+            return list(self._mapa.provas)
+        return list(self._mapa.por_ano.get(ano, ()))
     
     def listar_codigos_por_area(self, ano: int, area: str) -> List[int]:
         """
@@ -536,10 +755,19 @@ class MapeadorProvas:
             Lista de códigos numéricos
         """
         area_norm = self.normalizar_area(area)
-        codigos = []
-        
-        for prova in self.listar_todas_provas(ano):
-            if prova.area == area_norm:
-                codigos.append(prova.codigo)
-        
-        return codigos
+        return [
+            prova.codigo for prova in self.listar_todas_provas(ano)
+            if prova.area == area_norm
+        ]
+
+
+@lru_cache(maxsize=1)
+def _mapeador_de(mapa: MapeamentoCompilado) -> MapeadorProvas:
+    mapeador = MapeadorProvas.__new__(MapeadorProvas)
+    mapeador._usar(mapa)
+    return mapeador
+
+
+def obter_mapeador() -> MapeadorProvas:
+    """Mapeador dos arquivos padrão, compartilhado pelo processo."""
+    return _mapeador_de(carregar_mapeamento())
@@ -0,0 +1,385 @@
+# SPDX-License-Identifier: PolyForm-Noncommercial-1.0.0
+# Copyright (c) 2026 Henrique Lindemann
+"""Pacote binário dos parâmetros de itens (``data/itens/itens.bin``).
+
+Substitui, em tempo de execução, o ``pd.read_csv`` de cada
+``ITENS_PROVA_<ano>.csv``: todos os anos ficam em arrays colunares de um
+único arquivo lido por ``mmap`` (ver ``binario``), com um índice de provas
+por ano. O pacote grava o sha256 de ``manifest.json`` e só é usado quando o
+manifesto da mesma pasta confere; caso contrário o motor volta aos CSVs.
+
+Codificação por coluna, escolhida para que ``dataframe(ano)`` devolva
+exatamente o mesmo ``DataFrame`` que ``pd.read_csv`` do CSV normalizado:
+
+- numéricas: o menor dtype que preserva os valores, com o dtype original
+  no cabeçalho;
+- texto: códigos inteiros para um vocabulário no cabeçalho (-1 = ausente).
+
+O motor não precisa de pandas para ler os itens: ``PacoteItens.colunas`` e
+``ler_csv_colunas`` (módulo ``csv`` da biblioteca padrão) devolvem
+``ColunasItens``, arrays NumPy com os mesmos valores e dtypes das colunas do
+``DataFrame``. ``ler_csv_itens`` e ``dataframe`` ficam para as ferramentas.
+"""
+
+from __future__ import annotations
+
+import csv
+import hashlib
+import io
+import json
+from collections.abc import Mapping
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from .binario import escrever_pacote, ler_pacote
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+ARQUIVO_PACOTE = "itens.bin"
+ARQUIVO_MANIFESTO = "manifest.json"
+FORMATO_PACOTE = "itens-v1"
+
+
+def _sha256(caminho: Path) -> str:
+    return hashlib.sha256(Path(caminho).read_bytes()).hexdigest()
+
+
+def ler_csv_itens(caminho: Path) -> pd.DataFrame:
+    """Leitura de referência de um ``ITENS_PROVA_<ano>.csv``.
+
+    O gerador do pacote normaliza para UTF-8. Caminhos externos podem
+    apontar aos CSVs oficiais antigos em Latin-1, por isso o fallback de
+    codificação é explícito e não muda a origem solicitada.
+    """
+    import pandas as pd
+
+    try:
+        return pd.read_csv(caminho, encoding="utf-8", sep=";")
+    except UnicodeDecodeError:
+        return pd.read_csv(caminho, encoding="latin1", sep=";")
+
+
+# Valores lidos como ausentes por ``pd.read_csv`` (``na_values`` padrão).
+NULOS_CSV = frozenset({
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan",
+    "1.#IND", "1.#QNAN", "<NA>", "N/A", "NA", "NULL", "NaN", "None", "n/a",
+    "nan", "null",
+})
+
+
+class ColunasItens(Mapping):
+    """Colunas de um arquivo de itens como arrays NumPy, sem pandas.
+
+    Numéricas com o dtype de ``pd.read_csv`` (int64 sem ausentes, senão
+    float64 com NaN); texto em arrays ``object`` com ``np.nan`` nos ausentes,
+    como em ``df[coluna].to_numpy()``. Os arrays são somente leitura: as
+    colunas ficam em cache e são compartilhadas entre threads.
+    """
+
+    def __init__(self, colunas: Dict[str, np.ndarray]):
+        tamanhos = {len(valores) for valores in colunas.values()}
+        if len(tamanhos) > 1:
+            raise ValueError("colunas de itens com tamanhos diferentes")
+        self._colunas = {}
+        for nome, valores in colunas.items():
+            # Uma view, para não travar o array de quem passou as colunas.
+            valores = np.asarray(valores).view()
+            valores.setflags(write=False)
+            self._colunas[nome] = valores
+        self.n_linhas = tamanhos.pop() if tamanhos else 0
+
+    def __getitem__(self, nome: str) -> np.ndarray:
+        return self._colunas[nome]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._colunas)
+
+    def __len__(self) -> int:
+        return len(self._colunas)
+
+    @classmethod
+    def de_dataframe(cls, df: pd.DataFrame) -> "ColunasItens":
+        import pandas as pd
+
+        colunas = {}
+        for nome in df.columns:
+            serie = df[nome]
+            if pd.api.types.is_numeric_dtype(serie) or pd.api.types.is_bool_dtype(serie):
+                colunas[nome] = serie.to_numpy()
+            else:
+                colunas[nome] = serie.to_numpy(dtype=object, na_value=np.nan)
+        return cls(colunas)
+
+    def numerico(self, nome: str) -> np.ndarray:
+        """float64 da coluna, como ``pd.to_numeric(errors="coerce")``."""
+        valores = self._colunas[nome]
+        if valores.dtype != object:
+            return valores.astype(np.float64)
+        return np.asarray([_float_ou_nan(valor) for valor in valores], dtype=np.float64)
+
+    def grupos(self) -> Dict[Tuple[str, int], np.ndarray]:
+        """O mesmo que ``grupos_provas`` do ``DataFrame`` destas colunas."""
+        grupos: Dict[Tuple[Any, Any], List[int]] = {}
+        chaves = zip(self["SG_AREA"].tolist(), self["CO_PROVA"].tolist())
+        for linha, (area, prova) in enumerate(chaves):
+            if area == area and prova == prova:  # groupby descarta chaves NaN.
+                grupos.setdefault((area, prova), []).append(linha)
+        return {
+            (str(area), int(prova)): np.asarray(grupos[(area, prova)], dtype=np.int64)
+            for area, prova in sorted(grupos)
+        }
+
+
+def _float_ou_nan(valor: Any) -> float:
+    try:
+        return float(valor)
+    except (TypeError, ValueError):
+        return np.nan
+
+
+def _inferir_coluna(textos: List[str]) -> np.ndarray:
+    """Converte uma coluna do CSV com a inferência de tipos de ``read_csv``."""
+    ausente = [texto in NULOS_CSV for texto in textos]
+    presentes = [texto for texto, nulo in zip(textos, ausente) if not nulo]
+    if not any(ausente):
+        try:
+            return np.asarray([int(texto) for texto in presentes], dtype=np.int64)
+        except (ValueError, OverflowError):
+            pass
+    try:
+        numeros = iter([float(texto) for texto in presentes])
+        return np.asarray(
+            [np.nan if nulo else next(numeros) for nulo in ausente], dtype=np.float64
+        )
+    except ValueError:
+        pass
+    valores = np.empty(len(textos), dtype=object)
+    valores[:] = [np.nan if nulo else texto for texto, nulo in zip(textos, ausente)]
+    return valores
+
+
+def ler_csv_colunas(caminho: Path) -> ColunasItens:
+    """``ler_csv_itens`` só com o módulo ``csv``: mesmos valores e dtypes."""
+    bruto = Path(caminho).read_bytes()
+    try:
+        texto = bruto.decode("utf-8-sig")
+    except UnicodeDecodeError:
+        texto = bruto.decode("latin1")
+    leitor = csv.reader(io.StringIO(texto, newline=""), delimiter=";")
+    linhas = [linha for linha in leitor if linha]
+    if not linhas:
+        raise ValueError(f"arquivo de itens vazio: {caminho}")
+    cabecalho, dados = linhas[0], linhas[1:]
+    largura = len(cabecalho)
+    if any(len(linha) > largura for linha in dados):
+        raise ValueError(f"{caminho}: linha com mais campos que o cabeçalho")
+    dados = [linha + [""] * (largura - len(linha)) for linha in dados]
+    return ColunasItens({
+        nome: _inferir_coluna([linha[i] for linha in dados])
+        for i, nome in enumerate(cabecalho)
+    })
+
+
+def grupos_provas(df: pd.DataFrame) -> Dict[Tuple[str, int], np.ndarray]:
+    """(área, prova) -> posições das linhas na ordem do arquivo, por chave."""
+    grupos = df.groupby(["SG_AREA", "CO_PROVA"]).indices
+    return {
+        (str(area), int(prova)): np.asarray(grupos[(area, prova)])
+        for area, prova in sorted(grupos)
+    }
+
+
+@dataclass(frozen=True)
+class IndiceProvas:
+    """Índice das provas de um ano, montado uma vez na carga dos itens.
+
+    ``provas_por_area`` segue a ordem da primeira ocorrência de cada área no
+    arquivo, como ``df['SG_AREA'].unique()``.
+    """
+
+    linhas_por_prova: Dict[Tuple[str, int], np.ndarray]
+    provas_por_area: Dict[str, List[int]]
+
+    @classmethod
+    def de_grupos(cls, grupos: Dict[Tuple[str, int], np.ndarray]) -> "IndiceProvas":
+        primeira: Dict[str, int] = {}
+        provas: Dict[str, List[int]] = {}
+        for (area, prova), linhas in grupos.items():
+            primeira[area] = min(primeira.get(area, linhas[0]), linhas[0])
+            provas.setdefault(area, []).append(prova)
+        return cls(
+            linhas_por_prova=grupos,
+            provas_por_area={
+                area: sorted(provas[area]) for area in sorted(primeira, key=primeira.get)
+            },
+        )
+
+    def linhas(self, area: str, co_prova: int) -> np.ndarray:
+        """Posições das linhas da prova (vazio se não existir)."""
+        return self.linhas_por_prova.get((area, int(co_prova)), _SEM_LINHAS)
+
+
+_SEM_LINHAS = np.empty(0, dtype=np.int64)
+
+
+def _codificar_coluna(nome: str, serie: pd.Series) -> Tuple[Dict[str, Any], np.ndarray]:
+    import pandas as pd
+
+    if not (
+        pd.api.types.is_numeric_dtype(serie) or pd.api.types.is_bool_dtype(serie)
+    ):
+        ausente = serie.isna().to_numpy()
+        textos = serie[~ausente].astype(str)
+        vocabulario = sorted(set(textos))
+        codigos = np.full(
+            len(serie), -1,
+            dtype=np.result_type(np.int8, np.min_scalar_type(len(vocabulario))),
+        )
+        codigos[~ausente] = np.searchsorted(
+            np.asarray(vocabulario, dtype=object), textos.to_numpy(dtype=object)
+        )
+        return {"nome": nome, "vocabulario": vocabulario}, codigos
+
+    valores = serie.to_numpy()
+    compacto = valores
+    if valores.dtype.kind in "iu" and len(valores):
+        compacto = valores.astype(
+            np.result_type(np.min_scalar_type(valores.min()),
+                           np.min_scalar_type(valores.max()))
+        )
+    elif valores.dtype.kind == "f":
+        reduzido = valores.astype(np.float32)
+        if np.array_equal(reduzido.astype(valores.dtype), valores, equal_nan=True):
+            compacto = reduzido
+    return {"nome": nome, "dtype": valores.dtype.str}, compacto
+
+
+def escrever_pacote_itens(base: Path, destino: Optional[Path] = None) -> Path:
+    """Gera o pacote a partir dos CSVs listados no manifesto de ``base``.
+
+    Cada CSV é conferido contra ``sha256_normalizado`` do manifesto antes de
+    entrar no pacote. Levanta ``ValueError`` se algum divergir.
+    """
+    base = Path(base)
+    destino = Path(destino or base / ARQUIVO_PACOTE)
+    caminho_manifesto = base / ARQUIVO_MANIFESTO
+    manifesto = json.loads(caminho_manifesto.read_text(encoding="utf-8"))
+
+    anos: Dict[str, Any] = {}
+    arrays: Dict[str, np.ndarray] = {}
+    for entrada in manifesto["files"]:
+        ano = int(entrada["ano"])
+        caminho = base / entrada["arquivo"]
+        if _sha256(caminho) != entrada["sha256_normalizado"]:
+            raise ValueError(f"{caminho}: sha256 diverge de {caminho_manifesto}")
+        df = ler_csv_itens(caminho)
+
+        colunas = []
+        for nome in df.columns:
+            info, valores = _codificar_coluna(nome, df[nome])
+            colunas.append(info)
+            arrays[f"{ano}:{nome}"] = valores
+
+        # Índice de provas: linhas de cada (área, prova), na ordem do arquivo.
+        grupos = grupos_provas(df)
+        arrays[f"{ano}:linhas"] = np.concatenate(
+            list(grupos.values()) or [_SEM_LINHAS]
+        ).astype(np.min_scalar_type(len(df)))
+        arrays[f"{ano}:inicio"] = np.cumsum(
+            [0] + [len(linhas) for linhas in grupos.values()]
+        ).astype(np.int32)
+        anos[str(ano)] = {
+            "linhas": int(len(df)),
+            "colunas": colunas,
+            "provas": [[area, prova] for area, prova in grupos],
+        }
+
+    escrever_pacote(
+        destino,
+        {
+            "formato": FORMATO_PACOTE,
+            "sha256_manifesto": _sha256(caminho_manifesto),
+            "anos": anos,
+        },
+        arrays,
+    )
+    return destino
+
+
+class PacoteItens:
+    """Pacote de itens mapeado em memória e já conferido com o manifesto."""
+
+    def __init__(self, cabecalho: Dict[str, Any], arrays: Dict[str, np.ndarray]):
+        self._anos = {int(ano): info for ano, info in cabecalho["anos"].items()}
+        self._arrays = arrays
+
+    @property
+    def anos(self) -> List[int]:
+        return sorted(self._anos)
+
+    def colunas(self, ano: int) -> ColunasItens:
+        """Mesmas colunas que ``ler_csv_colunas`` do CSV do ano."""
+        colunas = {}
+        for info in self._anos[int(ano)]["colunas"]:
+            valores = self._arrays[f"{ano}:{info['nome']}"]
+            if "vocabulario" in info:
+                tabela = np.asarray(info["vocabulario"] + [np.nan], dtype=object)
+                colunas[info["nome"]] = tabela[valores]
+            else:
+                colunas[info["nome"]] = valores.astype(info["dtype"])
+        return ColunasItens(colunas)
+
+    def dataframe(self, ano: int) -> pd.DataFrame:
+        """Mesmo ``DataFrame`` que ``ler_csv_itens`` do CSV do ano."""
+        import pandas as pd
+
+        return pd.DataFrame(dict(self.colunas(ano)))
+
+    def provas(self, ano: int) -> Dict[Tuple[str, int], np.ndarray]:
+        """O mesmo que ``grupos_provas`` do DataFrame do ano, sem varrê-lo."""
+        linhas = self._arrays[f"{ano}:linhas"].astype(np.int64)
+        inicio = self._arrays[f"{ano}:inicio"]
+        return {
+            (area, prova): linhas[inicio[i]:inicio[i + 1]]
+            for i, (area, prova) in enumerate(self._anos[int(ano)]["provas"])
+        }
+
+
+@lru_cache(maxsize=4)
+def _carregar(
+    caminho_pacote: str, chave_pacote: tuple, caminho_manifesto: str, chave_manifesto: tuple
+) -> Optional[PacoteItens]:
+    del chave_pacote, chave_manifesto  # Só invalidam o cache.
+    try:
+        cabecalho, arrays = ler_pacote(Path(caminho_pacote))
+        if (
+            cabecalho.get("formato") != FORMATO_PACOTE
+            or cabecalho.get("sha256_manifesto") != _sha256(Path(caminho_manifesto))
+        ):
+            return None
+        return PacoteItens(cabecalho, arrays)
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def carregar_pacote_itens(base: Path) -> Optional[PacoteItens]:
+    """Pacote de ``base``, ou ``None`` se ausente, inválido ou desatualizado.
+
+    Compartilhado pelo processo: várias instâncias de ``CalculadorTRI`` com a
+    mesma pasta mapeiam o arquivo uma única vez.
+    """
+    caminhos = (Path(base) / ARQUIVO_PACOTE, Path(base) / ARQUIVO_MANIFESTO)
+    try:
+        stats = [caminho.stat() for caminho in caminhos]
+    except OSError:
+        return None
+    (pacote, manifesto), (stat_pacote, stat_manifesto) = caminhos, stats
+    return _carregar(
+        str(pacote.resolve()), (stat_pacote.st_mtime_ns, stat_pacote.st_size),
+        str(manifesto.resolve()), (stat_manifesto.st_mtime_ns, stat_manifesto.st_size),
+    )
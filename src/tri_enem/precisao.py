@@ -4,12 +4,11 @@
 
 from __future__ import annotations
 
-import json
 import math
-from functools import lru_cache
-from pathlib import Path
 from typing import Any, Dict, Mapping
 
+from .catalogo import DATA_FILE, secao_validacao
+
 SEVERIDADE_POR_STATUS = {
     "ok": "sucesso",
     "aviso_leve": "info",
@@ -20,7 +19,6 @@ SEVERIDADE_POR_STATUS = {
     "sem_itens": "alerta",
 }
 
-DATA_FILE = Path(__file__).parent / "coeficientes_data.json"
 PERFIL_CALIBRACAO_VERIFICADA = "calibracao_verificada"
 PERFIL_BOA_COM_EXCECOES = "boa_na_maioria_com_excecoes"
 PERFIL_ESTIMATIVA = "estimativa"
@@ -185,26 +183,8 @@ def formatar_resumo_validacao(
     return " · ".join(partes)
 
 
-@lru_cache(maxsize=8)
-def _carregar_data_cache(
-    caminho: str, mtime_ns: int, tamanho: int
-) -> Dict[str, Any] | None:
-    del mtime_ns, tamanho  # Fazem parte da chave e invalidam após substituição.
-    try:
-        data = json.loads(Path(caminho).read_text(encoding="utf-8"))
-    except (OSError, ValueError, TypeError):
-        return None
-    return data if isinstance(data, dict) else None
-
-
 def _carregar_data() -> Dict[str, Any] | None:
-    try:
-        stat = DATA_FILE.stat()
-    except OSError:
-        return None
-    return _carregar_data_cache(
-        str(DATA_FILE.resolve()), stat.st_mtime_ns, stat.st_size
-    )
+    return secao_validacao(DATA_FILE)
 
 
 def _numero_finito(valor: Any) -> float | None:
@@ -251,7 +231,7 @@ def verificar_precisao_prova(ano: int, area: str, co_prova: int) -> Dict[str, An
         if int(data.get("schema_version")) != 3:
             return _resultado_fechado()
         por_prova = data.get("por_prova", {})
-        if not isinstance(por_prova, dict):
+        if not isinstance(por_prova, Mapping):
             return _resultado_fechado()
         info = por_prova.get(key)
     except (TypeError, ValueError, AttributeError):
@@ -0,0 +1,257 @@
+# SPDX-License-Identifier: PolyForm-Noncommercial-1.0.0
+# Copyright (c) 2026 Henrique Lindemann
+"""Segmento compartilhado com os bancos de itens e tabelas já compilados.
+
+Num servidor com vários processos (workers do gunicorn ou do Streamlit), cada
+``CalculadorTRI`` montaria por conta própria as colunas dos anos, os bancos
+de cada prova e as tabelas de verossimilhança na grade de quadratura.
+``publicar_segmento`` grava tudo isso uma vez num contêiner ``binario``;
+cada processo o abre com ``CalculadorTRI(segmento=...)`` e lê bancos e
+tabelas como views do mesmo ``mmap``, somente leitura, sem copiá-los para a
+memória privada. Em ``/dev/shm`` o arquivo fica em memória compartilhada.
+
+O cabeçalho é versionado: formato, versão do pacote, sha256 de
+``manifest.json`` da pasta de itens e a grade de quadratura (pontos, pesos e
+``D``). ``abrir_segmento`` recusa um segmento que não confira com o
+calculador, em vez de servir notas de outros itens.
+
+Conteúdo:
+
+- por banco (ano, área, prova e ``tp_lingua``, com -1 para ``None``), os
+  campos de ``BancoItens`` concatenados;
+- por tabela distinta, indexada pelo digest da assinatura do banco (as cores
+  de uma aplicação a compartilham), ``base`` e ``delta`` na ordem canônica,
+  com ``delta`` guardado transposto para que cada tabela seja um bloco
+  contíguo;
+- as provas de cada ano por área, para ``listar_provas``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .banco_itens import BancoItens
+from .binario import escrever_pacote, ler_pacote
+from .eap import TabelaVerossimilhanca
+from .pacote_itens import ARQUIVO_MANIFESTO, _sha256
+
+FORMATO_SEGMENTO = "segmento-v1"
+# Campos de BancoItens gravados como arrays, com o dtype do banco.
+CAMPOS_BANCO = (
+    "posicao", "gabarito", "param_a", "param_b", "param_c", "co_item",
+    "abandonado", "tp_lingua",
+)
+_SEM_LINGUA = -1
+
+
+def _digest(assinatura: bytes) -> bytes:
+    return hashlib.blake2b(assinatura, digest_size=16).digest()
+
+
+def _versao() -> str:
+    from . import __version__
+
+    return __version__
+
+
+def publicar_segmento(destino: Path, itens_path: Optional[str] = None) -> Path:
+    """Compila e grava o segmento de todas as provas da pasta de itens.
+
+    Cobre cada prova do manifesto e, em LC, cada ``tp_lingua`` aceito
+    (``None``, 0 e 1). A gravação é atômica (arquivo temporário na mesma
+    pasta e ``os.replace``): processos que já abriram o segmento anterior
+    seguem com ele até reabrirem.
+    """
+    from .calculador import CalculadorTRI
+
+    destino = Path(destino)
+    calc = CalculadorTRI(itens_path)
+    caminho_manifesto = calc.base_path / ARQUIVO_MANIFESTO
+    manifesto = json.loads(caminho_manifesto.read_text(encoding="utf-8"))
+
+    bancos: List[list] = []
+    campos: Dict[str, List[np.ndarray]] = {nome: [] for nome in CAMPOS_BANCO}
+    gabaritos: List[str] = []
+    tabelas: Dict[bytes, int] = {}
+    bases: List[np.ndarray] = []
+    deltas: List[np.ndarray] = []
+    anos: Dict[str, Any] = {}
+    for ano in manifesto["years"]:
+        ano = int(ano)
+        provas = calc.listar_provas(ano)
+        anos[str(ano)] = {"provas": provas}
+        for area, codigos in provas.items():
+            linguas = (None, 0, 1) if area == "LC" else (None,)
+            for co_prova in codigos:
+                for tp_lingua in linguas:
+                    try:
+                        banco = calc.carregar_itens(ano, area, co_prova, tp_lingua)
+                    except ValueError:
+                        continue  # Idioma exigido ou não oferecido pela prova.
+                    digest = _digest(banco.assinatura)
+                    if digest not in tabelas:
+                        tabela = calc._tabela(banco)
+                        tabelas[digest] = len(bases)
+                        bases.append(tabela.base)
+                        deltas.append(tabela.delta.T)
+                    bancos.append([
+                        ano, area, co_prova,
+                        _SEM_LINGUA if tp_lingua is None else tp_lingua,
+                    ])
+                    for nome in CAMPOS_BANCO:
+                        campos[nome].append(getattr(banco, nome))
+                    gabaritos.extend(banco.gabarito_texto)
+
+    vocabulario = sorted(set(gabaritos))
+    codigos_gabarito = np.searchsorted(
+        np.asarray(vocabulario, dtype=object), np.asarray(gabaritos, dtype=object)
+    )
+    arrays = {
+        "pontos": calc._pontos_quad,
+        "pesos": calc._pesos_quad,
+        **{nome: np.concatenate(valores) for nome, valores in campos.items()},
+        "gabarito_texto": codigos_gabarito.astype(
+            np.min_scalar_type(len(vocabulario))
+        ),
+        "inicio_bancos": np.cumsum(
+            [0] + [len(valores) for valores in campos["posicao"]]
+        ).astype(np.int64),
+        "digests": np.frombuffer(b"".join(tabelas), dtype=np.uint8).reshape(-1, 16),
+        "base": np.vstack(bases),
+        "delta_t": np.vstack(deltas),
+        "inicio_tabelas": np.cumsum(
+            [0] + [len(delta) for delta in deltas]
+        ).astype(np.int64),
+    }
+    destino.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.NamedTemporaryFile(
+        dir=destino.parent, prefix=destino.name, suffix=".tmp", delete=False
+    ) as temp:
+        temporario = Path(temp.name)
+    try:
+        escrever_pacote(
+            temporario,
+            {
+                "formato": FORMATO_SEGMENTO,
+                "versao": _versao(),
+                "sha256_manifesto": _sha256(caminho_manifesto),
+                "n_quadratura": len(calc._pontos_quad),
+                "d": calc.D,
+                "anos": anos,
+                "bancos": bancos,
+                "vocabulario_gabarito": vocabulario,
+            },
+            arrays,
+        )
+        os.replace(temporario, destino)
+    except BaseException:
+        temporario.unlink(missing_ok=True)
+        raise
+    return destino
+
+
+class SegmentoItens:
+    """Segmento aberto e já conferido com o calculador (ver ``abrir_segmento``)."""
+
+    def __init__(self, cabecalho: Dict[str, Any], arrays: Dict[str, np.ndarray]):
+        self._arrays = arrays
+        self._vocabulario = np.asarray(
+            cabecalho["vocabulario_gabarito"], dtype=object
+        )
+        self._provas = {
+            int(ano): info["provas"] for ano, info in cabecalho["anos"].items()
+        }
+        self._bancos = {
+            (int(ano), area, int(co_prova), int(tp_lingua)): i
+            for i, (ano, area, co_prova, tp_lingua)
+            in enumerate(cabecalho["bancos"])
+        }
+        self._tabelas = {
+            digest.tobytes(): i for i, digest in enumerate(arrays["digests"])
+        }
+        if len(self._bancos) != len(arrays["inicio_bancos"]) - 1 or (
+            len(self._tabelas) != len(arrays["base"])
+        ):
+            raise ValueError("índice do segmento inconsistente")
+
+    @property
+    def anos(self) -> List[int]:
+        return sorted(self._provas)
+
+    def provas(self, ano: int) -> Optional[Dict[str, List[int]]]:
+        """Provas do ano por área, ou ``None`` se o ano não está no segmento."""
+        return self._provas.get(int(ano))
+
+    def banco(
+        self, ano: int, area: str, co_prova: int, tp_lingua: Optional[int],
+        chave: Optional[Tuple] = None,
+    ) -> Optional[BancoItens]:
+        """Banco da prova com arrays no segmento, ou ``None`` se ausente."""
+        i = self._bancos.get((
+            int(ano), area, int(co_prova),
+            _SEM_LINGUA if tp_lingua is None else tp_lingua,
+        ))
+        if i is None:
+            return None
+        a = self._arrays
+        linhas = slice(int(a["inicio_bancos"][i]), int(a["inicio_bancos"][i + 1]))
+        return BancoItens(
+            **{nome: a[nome][linhas] for nome in CAMPOS_BANCO},
+            gabarito_texto=self._vocabulario[a["gabarito_texto"][linhas]].tolist(),
+            chave=chave,
+        )
+
+    def tabela(self, banco: BancoItens) -> Optional[TabelaVerossimilhanca]:
+        """Tabela do banco (pela assinatura), ou ``None`` se ausente."""
+        i = self._tabelas.get(_digest(banco.assinatura))
+        if i is None:
+            return None
+        a = self._arrays
+        inicio = a["inicio_tabelas"]
+        delta_t = a["delta_t"][int(inicio[i]):int(inicio[i + 1])]
+        if len(delta_t) != len(banco):
+            return None
+        return TabelaVerossimilhanca(base=a["base"][i], delta=delta_t.T)
+
+
+def abrir_segmento(
+    caminho: Path, base: Path, pontos: np.ndarray, pesos: np.ndarray, d: float
+) -> SegmentoItens:
+    """Abre o segmento para um calculador com a pasta de itens ``base``.
+
+    Levanta ``ValueError`` se o arquivo não for um segmento desta versão do
+    pacote, se o manifesto de ``base`` não for o da publicação ou se a grade
+    de quadratura for outra.
+    """
+    caminho = Path(caminho)
+    cabecalho, arrays = ler_pacote(caminho)
+    if cabecalho.get("formato") != FORMATO_SEGMENTO:
+        raise ValueError(f"não é um segmento de itens: {caminho}")
+    if cabecalho.get("versao") != _versao():
+        raise ValueError(
+            f"segmento publicado pela versão {cabecalho.get('versao')}, "
+            f"esperada {_versao()}: {caminho}"
+        )
+    try:
+        sha256_manifesto = _sha256(Path(base) / ARQUIVO_MANIFESTO)
+    except OSError:
+        raise ValueError(f"{base} não tem {ARQUIVO_MANIFESTO}") from None
+    if cabecalho.get("sha256_manifesto") != sha256_manifesto:
+        raise ValueError(f"segmento desatualizado em relação a {base}: {caminho}")
+    if not (
+        cabecalho.get("d") == d
+        and np.array_equal(arrays.get("pontos"), pontos)
+        and np.array_equal(arrays.get("pesos"), pesos)
+    ):
+        raise ValueError(f"segmento com outra grade de quadratura: {caminho}")
+    try:
+        return SegmentoItens(cabecalho, arrays)
+    except (KeyError, TypeError) as exc:
+        raise ValueError(f"segmento corrompido: {caminho}: {exc}") from None
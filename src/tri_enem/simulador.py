@@ -23,14 +23,44 @@ Exemplo:
     nota_lc = sim.calcular(
         'LC', 2023, 'ABCDE...' * 9, lingua='ingles', co_prova=1201
     )
+
+    # Tabela de participantes (DataFrame, tabela Arrow, dict de colunas ou
+    # lista de registros), agrupada por prova e estimada em lote
+    lote = sim.calcular_lote(tabela)
+    lote.status  # 'ok' ou o motivo da falha, por linha
 """
 
+import math
+from collections.abc import Mapping
 from pathlib import Path
-from typing import Dict, Optional, List
+from typing import Any, Dict, Optional, List, Tuple
 from dataclasses import dataclass
 
+import numpy as np
+
 from .calculador import CalculadorTRI
 
+# Códigos de ResultadoLote.status.
+STATUS_OK = 'ok'
+# Ano, área ou língua ausentes/inválidos, ou cor sem tipo de aplicação.
+STATUS_ENTRADA_INVALIDA = 'entrada_invalida'
+# A combinação informada não corresponde a nenhuma prova.
+STATUS_PROVA_NAO_ENCONTRADA = 'prova_nao_encontrada'
+# Sem co_prova nem cor, e o ano/área tem mais de uma prova.
+STATUS_PROVA_AMBIGUA = 'prova_ambigua'
+# A prova não tem itens para o idioma pedido (ou não tem itens).
+STATUS_SEM_ITENS = 'sem_itens'
+# Tipo, comprimento, caracteres ou padding LC das respostas.
+STATUS_RESPOSTAS_INVALIDAS = 'respostas_invalidas'
+
+COLUNAS_LOTE = (
+    'area', 'ano', 'respostas', 'lingua', 'co_prova', 'cor_prova', 'tipo_aplicacao',
+)
+_LINGUAS = {
+    **dict.fromkeys(("ingles", "inglês", "english", "0"), 0),
+    **dict.fromkeys(("espanhol", "español", "spanish", "1"), 1),
+}
+
 
 @dataclass
 class ResultadoNota:
@@ -48,6 +78,95 @@ class ResultadoNota:
         return f"ResultadoNota(nota={self.nota:.1f}, acertos={self.acertos}/{self.total_itens})"
 
 
+@dataclass
+class ResultadoLote:
+    """
+    Resultado de ``SimuladorNota.calcular_lote``, em colunas.
+
+    Uma posição por linha da entrada, na mesma ordem. Linhas com status
+    diferente de ``STATUS_OK`` têm nota e theta NaN, acertos, total_itens
+    e co_prova 0 (co_prova fica preenchido quando a prova foi resolvida).
+
+    Attributes:
+        status: código por linha (ver ``STATUS_*``)
+        mensagem: motivo da falha, como no erro de ``calcular`` (None se ok)
+        nota, theta: float64
+        acertos, total_itens, co_prova: int64
+    """
+    status: np.ndarray
+    mensagem: List[Optional[str]]
+    nota: np.ndarray
+    theta: np.ndarray
+    acertos: np.ndarray
+    total_itens: np.ndarray
+    co_prova: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.status)
+
+    @property
+    def ok(self) -> np.ndarray:
+        """Máscara das linhas calculadas."""
+        return np.asarray(self.status == STATUS_OK, dtype=bool)
+
+    def colunas(self) -> Dict[str, Any]:
+        """Colunas por nome, na ordem dos campos."""
+        return {
+            'status': self.status,
+            'mensagem': self.mensagem,
+            'nota': self.nota,
+            'theta': self.theta,
+            'acertos': self.acertos,
+            'total_itens': self.total_itens,
+            'co_prova': self.co_prova,
+        }
+
+    def para_dataframe(self):
+        """``pandas.DataFrame`` com as colunas de ``colunas()``."""
+        import pandas as pd
+
+        return pd.DataFrame(self.colunas())
+
+
+def _ausente(valor: Any) -> bool:
+    return valor is None or (isinstance(valor, float) and math.isnan(valor))
+
+
+def _colunas_lote(tabela: Any) -> Dict[str, list]:
+    """Colunas de um DataFrame, tabela Arrow, dict de colunas ou registros."""
+    if hasattr(tabela, 'to_pydict'):  # pyarrow.Table
+        colunas = {str(nome): list(valores) for nome, valores in tabela.to_pydict().items()}
+    elif hasattr(tabela, 'columns') and hasattr(tabela, 'notna'):  # pandas.DataFrame
+        colunas = {
+            str(nome): tabela[nome].astype(object).where(tabela[nome].notna(), None).tolist()
+            for nome in tabela.columns
+        }
+    elif isinstance(tabela, Mapping):
+        colunas = {str(nome): list(valores) for nome, valores in tabela.items()}
+    else:
+        registros = [dict(registro) for registro in tabela]
+        nomes = {nome for registro in registros for nome in registro}
+        colunas = {nome: [registro.get(nome) for registro in registros] for nome in nomes}
+
+    if not colunas:
+        return {nome: [] for nome in COLUNAS_LOTE}
+    for obrigatoria in ('area', 'ano', 'respostas'):
+        if obrigatoria not in colunas:
+            raise ValueError(f"calcular_lote: coluna obrigatória ausente: {obrigatoria!r}")
+    n = len(colunas['respostas'])
+    if any(len(valores) != n for valores in colunas.values()):
+        raise ValueError("calcular_lote: colunas com tamanhos diferentes")
+    for nome in COLUNAS_LOTE:
+        colunas.setdefault(nome, [None] * n)
+    return colunas
+
+
+def _mensagem(exc: Exception) -> str:
+    if isinstance(exc, KeyError) and exc.args:
+        return str(exc.args[0])
+    return str(exc)
+
+
 class SimuladorNota:
     """
     Simulador de Nota TRI do ENEM com interface simplificada.
@@ -88,6 +207,20 @@ class SimuladorNota:
             )
         raise ValueError(f"Área {area} não encontrada para {ano}")
     
+    @staticmethod
+    def _tp_lingua(area: str, lingua: Optional[str]) -> Optional[int]:
+        """TP_LINGUA de LC a partir do nome da língua (None nas outras áreas)."""
+        if area != "LC":
+            return None
+        if lingua is None:
+            raise ValueError("Para LC, informe lingua='ingles' ou 'espanhol'")
+        tp_lingua = _LINGUAS.get(str(lingua).strip().lower())
+        if tp_lingua is None:
+            raise ValueError(
+                f"Língua inválida: {lingua!r}. Use 'ingles' ou 'espanhol'."
+            )
+        return tp_lingua
+
     def calcular(
         self, 
         area: str, 
@@ -135,29 +268,13 @@ class SimuladorNota:
                     "Ao usar cor_prova, informe também tipo_aplicacao."
                 )
             # Usar mapeador para descobrir código
-            from .mapeador_provas import MapeadorProvas
-            mapeador = MapeadorProvas()
-            co_prova = mapeador.obter_codigo(ano, area, tipo_aplicacao, cor_prova)
+            from .mapeador_provas import obter_mapeador
+            co_prova = obter_mapeador().obter_codigo(ano, area, tipo_aplicacao, cor_prova)
         elif co_prova is None:
             # Auto-descoberta
             co_prova = self._descobrir_prova(ano, area)
 
-        if area == "LC":
-            if lingua is None:
-                raise ValueError("Para LC, informe lingua='ingles' ou 'espanhol'")
-            lingua_norm = str(lingua).strip().lower()
-            ingles = {"ingles", "inglês", "english", "0"}
-            espanhol = {"espanhol", "español", "spanish", "1"}
-            if lingua_norm in ingles:
-                tp_lingua = 0
-            elif lingua_norm in espanhol:
-                tp_lingua = 1
-            else:
-                raise ValueError(
-                    f"Língua inválida: {lingua!r}. Use 'ingles' ou 'espanhol'."
-                )
-        else:
-            tp_lingua = None
+        tp_lingua = self._tp_lingua(area, lingua)
 
         # Todo o cálculo é delegado ao CalculadorTRI, inclusive a redução da
         # string de LC de 50 para 45 posições e a filtragem de itens por idioma.
@@ -225,3 +342,146 @@ class SimuladorNota:
                 resultados[area.upper()] = {'erro': str(e)}
         
         return resultados
+
+    def _resolver_prova_lote(
+        self, ano: int, area: str, co_prova: Any, cor_prova: Any, tipo_aplicacao: Any,
+    ) -> Tuple[int, str, Optional[str]]:
+        """(co_prova, status, mensagem) pelas mesmas regras de ``calcular``."""
+        if not _ausente(co_prova):
+            return int(co_prova), STATUS_OK, None
+        if not _ausente(cor_prova):
+            if _ausente(tipo_aplicacao):
+                return 0, STATUS_ENTRADA_INVALIDA, (
+                    "Ao usar cor_prova, informe também tipo_aplicacao."
+                )
+            from .mapeador_provas import obter_mapeador
+            try:
+                codigo = obter_mapeador().obter_codigo(
+                    ano, area, str(tipo_aplicacao), str(cor_prova)
+                )
+            except KeyError as exc:
+                return 0, STATUS_PROVA_NAO_ENCONTRADA, _mensagem(exc)
+            return codigo, STATUS_OK, None
+        try:
+            return self._descobrir_prova(ano, area), STATUS_OK, None
+        except FileNotFoundError as exc:
+            return 0, STATUS_PROVA_NAO_ENCONTRADA, _mensagem(exc)
+        except ValueError as exc:
+            ambigua = len(self.listar_provas(ano, area).get(area, [])) > 1
+            status = STATUS_PROVA_AMBIGUA if ambigua else STATUS_PROVA_NAO_ENCONTRADA
+            return 0, status, _mensagem(exc)
+
+    def calcular_lote(self, tabela: Any) -> ResultadoLote:
+        """
+        Calcula as notas de uma tabela de participantes em uma chamada.
+
+        Cada linha segue as regras de ``calcular``, mas falhas não
+        interrompem o lote: ficam em ``status``/``mensagem`` da linha. As
+        provas são resolvidas uma vez por combinação distinta de (ano, área,
+        co_prova, cor, tipo); as linhas são agrupadas por (ano, área,
+        co_prova, língua) e cada grupo é pareado e estimado de uma vez pelo
+        EAP em lote de ``CalculadorTRI``.
+
+        Args:
+            tabela: ``pandas.DataFrame``, tabela Arrow, dict de colunas ou
+                iterável de registros (dicts), com as colunas de
+                ``COLUNAS_LOTE``: ``area``, ``ano`` e ``respostas``
+                obrigatórias; ``lingua`` para LC; ``co_prova`` ou
+                ``cor_prova`` + ``tipo_aplicacao`` (ou nenhuma, quando o ano
+                tem uma única prova da área). Valores ausentes: None ou NaN.
+
+        Returns:
+            ResultadoLote com uma posição por linha, na ordem da entrada
+
+        Raises:
+            ValueError: coluna obrigatória ausente ou colunas de tamanhos
+                diferentes
+        """
+        colunas = _colunas_lote(tabela)
+        n = len(colunas['respostas'])
+        status = np.full(n, STATUS_OK, dtype=object)
+        mensagem: List[Optional[str]] = [None] * n
+        nota = np.full(n, np.nan)
+        theta = np.full(n, np.nan)
+        acertos = np.zeros(n, dtype=np.int64)
+        total_itens = np.zeros(n, dtype=np.int64)
+        co_prova = np.zeros(n, dtype=np.int64)
+
+        def falhar(linhas, codigo: str, texto: Optional[str]) -> None:
+            for linha in linhas:
+                status[linha] = codigo
+                mensagem[linha] = texto
+
+        # Resolução da prova e da língua, uma vez por combinação distinta.
+        resolvidas: Dict[tuple, Tuple[int, str, Optional[str]]] = {}
+        grupos: Dict[Tuple[int, str, int, Optional[int]], List[int]] = {}
+        for linha in range(n):
+            ano, area = colunas['ano'][linha], colunas['area'][linha]
+            if _ausente(ano) or _ausente(area):
+                falhar([linha], STATUS_ENTRADA_INVALIDA, "Informe ano e area.")
+                continue
+            try:
+                ano = int(ano)
+            except (TypeError, ValueError):
+                falhar([linha], STATUS_ENTRADA_INVALIDA, f"Ano inválido: {ano!r}")
+                continue
+            area = str(area).upper()
+            chave = (
+                ano, area, colunas['co_prova'][linha], colunas['cor_prova'][linha],
+                colunas['tipo_aplicacao'][linha],
+            )
+            chave = tuple(None if _ausente(valor) else valor for valor in chave)
+            if chave not in resolvidas:
+                try:
+                    resolvidas[chave] = self._resolver_prova_lote(*chave)
+                except (TypeError, ValueError) as exc:
+                    resolvidas[chave] = (0, STATUS_ENTRADA_INVALIDA, _mensagem(exc))
+            codigo, situacao, texto = resolvidas[chave]
+            co_prova[linha] = codigo
+            if situacao != STATUS_OK:
+                falhar([linha], situacao, texto)
+                continue
+            lingua = colunas['lingua'][linha]
+            try:
+                tp_lingua = self._tp_lingua(area, None if _ausente(lingua) else lingua)
+            except ValueError as exc:
+                falhar([linha], STATUS_ENTRADA_INVALIDA, _mensagem(exc))
+                continue
+            grupos.setdefault((ano, area, codigo, tp_lingua), []).append(linha)
+
+        # Pareamento e EAP em lote por prova e idioma.
+        for (ano, area, codigo, tp_lingua), linhas in grupos.items():
+            respostas = [colunas['respostas'][linha] for linha in linhas]
+            try:
+                itens, matriz, erros = self._calc.parear_respostas_batch(
+                    ano, area, codigo, respostas, tp_lingua
+                )
+            except (FileNotFoundError, KeyError, ValueError) as exc:
+                falhar(linhas, STATUS_SEM_ITENS, _mensagem(exc))
+                continue
+            linhas = np.asarray(linhas)
+            for linha, resposta in zip(linhas[erros], np.asarray(respostas, dtype=object)[erros]):
+                try:
+                    self._calc._preparar_calculo(ano, area, codigo, resposta, tp_lingua)
+                    texto = "respostas inválidas"
+                except (TypeError, ValueError) as exc:
+                    texto = _mensagem(exc)
+                falhar([linha], STATUS_RESPOSTAS_INVALIDAS, texto)
+            validas = linhas[~erros]
+            if len(validas) == 0:
+                continue
+            thetas = self._calc.estimar_theta_eap_batch(matriz[~erros], itens)
+            theta[validas] = thetas
+            nota[validas] = self._calc.transformar_escala_batch(thetas, ano, area, codigo)
+            acertos[validas] = matriz[~erros][:, itens.ativos].sum(axis=1)
+            total_itens[validas] = itens.n_ativos
+
+        return ResultadoLote(
+            status=status,
+            mensagem=mensagem,
+            nota=nota,
+            theta=theta,
+            acertos=acertos,
+            total_itens=total_itens,
+            co_prova=co_prova,
+        )
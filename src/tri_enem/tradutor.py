@@ -13,10 +13,17 @@ O tradutor garante que o usuário sempre forneça 45 respostas e
 mapeia corretamente para os itens da prova.
 """
 
-import pandas as pd
-from typing import List, Tuple
+from __future__ import annotations
+
+import numpy as np
+from typing import TYPE_CHECKING, List, Sequence, Set, Tuple, Union
 from dataclasses import dataclass
 
+from .pacote_itens import ColunasItens
+
+if TYPE_CHECKING:
+    import pandas as pd
+
 
 @dataclass
 class ConfiguracaoLC:
@@ -90,7 +97,56 @@ def filtrar_itens_lc(df_itens: pd.DataFrame, co_prova: int, tp_lingua: int, conf
     Returns:
         DataFrame com 45 itens ordenados por posição
     """
-    lc = df_itens[(df_itens['SG_AREA'] == 'LC') & (df_itens['CO_PROVA'] == co_prova)].copy()
+    colunas = ColunasItens.de_dataframe(df_itens)
+    linhas = np.flatnonzero(
+        np.asarray(colunas["SG_AREA"] == "LC", dtype=bool)
+        & np.asarray(colunas["CO_PROVA"] == co_prova, dtype=bool)
+    )
+    return df_itens.iloc[
+        filtrar_linhas_lc(colunas, linhas, co_prova, tp_lingua, config)
+    ]
+
+
+def deduplicar_itens_por_posicao(lc: pd.DataFrame) -> pd.DataFrame:
+    """Versão em ``DataFrame`` de ``deduplicar_linhas_por_posicao``."""
+    return lc.iloc[
+        deduplicar_linhas_por_posicao(
+            ColunasItens.de_dataframe(lc), np.arange(len(lc))
+        )
+    ]
+
+
+def _linguas(colunas: ColunasItens, linhas: np.ndarray) -> Set[int]:
+    """Idiomas (0/1) com TP_LINGUA preenchido entre as linhas."""
+    if "TP_LINGUA" not in colunas:
+        return set()
+    return {
+        int(valor) for valor in colunas["TP_LINGUA"][linhas].tolist()
+        if valor == valor and int(valor) in (0, 1)
+    }
+
+
+def filtrar_linhas_lc(
+    colunas: ColunasItens,
+    linhas: np.ndarray,
+    co_prova: int,
+    tp_lingua: int,
+    config: ConfiguracaoLC,
+) -> np.ndarray:
+    """
+    Linhas dos 45 itens de uma prova LC no idioma pedido, sem pandas.
+
+    Args:
+        colunas: Colunas do arquivo de itens do ano
+        linhas: Linhas da prova (ver ``IndiceProvas.linhas``)
+        co_prova: Código da prova, para a mensagem de erro
+        tp_lingua: 0=inglês, 1=espanhol
+        config: Configuração LC do ano
+
+    Returns:
+        Linhas ordenadas por posição (ver ``deduplicar_linhas_por_posicao``)
+    """
+    linhas = np.asarray(linhas, dtype=np.int64)
 
     # As provas digitais de LC de 2020 (691–694) armazenam dois cadernos
     # completos sob o mesmo CO_PROVA. Nesse caso TP_VERSAO_DIGITAL não é uma
@@ -99,33 +155,21 @@ def filtrar_itens_lc(df_itens: pd.DataFrame, co_prova: int, tp_lingua: int, conf
     # Selecionar sempre a versão menor desalinha toda a prova de espanhol.
     if (
         config.tem_tp_lingua_itens
-        and "TP_VERSAO_DIGITAL" in lc.columns
+        and "TP_VERSAO_DIGITAL" in colunas
         and tp_lingua in (0, 1)
     ):
-        versao = lc[
-            pd.to_numeric(
-                lc["TP_VERSAO_DIGITAL"], errors="coerce"
-            ).eq(tp_lingua)
-        ]
+        versao = linhas[colunas.numerico("TP_VERSAO_DIGITAL")[linhas] == tp_lingua]
         if (
             len(versao) == 45
-            and versao["CO_POSICAO"].nunique() == 45
-            and tp_lingua
-            in {
-                int(valor)
-                for valor in versao["TP_LINGUA"].dropna().unique()
-                if int(valor) in (0, 1)
-            }
+            and len(np.unique(colunas["CO_POSICAO"][versao])) == 45
+            and tp_lingua in _linguas(colunas, versao)
         ):
-            lc = versao
+            linhas = versao
 
     # Não troca silenciosamente o idioma solicitado. Algumas provas especiais
     # oferecem apenas uma língua (por exemplo 2012/LC/165).
-    if config.tem_tp_lingua_itens and 'TP_LINGUA' in lc.columns:
-        disponiveis = {
-            int(valor) for valor in lc["TP_LINGUA"].dropna().unique()
-            if int(valor) in (0, 1)
-        }
+    if config.tem_tp_lingua_itens and "TP_LINGUA" in colunas:
+        disponiveis = _linguas(colunas, linhas)
         if tp_lingua not in disponiveis:
             nomes = {0: "inglês", 1: "espanhol"}
             ofertadas = ", ".join(nomes[x] for x in sorted(disponiveis)) or "nenhuma"
@@ -133,12 +177,18 @@ def filtrar_itens_lc(df_itens: pd.DataFrame, co_prova: int, tp_lingua: int, conf
                 f"Prova LC {co_prova} não oferece "
                 f"{nomes.get(tp_lingua, tp_lingua)}; disponível: {ofertadas}"
             )
-        lc = lc[(pd.isna(lc['TP_LINGUA'])) | (lc['TP_LINGUA'] == tp_lingua)]
+        lingua = colunas["TP_LINGUA"][linhas]
+        linhas = linhas[
+            np.asarray(lingua != lingua, dtype=bool)
+            | np.asarray(lingua == tp_lingua, dtype=bool)
+        ]
 
-    return deduplicar_itens_por_posicao(lc)
+    return deduplicar_linhas_por_posicao(colunas, linhas)
 
 
-def deduplicar_itens_por_posicao(lc: pd.DataFrame) -> pd.DataFrame:
+def deduplicar_linhas_por_posicao(
+    colunas: ColunasItens, linhas: np.ndarray
+) -> np.ndarray:
     """
     Ordena por posição e escolhe deterministicamente a primeira ocorrência.
 
@@ -148,14 +198,70 @@ def deduplicar_itens_por_posicao(lc: pd.DataFrame) -> pd.DataFrame:
     calculáveis, conservamos a primeira coleção na ordem oficial normalizada.
     A precisão observada dessas provas permanece registrada no catálogo e deve
     ser mostrada como aviso junto da estimativa.
+
+    Mesma ordem de ``sort_values(kind="stable")`` (TP_VERSAO_DIGITAL ausente
+    primeiro) seguido de ``drop_duplicates(keep="first")``.
     """
-    if 'TP_VERSAO_DIGITAL' in lc.columns:
-        lc = lc.sort_values(by=['CO_POSICAO', 'TP_VERSAO_DIGITAL'],
-                            na_position='first', kind='stable')
+    linhas = np.asarray(linhas, dtype=np.int64)
+    posicao = colunas["CO_POSICAO"][linhas]
+    if "TP_VERSAO_DIGITAL" in colunas:
+        versao = colunas.numerico("TP_VERSAO_DIGITAL")[linhas]
+        preenchida = ~np.isnan(versao)
+        ordem = np.lexsort((np.where(preenchida, versao, 0.0), preenchida, posicao))
     else:
-        lc = lc.sort_values('CO_POSICAO', kind='stable')
+        ordem = np.argsort(posicao, kind="stable")
+    posicao = posicao[ordem]
+    primeira = np.ones(len(ordem), dtype=bool)
+    primeira[1:] = posicao[1:] != posicao[:-1]
+    return linhas[ordem[primeira]]
+
+
+def filtrar_respostas_lc_lote(
+    respostas: Sequence[str],
+    tp_lingua: Union[int, float, Sequence],
+    config: ConfiguracaoLC,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Versão em lote de ``filtrar_respostas_lc``, sem laço em Python.
+
+    As strings são vistas como uma matriz de códigos Unicode de largura fixa
+    e o bloco "99999" é conferido e removido por fatias de colunas. As regras
+    são as do caminho escalar: 45 caracteres passam inalterados; com 50,
+    TP_LINGUA=0 remove as posições 5-9 e qualquer outro valor remove 0-4.
+
+    Args:
+        respostas: Strings de respostas (45 ou 50 chars)
+        tp_lingua: Escalar ou um valor por linha (NaN/None = não informado)
+        config: Configuração LC do ano
+
+    Returns:
+        (codigos, erros): matriz uint32 N × 45 com os códigos dos caracteres
+        (aceita por ``BancoItens.acertos_lote``) e máscara das linhas sem o
+        padding exigido. Como a matriz tem 45 colunas, comprimentos
+        diferentes de 45 e 50 (rejeitados adiante no caminho escalar) também
+        são marcados. Linhas com erro ficam zeradas.
+    """
+    # Uma coluna extra distingue 50 caracteres de strings mais longas.
+    textos = np.asarray(respostas, dtype="<U51").reshape(-1)
+    n = len(textos)
+    comprimento = np.char.str_len(textos)
+    codigos = textos.view(np.uint32).reshape(n, 51)
+    ingles = np.broadcast_to(np.asarray(tp_lingua, dtype=float) == 0, (n,))
+
+    noves = codigos == ord("9")
+    com_padding = comprimento == 50
+    padding_ok = np.where(
+        ingles, noves[:, 5:10].all(axis=1), noves[:, 0:5].all(axis=1)
+    )
+    erros = (com_padding & ~padding_ok) | (~com_padding & (comprimento != 45))
 
-    return lc.drop_duplicates(subset=["CO_POSICAO"], keep="first")
+    resultado = codigos[:, :45].copy()
+    linhas = com_padding & ingles
+    resultado[linhas, 5:] = codigos[linhas, 10:50]
+    linhas = com_padding & ~ingles
+    resultado[linhas] = codigos[linhas, 5:50]
+    resultado[erros] = 0
+    return resultado, erros
 
 
 def mapear_respostas_para_itens(respostas_45: str, itens: pd.DataFrame) -> List[Tuple[int, str, str]]:
@@ -6,6 +6,7 @@ Wrapper para integração com o módulo tri_enem.
 Facilita o uso do calculador TRI no contexto do Streamlit.
 """
 
+import os
 import sys
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
@@ -22,8 +23,12 @@ from tri_enem.config import NOMES_AREAS
 
 @st.cache_resource(show_spinner=False)
 def _criar_calculador():
-    """Cria instância do CalculadorTRI com cache."""
-    return CalculadorTRI()
+    """Cria instância do CalculadorTRI com cache.
+
+    Com ``TRI_ENEM_SEGMENTO`` apontando para um segmento publicado por
+    ``tools/publicar_segmento.py``, os workers compartilham bancos e tabelas.
+    """
+    return CalculadorTRI(segmento=os.environ.get("TRI_ENEM_SEGMENTO") or None)
 
 
 @st.cache_resource(show_spinner=False)
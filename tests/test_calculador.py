@@ -18,7 +18,13 @@ Organizam-se em três camadas:
    configuração de itens.
 """
 
+import copy
 import json
+import os
+import pickle
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import numpy as np
@@ -29,7 +35,12 @@ import _utils
 _utils.add_src_to_path()
 
 from tri_enem import CalculadorTRI  # noqa: E402
-from tri_enem.calculador import ItemTRI  # noqa: E402
+from tri_enem.calculador import BancoItens, ItemTRI  # noqa: E402
+from tri_enem.coeficientes import (  # noqa: E402
+    aplicar_transformacao,
+    obter_transformacao,
+)
+from tri_enem.eap import TabelaVerossimilhanca, log_probabilidades_ml3  # noqa: E402
 
 
 FIXTURES = Path(__file__).resolve().parent / "fixtures"
@@ -176,6 +187,110 @@ class TestProbabilidadeAcerto:
         assert calc.probabilidade_acerto(-1e6, item) == self._item(a=100.0).param_c
 
 
+class TestNucleoML3:
+    """O núcleo vetorizado reproduz o caminho escalar item a item."""
+
+    def test_tabelas_batem_com_probabilidade_escalar(self, calc):
+        banco = calc.carregar_itens(2023, "MT", 1211)
+        log_p, log_q = log_probabilidades_ml3(
+            calc._pontos_quad, banco.param_a, banco.param_b, banco.param_c,
+            calc.D,
+        )
+        assert log_p.shape == log_q.shape == (calc.N_QUADRATURA, len(banco))
+        for k in (0, 17, 40, 79):
+            theta = calc._pontos_quad[k]
+            for idx in (0, 22, 44):
+                p = np.clip(
+                    calc.probabilidade_acerto(theta, banco[idx]),
+                    1e-15, 1 - 1e-15,
+                )
+                assert log_p[k, idx] == pytest.approx(np.log(p), rel=1e-12)
+                assert log_q[k, idx] == pytest.approx(np.log(1 - p), rel=1e-12)
+
+    def test_guardas_de_expoente_sem_overflow(self):
+        with np.errstate(over="raise"):
+            log_p, log_q = log_probabilidades_ml3(
+                np.asarray([-1e6, 1e6]), np.asarray([100.0]),
+                np.asarray([0.0]), np.asarray([0.25]),
+            )
+        assert np.exp(log_p[0, 0]) == pytest.approx(0.25)
+        assert np.exp(log_p[1, 0]) == pytest.approx(1.0)
+        assert np.exp(log_q[1, 0]) == pytest.approx(1e-15, rel=1e-3)
+
+
+class TestTabelasVerossimilhanca:
+    """Tabelas por prova: calculadas uma vez e mantidas em LRU limitado."""
+
+    def test_tabela_reproduz_log_verossimilhanca(self, calc):
+        banco = calc.carregar_itens(2023, "MT", 1211)
+        respostas = calc.converter_respostas(RESPOSTAS_MT_2023, banco)
+        log_l = calc._tabela(banco).log_verossimilhanca(banco.canonico(respostas))[0]
+        for k in (0, 40, 79):
+            assert log_l[k] == pytest.approx(
+                calc.log_verossimilhanca(calc._pontos_quad[k], respostas, banco),
+                rel=1e-12,
+            )
+
+    def test_tabela_fica_em_cache_por_prova(self, calc):
+        banco = calc.carregar_itens(2023, "CH", 1191)
+        assert calc._tabela(banco) is calc._tabela(banco)
+
+    def test_lru_respeita_capacidade(self):
+        calculador = CalculadorTRI(max_tabelas=2)
+        # Três aplicações distintas de MT 2023 (cores 1211, 1217 e 1219).
+        bancos = [
+            calculador.carregar_itens(2023, "MT", co_prova)
+            for co_prova in (1211, 1217, 1219)
+        ]
+        for banco in bancos:
+            calculador._tabela(banco)
+        assert list(calculador._cache_tabelas) == [
+            bancos[1].assinatura,
+            bancos[2].assinatura,
+        ]
+
+    def test_cores_da_mesma_aplicacao_compartilham_tabela(self, calc):
+        azul = calc.carregar_itens(2023, "MT", 1211)
+        outra_cor = calc.carregar_itens(2023, "MT", 1212)
+        assert not np.array_equal(azul.co_item, outra_cor.co_item)
+        assert azul.assinatura == outra_cor.assinatura
+        assert calc._tabela(azul) is calc._tabela(outra_cor)
+        np.testing.assert_array_equal(
+            azul.canonico(azul.co_item), outra_cor.canonico(outra_cor.co_item)
+        )
+
+    def test_tabela_da_prova_vem_da_tabela_do_ano(self, calc):
+        banco = calc.carregar_itens(2023, "LC", 1201, tp_lingua=1)
+        tabela = calc._tabela(banco)
+        compilada = TabelaVerossimilhanca.compilar(
+            calc._pontos_quad,
+            banco.canonico(banco.param_a),
+            banco.canonico(banco.param_b),
+            banco.canonico(banco.param_c),
+            banco.canonico(banco.ativos),
+        )
+        np.testing.assert_array_equal(tabela.delta, compilada.delta)
+        np.testing.assert_allclose(tabela.base, compilada.base, rtol=1e-13)
+
+    def test_provas_do_ano_nao_recompilam_o_ml3(self, monkeypatch):
+        calculador = CalculadorTRI()
+        calculador._tabela_ano(2023)
+
+        def proibido(*args, **kwargs):
+            raise AssertionError("tabela compilada por prova")
+
+        monkeypatch.setattr(TabelaVerossimilhanca, "compilar", proibido)
+        for area, provas in calculador.listar_provas(2023).items():
+            tp_lingua = 0 if area == "LC" else None
+            for co_prova in provas[:5]:
+                calculador._tabela(calculador.carregar_itens(2023, area, co_prova, tp_lingua))
+
+    def test_lista_de_itens_nao_entra_no_cache(self, calc):
+        antes = len(calc._cache_tabelas)
+        calc.estimar_theta_eap([1] * 5, TestEstimacaoEAP._prova(5))
+        assert len(calc._cache_tabelas) == antes
+
+
 class TestEstimacaoEAP:
     """Propriedades da estimacao Expected a Posteriori."""
 
@@ -328,12 +443,307 @@ class TestCarregarItens:
         with pytest.raises(ValueError, match="não oferece espanhol"):
             calc.carregar_itens(2012, "LC", 165, tp_lingua=1)
 
+    @pytest.mark.parametrize("ano", [2009, 2013, 2020, 2025])
+    def test_indice_de_provas_igual_as_mascaras(self, calc, ano):
+        df = calc._carregar_df_itens(ano)
+        esperado = {
+            a: sorted(df[df["SG_AREA"] == a]["CO_PROVA"].unique().tolist())
+            for a in df["SG_AREA"].unique()
+        }
+        assert calc.listar_provas(ano) == esperado
+        assert list(calc.listar_provas(ano)) == list(esperado)
+        assert calc.listar_provas(ano, "mt") == {"MT": esperado["MT"]}
+        indice = calc._indice_provas(ano)
+        for (area, prova), linhas in indice.linhas_por_prova.items():
+            mascara = (df["SG_AREA"] == area) & (df["CO_PROVA"] == prova)
+            assert linhas.tolist() == np.flatnonzero(mascara.to_numpy()).tolist()
+
+    def test_indice_do_csv_igual_ao_do_pacote(self, calc, tmp_path):
+        origem = calc.base_path / "2020" / "ITENS_PROVA_2020.csv"
+        (tmp_path / "2020").mkdir()
+        (tmp_path / "2020" / "ITENS_PROVA_2020.csv").write_bytes(origem.read_bytes())
+        externo = CalculadorTRI(str(tmp_path))
+        assert externo.listar_provas(2020) == calc.listar_provas(2020)
+        for lingua in (0, 1):
+            assert externo.carregar_itens(2020, "LC", 692, lingua).assinatura == (
+                calc.carregar_itens(2020, "LC", 692, lingua).assinatura
+            )
+
+    def test_dedup_em_colunas_igual_ao_do_dataframe(self):
+        import pandas as pd
+        from tri_enem.pacote_itens import ColunasItens
+        from tri_enem.tradutor import deduplicar_linhas_por_posicao
+
+        df = pd.DataFrame({
+            "CO_POSICAO": [3, 1, 3, 2, 1, 3, 2],
+            "TP_VERSAO_DIGITAL": [1.0, np.nan, 0.0, 1.0, 0.0, np.nan, 1.0],
+            "CO_ITEM": [10, 11, 12, 13, 14, 15, 16],
+        })
+        esperado = df.sort_values(
+            by=["CO_POSICAO", "TP_VERSAO_DIGITAL"], na_position="first", kind="stable"
+        ).drop_duplicates(subset=["CO_POSICAO"], keep="first")
+        linhas = deduplicar_linhas_por_posicao(
+            ColunasItens.de_dataframe(df), np.arange(len(df))
+        )
+        assert linhas.tolist() == esperado.index.tolist()
+
+
+class TestBancoItens:
+    """O banco compilado substitui a lista de ItemTRI sem mudar a interface."""
+
+    def test_arrays_contiguos_e_somente_leitura(self, calc):
+        banco = calc.carregar_itens(2023, "MT", 1211)
+        assert isinstance(banco, BancoItens)
+        assert banco.chave == (2023, "MT", 1211, None)
+        assert banco.gabarito.dtype == np.uint8
+        for campo in ("param_a", "param_b", "param_c", "posicao", "co_item"):
+            array = getattr(banco, campo)
+            assert array.flags.c_contiguous
+            with pytest.raises(ValueError):
+                array[0] = 0
+
+    def test_continua_se_comportando_como_lista_de_itens(self, calc):
+        banco = calc.carregar_itens(2023, "LC", 1201, tp_lingua=1)
+        itens = list(banco)
+        assert len(itens) == len(banco) == 45
+        assert all(isinstance(item, ItemTRI) for item in itens)
+        assert [item.posicao for item in itens] == banco.posicao.tolist()
+        assert banco[-1].posicao == itens[-1].posicao
+
+    def test_item_materializado_nao_altera_o_banco(self, calc):
+        banco = calc.carregar_itens(2023, "CN", 1221)
+        item = banco[0]
+        item.abandonado = True
+        assert not banco.abandonado[0]
+
+    def test_recompilar_lista_preserva_resultado(self, calc):
+        banco = calc.carregar_itens(2023, "MT", 1211)
+        respostas = calc.converter_respostas(RESPOSTAS_MT_2023, banco)
+        recompilado = BancoItens.de_itens(list(banco))
+        assert calc.estimar_theta_eap(respostas, recompilado) == pytest.approx(
+            calc.estimar_theta_eap(respostas, banco), abs=1e-12
+        )
+
+    def test_anulado_sem_co_item_de_2009_preserva_o_pareamento(self, calc):
+        banco = calc.carregar_itens(2009, "LC", 57)
+        assert len(banco) == 45
+        assert banco.n_ativos == 44
+        assert banco.co_item[banco.abandonado].tolist() == [0]
+
+
+class TestPosterior:
+    """Desvio padrão e intervalo de credibilidade saem da mesma posterior."""
+
+    def test_theta_identico_ao_caminho_sem_posterior(self, calc):
+        itens, respostas, _ = calc._preparar_calculo(2023, "MT", 1211, RESPOSTAS_MT_2023)
+        resumo = calc.estimar_theta_eap(respostas, itens, posterior=True)
+        assert resumo["theta"] == calc.estimar_theta_eap(respostas, itens)
+        assert resumo["theta_inf"] < resumo["theta"] < resumo["theta_sup"]
+
+    def test_confere_com_integracao_em_grade_densa(self, calc):
+        itens, respostas, _ = calc._preparar_calculo(2023, "MT", 1211, RESPOSTAS_MT_2023)
+        resumo = calc.estimar_theta_eap(respostas, itens, posterior=True)
+
+        grade = np.linspace(-7, 7, 40001)
+        log_p, log_q = log_probabilidades_ml3(
+            grade, itens.param_a[itens.ativos], itens.param_b[itens.ativos],
+            itens.param_c[itens.ativos],
+        )
+        u = np.asarray(respostas)[itens.ativos]
+        log_l = log_p @ u + log_q @ (1 - u)
+        densidade = np.exp(log_l - log_l.max() - grade**2 / 2)
+        densidade /= densidade.sum()
+        media = densidade @ grade
+        dp = np.sqrt(densidade @ (grade - media) ** 2)
+        inf, sup = np.interp([0.025, 0.975], np.cumsum(densidade), grade)
+
+        assert resumo["dp"] == pytest.approx(dp, abs=1e-4)
+        assert resumo["theta_inf"] == pytest.approx(inf, abs=0.1)
+        assert resumo["theta_sup"] == pytest.approx(sup, abs=0.1)
+
+    def test_lote_igual_ao_escalar(self, calc):
+        itens, matriz = calc.preparar_respostas_batch(
+            2023, "MT", 1211, TestAnaliseEmLote.RESPOSTAS
+        )
+        lote = calc.estimar_theta_eap_batch(matriz, itens, posterior=True, nivel=0.8)
+        np.testing.assert_array_equal(lote["theta"], calc.estimar_theta_eap_batch(matriz, itens))
+        for linha, respostas in enumerate(matriz):
+            escalar = calc.estimar_theta_eap(respostas, itens, posterior=True, nivel=0.8)
+            for nome, valor in escalar.items():
+                assert lote[nome][linha] == pytest.approx(valor, abs=1e-12)
+
+    def test_calcular_nota_traz_intervalo_na_escala_enem(self, calc):
+        r = calc.calcular_nota(2023, "MT", 1211, RESPOSTAS_MT_2023, intervalo=True)
+        assert r["nota_inf"] < r["nota"] < r["nota_sup"]
+        assert r["dp_theta"] > 0
+
+    def test_intervalo_e_opcional_e_nao_muda_a_nota(self, calc):
+        simples = calc.calcular_nota(2023, "MT", 1211, RESPOSTAS_MT_2023)
+        completo = calc.calcular_nota(
+            2023, "MT", 1211, RESPOSTAS_MT_2023, intervalo=True
+        )
+        assert not {"dp_theta", "nota_inf", "nota_sup"} & set(simples)
+        assert simples["theta"] == pytest.approx(completo["theta"], abs=1e-12)
+        assert simples["nota"] == pytest.approx(completo["nota"], abs=1e-9)
+
+    def test_rejeita_nivel_invalido(self, calc):
+        with pytest.raises(ValueError, match="nivel"):
+            calc.estimar_theta_eap([0] * 45, calc.carregar_itens(2023, "MT", 1211),
+                                   posterior=True, nivel=1.0)
+
+
+class TestTransformacoes:
+    """Transformações compiladas: vetorizadas e fiéis ao contrato escalar."""
+
+    @pytest.mark.parametrize("chave", [(2009, "CH", 53), (2023, "MT", 1211)])
+    def test_array_igual_ao_escalar_com_extrapolacao(self, chave):
+        transformacao = obter_transformacao(*chave)
+        thetas = np.linspace(-8, 8, 161)
+        como_dict = dict(transformacao)
+        escalares = [aplicar_transformacao(float(t), como_dict) for t in thetas]
+        assert np.array_equal(transformacao(thetas), escalares)
+        assert isinstance(transformacao(0.5), float)
+        assert np.all(np.diff(transformacao(thetas)) >= 0)
+
+    def test_compilada_uma_vez_por_prova(self):
+        assert obter_transformacao(2009, "ch", 53) is obter_transformacao(2009, "CH", 53)
+        assert obter_transformacao(2009, "CH", 53)["tipo"] == "monotonica_linear"
+
+    @staticmethod
+    def _substituir_catalogo(destino, dados):
+        temporario = destino.with_suffix(".tmp")
+        temporario.write_text(json.dumps(dados), encoding="utf-8")
+        os.replace(temporario, destino)
+
+    def test_substituicao_do_catalogo_atualiza_coeficientes_de_area(
+        self, tmp_path, monkeypatch
+    ):
+        from tri_enem import catalogo
+        from tri_enem.coeficientes import _coeficientes_area, _coeficientes_padrao
+
+        dados = json.loads(catalogo.DATA_FILE.read_text(encoding="utf-8"))
+        copia = tmp_path / "coeficientes_data.json"
+        self._substituir_catalogo(copia, dados)
+        monkeypatch.setattr(catalogo, "DATA_FILE", copia)
+        versao = catalogo.chave_catalogo()
+        assert _coeficientes_area(versao)[(2023, "MT")][0] == pytest.approx(
+            dados["por_area"]["2023,MT"]["slope"]
+        )
+
+        dados["por_area"]["2023,MT"]["slope"] = 150.0
+        dados["metadata"]["MT"]["slope_medio"] = 140.0
+        self._substituir_catalogo(copia, dados)
+        versao = catalogo.chave_catalogo()
+        assert _coeficientes_area(versao)[(2023, "MT")][0] == 150.0
+        assert _coeficientes_padrao(versao)["MT"][0] == 140.0
+
+    def test_substituicao_do_catalogo_atualiza_transformacao_compilada(
+        self, tmp_path, monkeypatch
+    ):
+        from tri_enem import catalogo
+
+        dados = json.loads(catalogo.DATA_FILE.read_text(encoding="utf-8"))
+        copia = tmp_path / "coeficientes_data.json"
+        self._substituir_catalogo(copia, dados)
+        monkeypatch.setattr(catalogo, "DATA_FILE", copia)
+        antes = obter_transformacao(2023, "MT", 1211)
+        assert obter_transformacao(2023, "MT", 1211) is antes
+
+        dados["por_prova"]["2023,MT,1211"]["transformacao"] = {
+            "tipo": "linear", "slope": 150.0, "intercept": 480.0,
+        }
+        dados["por_area"]["2023,MT"]["slope"] = 151.0
+        self._substituir_catalogo(copia, dados)
+        depois = obter_transformacao(2023, "MT", 1211)
+        assert (depois["slope"], depois(0.0)) == (150.0, 480.0)
+        assert obter_transformacao(2023, "MT")["slope"] == 151.0
+
+    @pytest.mark.parametrize("alterar", [
+        lambda t: t.__setitem__("slope", 1.0),
+        lambda t: t.update(slope=1.0),
+        lambda t: t.pop("slope"),
+        lambda t: t.setdefault("novo", 1),
+        lambda t: t.__delitem__("slope"),
+        lambda t: t.clear(),
+    ])
+    def test_transformacao_compartilhada_e_somente_leitura(self, alterar):
+        transformacao = obter_transformacao(2009, "CH", 53)
+        nota = transformacao(0.5)
+        with pytest.raises(TypeError, match="somente leitura"):
+            alterar(transformacao)
+        assert obter_transformacao(2009, "CH", 53)(0.5) == nota
+        copia = dict(transformacao)
+        copia["slope"] = 1.0
+        assert copy.deepcopy(transformacao) == transformacao
+        assert pickle.loads(pickle.dumps(transformacao))(0.5) == nota
+
+    def test_analise_usa_a_mesma_escala_do_lote(self, calc):
+        analise = calc.analisar_todas_questoes(2023, "MT", 1211, RESPOSTAS_MT_2023)
+        nota = calc.calcular_nota(2023, "MT", 1211, RESPOSTAS_MT_2023)["nota"]
+        assert analise["nota"] == pytest.approx(nota, abs=1e-12)
+
+
+class TestPareamentoEmLote:
+    """`parear_respostas_batch` segue as regras de `_preparar_calculo` linha a linha."""
+
+    def test_igual_ao_pareamento_individual(self, calc):
+        itens, matriz, erros = calc.parear_respostas_batch(
+            2023, "MT", 1211, [RESPOSTAS_MT_2023, RESPOSTAS_MT_2023.lower(), "." * 45]
+        )
+        assert matriz.dtype == np.int8
+        assert not erros.any()
+        for linha, respostas in zip(matriz, [RESPOSTAS_MT_2023] * 2 + ["." * 45]):
+            assert linha.tolist() == calc.converter_respostas(respostas, itens)
+
+    def test_marca_linhas_invalidas_sem_interromper(self, calc):
+        respostas = [
+            RESPOSTAS_MT_2023,
+            RESPOSTAS_MT_2023[:-1],
+            RESPOSTAS_MT_2023 + "A",
+            RESPOSTAS_MT_2023[:-1] + "F",
+            RESPOSTAS_MT_2023[:-1] + "é",
+            None,
+        ]
+        _, matriz, erros = calc.parear_respostas_batch(2023, "MT", 1211, respostas)
+        assert erros.tolist() == [False, True, True, True, True, True]
+        assert not matriz[erros].any()
+
+    def test_lc_50_com_padding_invalido_e_marcada(self, calc):
+        caso = next(
+            c for c in CASOS if c["area"] == "LC" and len(c["respostas"]) == 50
+        )
+        invalida = "ABCDE" * 10
+        itens, matriz, erros = calc.parear_respostas_batch(
+            caso["ano"], "LC", caso["co_prova"], [caso["respostas"], invalida],
+            caso["tp_lingua"],
+        )
+        assert erros.tolist() == [False, True]
+        _, binaria, _ = calc._preparar_calculo(
+            caso["ano"], "LC", caso["co_prova"], caso["respostas"], caso["tp_lingua"]
+        )
+        assert matriz[0].tolist() == binaria
+
+    def test_preparar_mantem_o_erro_da_primeira_linha_invalida(self, calc):
+        with pytest.raises(ValueError, match="caracteres inválidos"):
+            calc.preparar_respostas_batch(
+                2023, "MT", 1211, [RESPOSTAS_MT_2023, RESPOSTAS_MT_2023[:-1] + "F"]
+            )
+
 
 class TestValidacaoEntradaNucleo:
     def test_rejeita_caractere_fora_do_contrato(self, calc):
         with pytest.raises(ValueError, match="caracteres inválidos"):
             calc.calcular_nota(2023, "MT", 1211, "A" * 44 + "9")
 
+    @pytest.mark.parametrize("n", [44, 46])
+    def test_vetor_binario_com_tamanho_errado_e_rejeitado(self, calc, n):
+        """Antes, ``zip`` truncava em silêncio e estimava θ com menos itens."""
+        itens = calc.carregar_itens(2023, "MT", 1211)
+        with pytest.raises(ValueError, match=f"\\(45\\), recebidos {n}"):
+            calc.estimar_theta_eap([1] * n, itens)
+        with pytest.raises(ValueError, match="um valor por item"):
+            calc.log_verossimilhanca(0.0, [1] * n, itens)
+
     def test_padding_nove_so_e_removido_em_lc_50(self, calc):
         resposta = "BCBAB99999BACBEACBDCCABAEAAABCCCDECDCECADAAEBCECBD"
         resultado = calc.calcular_nota(
@@ -344,6 +754,37 @@ class TestValidacaoEntradaNucleo:
         with pytest.raises(ValueError, match="padding"):
             calc.calcular_nota(2014, "LC", 213, adulterada, tp_lingua=0)
 
+    def test_normalizacao_lc_em_lote_igual_a_escalar(self):
+        from tri_enem.tradutor import (
+            filtrar_respostas_lc, filtrar_respostas_lc_lote, obter_config_lc,
+        )
+
+        config = obter_config_lc(2016)
+        gerador = np.random.default_rng(7)
+        respostas, linguas = [], []
+        for _ in range(400):
+            comprimento = int(gerador.choice([44, 45, 50, 51]))
+            texto = list(gerador.choice(list("ABCDE.*9"), comprimento))
+            if comprimento == 50 and gerador.random() < 0.8:
+                inicio = int(gerador.choice([0, 5]))
+                texto[inicio:inicio + 5] = "99999"
+            respostas.append("".join(texto))
+            linguas.append(int(gerador.integers(0, 2)))
+
+        codigos, erros = filtrar_respostas_lc_lote(respostas, linguas, config)
+        assert codigos.shape == (len(respostas), 45)
+        for texto, lingua, linha, erro in zip(respostas, linguas, codigos, erros):
+            try:
+                esperado = filtrar_respostas_lc(texto, lingua, config)
+            except ValueError:
+                assert erro
+                continue
+            if len(esperado) != 45:
+                assert erro
+                continue
+            assert not erro
+            assert "".join(map(chr, linha)) == esperado
+
 
 RESPOSTAS_MT_2023 = "CEAEACCCDABCDAACEDDBAAEBABDDEEBDAECABDBCBCADE"
 
@@ -376,3 +817,232 @@ class TestAnaliseDeQuestoes:
     def test_idx_area_dentro_do_intervalo(self, analise):
         for q in analise["acertos"] + analise["erros"]:
             assert 0 <= q["idx_area"] <= 44
+
+
+class TestInversoes:
+    """As inversões de posto um coincidem com a reestimação item a item."""
+
+    @pytest.mark.parametrize("caso", CASOS[::7], ids=_ids(CASOS[::7]))
+    def test_igual_a_reestimar_cada_item(self, calc, caso):
+        itens, respostas, _ = calc._preparar_calculo(
+            caso["ano"], caso["area"], caso["co_prova"],
+            caso["respostas"], caso["tp_lingua"],
+        )
+        theta, invertidos = calc.estimar_thetas_invertidos(respostas, itens)
+        assert theta == pytest.approx(
+            calc.estimar_theta_eap(respostas, itens), abs=TOL_THETA
+        )
+        for idx in np.flatnonzero(itens.ativos):
+            modificada = list(respostas)
+            modificada[idx] = 1 - modificada[idx]
+            assert invertidos[idx] == pytest.approx(
+                calc.estimar_theta_eap(modificada, itens), abs=TOL_THETA
+            )
+
+    def test_anulado_mantem_theta_original(self, calc):
+        itens = TestEstimacaoEAP._prova()
+        itens[3].abandonado = True
+        theta, invertidos = calc.estimar_thetas_invertidos([1] * 20 + [0] * 25, itens)
+        assert invertidos[3] == theta
+
+
+class TestAnaliseEmLote:
+    """A análise em lote coincide com `analisar_todas_questoes` por aluno."""
+
+    RESPOSTAS = [
+        RESPOSTAS_MT_2023,
+        "A" * 45,
+        "." * 45,
+        RESPOSTAS_MT_2023[::-1],
+    ]
+
+    def test_igual_a_analise_individual(self, calc):
+        itens, matriz = calc.preparar_respostas_batch(2023, "MT", 1211, self.RESPOSTAS)
+        # Orçamento mínimo: um participante por bloco.
+        lote = calc.analisar_todas_questoes_batch(
+            2023, "MT", 1211, matriz, memoria_mb=1e-6
+        )
+        assert lote["delta_nota"].shape == (len(self.RESPOSTAS), len(itens))
+        for linha, respostas in enumerate(self.RESPOSTAS):
+            analise = calc.analisar_todas_questoes(2023, "MT", 1211, respostas)
+            assert lote["nota"][linha] == pytest.approx(analise["nota"], abs=TOL_NOTA)
+            assert lote["theta"][linha] == pytest.approx(analise["theta"], abs=TOL_THETA)
+            for q in analise["acertos"]:
+                assert -lote["delta_nota"][linha, q["idx_area"]] == pytest.approx(
+                    q["perda_se_errasse"], abs=TOL_NOTA
+                )
+            for q in analise["erros"]:
+                assert lote["delta_nota"][linha, q["idx_area"]] == pytest.approx(
+                    q["ganho_se_acertasse"], abs=TOL_NOTA
+                )
+
+    def test_tamanho_do_bloco_nao_altera_resultado(self, calc):
+        _, matriz = calc.preparar_respostas_batch(2023, "MT", 1211, self.RESPOSTAS)
+        pequeno = calc.analisar_todas_questoes_batch(
+            2023, "MT", 1211, matriz, memoria_mb=0.05
+        )
+        grande = calc.analisar_todas_questoes_batch(2023, "MT", 1211, matriz)
+        np.testing.assert_allclose(pequeno["delta_nota"], grande["delta_nota"], atol=1e-9)
+
+    def test_rejeita_orcamento_invalido(self, calc):
+        with pytest.raises(ValueError, match="memoria_mb"):
+            calc.analisar_todas_questoes_batch(
+                2023, "MT", 1211, [[0] * 45], memoria_mb=0
+            )
+
+
+class TestCachePadroes:
+    """Padrões repetidos reaproveitam θ sem alterar o resultado."""
+
+    def test_desativado_por_padrao(self, calc):
+        itens, respostas, _ = calc._preparar_calculo(2023, "MT", 1211, RESPOSTAS_MT_2023)
+        calc.estimar_theta_eap(respostas, itens)
+        assert calc.info_cache_padroes().currsize == 0
+
+    def test_repeticao_conta_acerto_e_devolve_mesmo_theta(self):
+        calc = CalculadorTRI(cache_padroes=8)
+        itens, respostas, _ = calc._preparar_calculo(2023, "MT", 1211, RESPOSTAS_MT_2023)
+        primeiro = calc.estimar_theta_eap(respostas, itens)
+        segundo = calc.estimar_theta_eap(respostas, itens)
+        assert primeiro == segundo
+        assert calc.info_cache_padroes() == (1, 1, 8, 1)
+
+        theta, invertidos = calc.estimar_thetas_invertidos(respostas, itens)
+        invertidos[:] = 0.0  # a cópia devolvida não pode alterar o cache
+        theta_cache, invertidos_cache = calc.estimar_thetas_invertidos(respostas, itens)
+        assert theta == theta_cache == primeiro
+        assert np.any(invertidos_cache != 0.0)
+
+        calc.limpar_cache_padroes()
+        assert calc.info_cache_padroes() == (0, 0, 8, 0)
+
+    def test_capacidade_descarta_o_menos_recente(self):
+        calc = CalculadorTRI(cache_padroes=2)
+        itens = calc.carregar_itens(2023, "MT", 1211)
+        for k in range(3):
+            calc.estimar_theta_eap([1] * k + [0] * (45 - k), itens)
+        assert calc.info_cache_padroes().currsize == 2
+        calc.estimar_theta_eap([0] * 45, itens)
+        assert calc.info_cache_padroes().misses == 4
+
+    def test_cores_da_mesma_aplicacao_compartilham_entrada(self):
+        calc = CalculadorTRI(cache_padroes=8)
+        azul = calc.carregar_itens(2023, "MT", 1211)
+        outra_cor = calc.carregar_itens(2023, "MT", 1212)
+        respostas_azul = calc.converter_respostas(RESPOSTAS_MT_2023, azul)
+        # O mesmo participante na outra cor: mesmos acertos por CO_ITEM.
+        por_item = dict(zip(azul.co_item.tolist(), respostas_azul))
+        respostas_outra = [por_item[co] for co in outra_cor.co_item.tolist()]
+
+        theta, invertidos = calc.estimar_thetas_invertidos(respostas_azul, azul)
+        theta_outra, invertidos_outra = calc.estimar_thetas_invertidos(
+            respostas_outra, outra_cor
+        )
+        assert calc.info_cache_padroes().hits == 1
+        assert theta_outra == theta
+        por_item = dict(zip(azul.co_item.tolist(), invertidos))
+        np.testing.assert_array_equal(
+            invertidos_outra, [por_item[co] for co in outra_cor.co_item.tolist()]
+        )
+
+    def test_rejeita_capacidade_negativa(self):
+        with pytest.raises(ValueError, match="cache_padroes"):
+            CalculadorTRI(cache_padroes=-1)
+
+    def test_lote_com_repeticoes_igual_ao_individual(self, calc):
+        _, matriz = calc.preparar_respostas_batch(
+            2023, "MT", 1211, TestAnaliseEmLote.RESPOSTAS * 3
+        )
+        itens = calc.carregar_itens(2023, "MT", 1211)
+        thetas = calc.estimar_theta_eap_batch(matriz, itens)
+        for linha, theta in zip(matriz, thetas):
+            assert theta == pytest.approx(
+                calc.estimar_theta_eap(linha, itens), abs=TOL_THETA
+            )
+
+
+class TestConcorrencia:
+    """Rajada de threads num calculador frio: cada carga acontece uma vez."""
+
+    N_THREADS = 50
+
+    def _rajada(self, funcao):
+        barreira = threading.Barrier(self.N_THREADS)
+
+        def tarefa():
+            barreira.wait()
+            return funcao()
+
+        with ThreadPoolExecutor(self.N_THREADS) as executor:
+            futuros = [executor.submit(tarefa) for _ in range(self.N_THREADS)]
+            return [futuro.result() for futuro in futuros]
+
+    def test_csv_do_ano_e_prova_carregados_uma_vez(self, tmp_path, monkeypatch):
+        import tri_enem.calculador as modulo
+
+        origem = _utils.SRC_DIR / "tri_enem" / "data" / "itens" / "2020"
+        (tmp_path / "2020").mkdir()
+        (tmp_path / "2020" / "ITENS_PROVA_2020.csv").write_bytes(
+            (origem / "ITENS_PROVA_2020.csv").read_bytes()
+        )
+        leituras, montagens = [], []
+        ler_csv, montar = modulo.ler_csv_colunas, CalculadorTRI._montar_itens
+
+        def ler_devagar(caminho):
+            leituras.append(caminho)
+            time.sleep(0.05)  # Alarga a janela em que as threads colidem.
+            return ler_csv(caminho)
+
+        def montar_contando(self, *args):
+            montagens.append(args)
+            return montar(self, *args)
+
+        monkeypatch.setattr(modulo, "ler_csv_colunas", ler_devagar)
+        monkeypatch.setattr(CalculadorTRI, "_montar_itens", montar_contando)
+        calc = CalculadorTRI(str(tmp_path))
+
+        resultados = self._rajada(
+            lambda: calc.calcular_nota(2020, "LC", 691, "A" * 45, tp_lingua=1)
+        )
+
+        assert len(leituras) == 1
+        assert len(montagens) == 1
+        assert len({r["nota"] for r in resultados}) == 1
+
+    def test_contadores_de_padroes_exatos_sob_concorrencia(self):
+        calc = CalculadorTRI(cache_padroes=4)
+        itens, respostas, _ = calc._preparar_calculo(
+            2023, "MT", 1211, RESPOSTAS_MT_2023
+        )
+        calc.estimar_theta_eap(respostas, itens)
+        repeticoes = 200
+
+        def consultar():
+            for _ in range(repeticoes):
+                calc.estimar_theta_eap(respostas, itens)
+
+        self._rajada(consultar)
+        assert calc.info_cache_padroes().hits == self.N_THREADS * repeticoes
+        assert calc.info_cache_padroes().misses == 1
+
+    def test_falha_na_carga_nao_fica_no_cache(self, calc):
+        with pytest.raises(ValueError, match="Prova não encontrada"):
+            calc.carregar_itens(2023, "MT", 999999)
+        assert "2023_MT_999999_None" not in calc._cache_itens
+        assert not calc._cargas
+
+    def test_rajada_com_cache_de_padroes_igual_ao_sequencial(self):
+        calc = CalculadorTRI(cache_padroes=4)
+        esperado = CalculadorTRI().calcular_nota(2023, "MT", 1211, RESPOSTAS_MT_2023)
+        notas = self._rajada(
+            lambda: calc.calcular_nota(2023, "MT", 1211, RESPOSTAS_MT_2023)["nota"]
+        )
+        assert set(notas) == {esperado["nota"]}
+        assert len(calc._cache_tabelas) == 1
+
+    def test_colunas_e_banco_sao_somente_leitura(self, calc):
+        itens = calc.carregar_itens(2023, "MT", 1211)
+        with pytest.raises(ValueError):
+            itens.param_a[0] = 0.0
+        with pytest.raises(ValueError):
+            calc._carregar_colunas(2023)["NU_PARAM_A"][0] = 0.0
@@ -0,0 +1,87 @@
+# SPDX-License-Identifier: PolyForm-Noncommercial-1.0.0
+"""Custo de ``import tri_enem``: nomes públicos carregados sob demanda."""
+
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+import _utils
+
+_utils.add_src_to_path()
+
+import tri_enem  # noqa: E402
+
+# Orçamento folgado para a importação do pacote em si, medida num processo
+# limpo: sem NumPy/pandas ela fica em poucos milissegundos.
+ORCAMENTO_IMPORTACAO_S = 0.25
+PESADOS = ("numpy", "pandas", "yaml")
+
+
+def _executar(codigo: str):
+    saida = subprocess.run(
+        [sys.executable, "-c", codigo],
+        capture_output=True, text=True, check=True,
+        env={**os.environ, "PYTHONPATH": str(_utils.SRC_DIR)},
+    ).stdout
+    return json.loads(saida)
+
+
+def _carregados(preparo: str) -> list:
+    return _executar(
+        "import json, sys\n"
+        f"{preparo}\n"
+        f"print(json.dumps([m for m in {PESADOS!r} if m in sys.modules]))\n"
+    )
+
+
+def test_importar_pacote_cabe_no_orcamento_sem_dependencias_pesadas():
+    segundos, carregados = _executar(
+        "import json, sys, time\n"
+        "inicio = time.perf_counter()\n"
+        "import tri_enem\n"
+        "segundos = time.perf_counter() - inicio\n"
+        f"print(json.dumps([segundos, [m for m in {PESADOS!r} if m in sys.modules]]))\n"
+    )
+    assert carregados == []
+    assert segundos < ORCAMENTO_IMPORTACAO_S
+
+
+@pytest.mark.parametrize(
+    "preparo",
+    [
+        "from tri_enem import verificar_precisao_prova\n"
+        "verificar_precisao_prova(2023, 'MT', 1211)",
+        "from tri_enem import MapeadorProvas\nMapeadorProvas()",
+        "from tri_enem import CalculadorTRI\n"
+        "CalculadorTRI().calcular_nota(2020, 'LC', 692, 'A' * 45, tp_lingua=1)",
+    ],
+)
+def test_consultas_leves_nao_carregam_pandas(preparo):
+    assert "pandas" not in _carregados(preparo)
+
+
+def test_todos_os_nomes_publicos_resolvem():
+    assert set(tri_enem.__all__) <= set(dir(tri_enem))
+    for nome in tri_enem.__all__:
+        assert getattr(tri_enem, nome) is not None
+    with pytest.raises(AttributeError):
+        tri_enem.NaoExiste  # noqa: B018
+
+
+def test_itens_lidos_do_csv_sem_pandas(tmp_path):
+    origem = _utils.SRC_DIR / "tri_enem" / "data" / "itens" / "2020"
+    (tmp_path / "2020").mkdir()
+    (tmp_path / "2020" / "ITENS_PROVA_2020.csv").write_bytes(
+        (origem / "ITENS_PROVA_2020.csv").read_bytes()
+    )
+    carregados = _carregados(
+        "from tri_enem import CalculadorTRI\n"
+        f"calc = CalculadorTRI({str(tmp_path)!r})\n"
+        "calc.calcular_nota(2020, 'LC', 691, 'A' * 45, tp_lingua=1)"
+    )
+    assert "pandas" not in carregados
@@ -39,3 +39,66 @@ def test_fixture_auxiliar_nao_contem_identificadores_pessoais():
     proibidos = {"id", "id_col", "nu_inscricao", "nu_sequencial", "identificador"}
     assert exemplos
     assert all(proibidos.isdisjoint({chave.lower() for chave in caso}) for caso in exemplos)
+
+
+def test_pacote_binario_confere_com_manifesto_e_csvs():
+    import pandas as pd
+    from tri_enem.pacote_itens import carregar_pacote_itens, ler_csv_itens
+
+    raiz = Path(str(files("tri_enem").joinpath("data", "itens")))
+    pacote = carregar_pacote_itens(raiz)
+    assert pacote is not None
+    assert pacote.anos == list(range(2009, 2026))
+    for ano in pacote.anos:
+        df = ler_csv_itens(raiz / str(ano) / f"ITENS_PROVA_{ano}.csv")
+        pd.testing.assert_frame_equal(pacote.dataframe(ano), df, check_exact=True)
+        for (area, prova), linhas in pacote.provas(ano).items():
+            mascara = (df["SG_AREA"] == area) & (df["CO_PROVA"] == prova)
+            assert linhas.tolist() == list(mascara.to_numpy().nonzero()[0])
+
+
+def test_leitura_sem_pandas_igual_ao_pacote():
+    import numpy as np
+    from tri_enem.pacote_itens import carregar_pacote_itens, ler_csv_colunas
+
+    raiz = Path(str(files("tri_enem").joinpath("data", "itens")))
+    pacote = carregar_pacote_itens(raiz)
+    for ano in pacote.anos:
+        colunas = ler_csv_colunas(raiz / str(ano) / f"ITENS_PROVA_{ano}.csv")
+        esperado = pacote.colunas(ano)
+        assert list(colunas) == list(esperado)
+        for nome, valores in esperado.items():
+            assert colunas[nome].dtype == valores.dtype, (ano, nome)
+            if valores.dtype == object:
+                assert [v if v == v else None for v in colunas[nome]] == (
+                    [v if v == v else None for v in valores]
+                ), (ano, nome)
+            else:
+                np.testing.assert_array_equal(colunas[nome], valores)
+        grupos = colunas.grupos()
+        assert list(grupos) == list(pacote.provas(ano))
+        for chave, linhas in pacote.provas(ano).items():
+            assert grupos[chave].tolist() == linhas.tolist()
+
+
+def test_pacote_desatualizado_volta_aos_csvs(tmp_path):
+    from tri_enem import CalculadorTRI
+    from tri_enem.pacote_itens import carregar_pacote_itens, escrever_pacote_itens
+
+    raiz = Path(str(files("tri_enem").joinpath("data", "itens")))
+    destino = tmp_path / "2023"
+    destino.mkdir()
+    (destino / "ITENS_PROVA_2023.csv").write_bytes(
+        (raiz / "2023" / "ITENS_PROVA_2023.csv").read_bytes()
+    )
+    manifesto = json.loads((raiz / "manifest.json").read_text("utf-8"))
+    manifesto["files"] = [f for f in manifesto["files"] if f["ano"] == 2023]
+    (tmp_path / "manifest.json").write_text(json.dumps(manifesto), "utf-8")
+    escrever_pacote_itens(tmp_path)
+    assert carregar_pacote_itens(tmp_path).anos == [2023]
+
+    manifesto["years"] = [2023]
+    (tmp_path / "manifest.json").write_text(json.dumps(manifesto), "utf-8")
+    assert carregar_pacote_itens(tmp_path) is None
+    itens = CalculadorTRI(str(tmp_path)).carregar_itens(2023, "MT", 1211)
+    assert len(itens) == 45
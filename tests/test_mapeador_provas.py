@@ -9,7 +9,12 @@ import _utils
 _utils.add_src_to_path()
 
 import pytest
-from tri_enem.mapeador_provas import MapeadorProvas, InfoProva
+from tri_enem.mapeador_provas import (
+    InfoProva,
+    MapeadorProvas,
+    carregar_mapeamento,
+    obter_mapeador,
+)
 
 
 class TestMapeadorProvas:
@@ -206,6 +211,120 @@ class TestMapeadorProvas:
             assert all(sigla in ['LC', 'CH', 'CN', 'MT'] for sigla in ordem)
 
 
+
+class TestMapeamentoCompilado:
+    """Os YAMLs são compilados uma vez e compartilhados pelo processo."""
+
+    def test_instancias_compartilham_o_mapeamento(self, monkeypatch):
+        import yaml
+
+        obter_mapeador()
+
+        def proibido(*args, **kwargs):
+            raise AssertionError("YAML relido")
+
+        monkeypatch.setattr(yaml, "safe_load", proibido)
+        assert MapeadorProvas()._mapa is obter_mapeador()._mapa
+        assert obter_mapeador() is obter_mapeador()
+        assert MapeadorProvas().obter_codigo(2021, "CN", "digital", "azul") == 1011
+
+    def test_indice_reverso_igual_a_varredura(self):
+        mapeador = obter_mapeador()
+        provas = mapeador.listar_todas_provas()
+        for prova in provas:
+            primeira = next(p for p in provas if p.codigo == prova.codigo)
+            assert mapeador.descobrir_prova_por_codigo(prova.codigo) == primeira
+            assert mapeador.descobrir_prova_por_codigo(
+                prova.codigo, ano=prova.ano, area=prova.area
+            ) == next(
+                p for p in provas
+                if (p.codigo, p.ano, p.area) == (prova.codigo, prova.ano, prova.area)
+            )
+            if not prova.eh_especial:
+                assert mapeador.obter_codigo(
+                    prova.ano, prova.area, prova.tipo_aplicacao, prova.cor
+                ) == prova.codigo
+
+    def test_indices_por_ano(self):
+        mapeador = obter_mapeador()
+        assert mapeador.listar_areas_disponiveis(2021) == ["MT", "CN", "CH", "LC"]
+        assert mapeador.listar_areas_disponiveis(1999) == []
+        assert mapeador.listar_todas_provas(2021) == [
+            p for p in mapeador.listar_todas_provas() if p.ano == 2021
+        ]
+
+    def test_arquivo_substituido_e_recompilado(self, tmp_path):
+        arquivo = tmp_path / "mapeamento.yaml"
+        arquivo.write_text("2021:\n  MT:\n    digital:\n      azul: 1\n", "utf-8")
+        assert MapeadorProvas(arquivo).obter_codigo(2021, "MT", "digital", "azul") == 1
+        arquivo.write_text("2021:\n  MT:\n    digital:\n      azul: 22\n", "utf-8")
+        assert MapeadorProvas(arquivo).obter_codigo(2021, "MT", "digital", "azul") == 22
+        assert carregar_mapeamento(arquivo) is MapeadorProvas(arquivo)._mapa
+
+    def test_info_prova_compartilhada_e_imutavel(self):
+        import dataclasses
+
+        info = obter_mapeador().descobrir_prova_por_codigo(1011)
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            info.codigo = 0
+
+    def test_alterar_uma_instancia_nao_afeta_as_outras(self):
+        mapeador = MapeadorProvas()
+        mapeador.dados[2021]["CN"]["digital"]["azul"] = 0
+        mapeador.dados.pop(2022)
+        mapeador.ordem_provas.clear()
+        mapeador.aliases_cor.clear()
+        with pytest.raises(TypeError):
+            mapeador._mapa.codigos[(2021, "CN", "digital", "azul")] = 0
+        with pytest.raises(TypeError):
+            mapeador._mapa.cores_por_alias["blue"] = "rosa"
+
+        novo = MapeadorProvas()
+        assert novo._mapa is mapeador._mapa
+        assert novo.dados[2021]["CN"]["digital"]["azul"] == 1011
+        assert 2022 in novo.dados
+        assert novo.ordem_provas == novo._mapa.ordem_provas != {}
+        assert novo.aliases_cor
+        assert novo.obter_codigo(2021, "CN", "digital", "blue") == 1011
+        assert novo.listar_ordem_provas(2021) == obter_mapeador().listar_ordem_provas(2021)
+
+
+
+class TestNormalizacaoCompilada:
+    """Aliases dobrados (sem acentos e caixa) em tabelas de consulta direta."""
+
+    def test_acentos_e_espacos_sao_dobrados(self):
+        mapeador = obter_mapeador()
+        assert mapeador.normalizar_cor("Rósa") == "rosa"
+        assert mapeador.normalizar_tipo_aplicacao("Segunda  Oportunidade") == (
+            "segunda_oportunidade"
+        )
+        assert mapeador.normalizar_area("ciencias  humanas") == "CH"
+        assert mapeador.normalizar_area("Linguagens e Códigos") == "LC"
+
+    def test_valores_desconhecidos_mantem_a_forma_anterior(self):
+        mapeador = obter_mapeador()
+        assert mapeador.normalizar_tipo_aplicacao("Braille Ampliada") == "braille_ampliada"
+        assert mapeador.normalizar_cor(" Dourada ") == "dourada"
+        assert mapeador.normalizar_area(" xx ") == "XX"
+
+    def test_colunas_iguais_a_normalizacao_por_valor(self):
+        mapeador = obter_mapeador()
+        tipos = ["1ª aplicação", "Digital", "regular", "xx", "1ª aplicação"] * 3
+        cores = ["AZUL", "blue", "Rosa", "amarelo", "cinzá"] * 3
+        areas = ["mt", "Matemática", "humanas", "LC", "??"] * 3
+        for lote, escalar, valores in (
+            (mapeador.normalizar_tipos_aplicacao, mapeador.normalizar_tipo_aplicacao, tipos),
+            (mapeador.normalizar_cores, mapeador.normalizar_cor, cores),
+            (mapeador.normalizar_areas, mapeador.normalizar_area, areas),
+        ):
+            resultado = lote(valores)
+            assert resultado.shape == (len(valores),)
+            assert resultado.tolist() == [escalar(valor) for valor in valores]
+        assert mapeador.normalizar_cores(iter(["Azul"])).tolist() == ["azul"]
+        assert mapeador.normalizar_cores([]).tolist() == []
+
+
 if __name__ == '__main__':
     # Permitir executar diretamente
     pytest.main([__file__, '-v'])
@@ -0,0 +1,142 @@
+# SPDX-License-Identifier: PolyForm-Noncommercial-1.0.0
+"""Pontuação em fluxo de microdados (tools/pontuar_microdados.py)."""
+
+from __future__ import annotations
+
+import io
+import json
+import sys
+
+import pandas as pd
+import pytest
+
+import _utils
+
+_utils.add_src_to_path()
+sys.path.insert(0, str(_utils.ROOT))
+
+from tri_enem import CalculadorTRI  # noqa: E402
+from tools import pontuar_microdados as modulo  # noqa: E402
+from tools.pontuar_microdados import pontuar_microdados  # noqa: E402
+
+ANO = 2016
+
+
+@pytest.fixture(scope="module")
+def casos():
+    caminho = _utils.ROOT / "tests" / "fixtures" / "golden_notas.json"
+    with open(caminho, encoding="utf-8") as f:
+        golden = json.load(f)
+    return [caso for caso in golden if caso["ano"] == ANO]
+
+
+def _microdados(casos, caminho):
+    """Uma linha por caso, presente só na área do caso."""
+    linhas = []
+    for numero, caso in enumerate(casos):
+        linha = {"NU_INSCRICAO": f"{numero:012d}", "TP_LINGUA": caso["tp_lingua"]}
+        for area in ("CN", "CH", "LC", "MT"):
+            presente = area == caso["area"]
+            linha[f"TP_PRESENCA_{area}"] = 1 if presente else 0
+            linha[f"CO_PROVA_{area}"] = caso["co_prova"] if presente else None
+            linha[f"TX_RESPOSTAS_{area}"] = caso["respostas"] if presente else None
+        linhas.append(linha)
+    # Participante ausente em todas as áreas: lido, mas não pontuado.
+    linhas.append({**linhas[0], "NU_INSCRICAO": "ausente", "TP_PRESENCA_CN": 0,
+                   "TP_PRESENCA_CH": 0, "TP_PRESENCA_LC": 0, "TP_PRESENCA_MT": 0})
+    pd.DataFrame(linhas).to_csv(caminho, sep=";", index=False, encoding="latin1")
+
+
+def test_pontua_em_blocos_igual_a_calcular_nota(tmp_path, casos):
+    assert any(len(caso["respostas"]) == 50 for caso in casos)
+    caminho = tmp_path / f"MICRODADOS_ENEM_{ANO}.csv"
+    _microdados(casos, caminho)
+    calc = CalculadorTRI()
+    saida = io.StringIO()
+
+    resumo = pontuar_microdados(
+        calc, caminho, ANO, saida, chunk_size=3, progresso=False
+    )
+
+    assert resumo["linhas_lidas"] == len(casos) + 1
+    assert resumo["linhas_pontuadas"] == len(casos)
+    assert resumo["linhas_por_segundo"] > 0
+    saida.seek(0)
+    resultado = pd.read_csv(saida, sep=";", dtype={"NU_INSCRICAO": str})
+    resultado = resultado.set_index("NU_INSCRICAO")
+    for numero, caso in enumerate(casos):
+        linha = resultado.loc[f"{numero:012d}"]
+        esperado = calc.calcular_nota(
+            ANO, caso["area"], caso["co_prova"], caso["respostas"], caso["tp_lingua"]
+        )
+        assert linha["SG_AREA"] == caso["area"]
+        assert linha["THETA"] == pytest.approx(esperado["theta"], abs=1e-9)
+        assert linha["NOTA"] == pytest.approx(esperado["nota"], abs=1e-6)
+
+
+def test_workers_produzem_saida_identica(tmp_path, casos):
+    caminho = tmp_path / f"MICRODADOS_ENEM_{ANO}.csv"
+    _microdados(casos, caminho)
+    saidas = []
+    for workers in (1, 2):
+        saida = io.StringIO()
+        pontuar_microdados(
+            CalculadorTRI(), caminho, ANO, saida, chunk_size=4,
+            progresso=False, workers=workers,
+        )
+        saidas.append(saida.getvalue())
+    assert saidas[0] == saidas[1]
+
+
+def test_intervalo_acrescenta_colunas(tmp_path, casos):
+    caminho = tmp_path / f"MICRODADOS_ENEM_{ANO}.csv"
+    _microdados(casos, caminho)
+    saida = io.StringIO()
+    pontuar_microdados(
+        CalculadorTRI(), caminho, ANO, saida, progresso=False, intervalo=True
+    )
+    saida.seek(0)
+    resultado = pd.read_csv(saida, sep=";")
+    assert (resultado["NOTA_INF"] < resultado["NOTA"]).all()
+    assert (resultado["NOTA"] < resultado["NOTA_SUP"]).all()
+    assert (resultado["DP_THETA"] > 0).all()
+
+
+def test_prova_sem_itens_e_contada(tmp_path, casos):
+    caso = dict(casos[0], co_prova=999999)
+    caminho = tmp_path / "microdados.csv"
+    _microdados([caso], caminho)
+
+    resumo = pontuar_microdados(
+        CalculadorTRI(), caminho, ANO, io.StringIO(), progresso=False
+    )
+
+    assert resumo["linhas_pontuadas"] == 0
+    assert resumo["sem_itens"] == {f"{ANO},{caso['area']},999999": 1}
+
+
+def test_presentes_com_respostas_recusadas_sao_contados(tmp_path, casos):
+    caso = next(caso for caso in casos if caso["area"] != "LC")
+    recusado = dict(caso, respostas="X" * 45)
+    caminho = tmp_path / "microdados.csv"
+    _microdados([caso, recusado], caminho)
+
+    resumo = pontuar_microdados(
+        CalculadorTRI(), caminho, ANO, io.StringIO(), progresso=False
+    )
+
+    assert resumo["linhas_pontuadas"] == 1
+    assert resumo["respostas_recusadas"] == {caso["area"]: 1}
+
+
+def test_worker_recria_o_calculador_com_a_mesma_configuracao():
+    calc = CalculadorTRI(max_tabelas=7, cache_padroes=32)
+
+    modulo._iniciar_worker(calc._configuracao(), 2009, ("LC",))
+
+    worker = modulo._CALC_WORKER
+    assert worker._configuracao() == calc._configuracao()
+    assert worker._max_tabelas == 7 and worker._max_padroes == 32
+    # LC de 2009 não tem opção de idioma: a variante sem tp_lingua é aquecida.
+    prova = calc.listar_provas(2009, "LC")["LC"][0]
+    assert f"2009_LC_{prova}_None" in worker._cache_itens
@@ -10,6 +10,9 @@ coeficientes_data.json e eram apresentadas sem qualquer sinalização.
 """
 
 import json
+import os
+import subprocess
+import sys
 from pathlib import Path
 
 import pytest
@@ -23,6 +26,8 @@ from tri_enem import (  # noqa: E402
     verificar_precisao_prova,
 )
 import tri_enem.precisao as precisao_module  # noqa: E402
+from tri_enem import catalogo  # noqa: E402
+from tri_enem.coeficientes import _normalizar_transformacao  # noqa: E402
 from tri_enem.precisao import SEVERIDADE_POR_STATUS  # noqa: E402
 
 DADOS = Path(_utils.SRC_DIR) / "tri_enem" / "coeficientes_data.json"
@@ -253,3 +258,89 @@ class TestClassificacao:
                 "sem_itens",
             }, co_prova
             assert r["n_validacao"], co_prova
+
+
+class TestCarregamentoCatalogo:
+    """O catálogo é lido uma vez, sob demanda, para transformações e métricas."""
+
+    def test_importar_nao_le_e_binario_dispensa_o_json(self):
+        codigo = (
+            "import json\n"
+            "import tri_enem\n"
+            "from tri_enem import catalogo\n"
+            "def lidos():\n"
+            "    return [catalogo._ler_json.cache_info().misses,\n"
+            "            catalogo._ler_binario.cache_info().misses]\n"
+            "antes = lidos()\n"
+            "tri_enem.obter_transformacao(2023, 'MT', 1211)\n"
+            "tri_enem.verificar_precisao_prova(2023, 'MT', 1211)\n"
+            "print(json.dumps([antes, lidos()]))\n"
+        )
+        saida = subprocess.run(
+            [sys.executable, "-c", codigo],
+            capture_output=True, text=True, check=True,
+            env={**os.environ, "PYTHONPATH": str(_utils.SRC_DIR)},
+        ).stdout
+        assert json.loads(saida) == [[0, 0], [0, 1]]
+
+    def test_binario_empacotado_corresponde_ao_json(self):
+        assert catalogo._binario(DADOS) is not None
+
+    def test_secao_quente_so_tem_campos_de_transformacao(self, dados, tmp_path):
+        copia = tmp_path / "coeficientes_data.json"
+        copia.write_bytes(DADOS.read_bytes())
+        quente = catalogo.secao_quente(copia)
+        assert quente["por_prova"].keys() == dados["por_prova"].keys()
+        info = quente["por_prova"]["2023,MT,1211"]
+        assert set(info) <= set(catalogo.CAMPOS_QUENTES)
+        assert info["slope"] == dados["por_prova"]["2023,MT,1211"]["slope"]
+
+    def test_binario_equivale_ao_json(self, dados, tmp_path, monkeypatch):
+        copia = tmp_path / "coeficientes_data.json"
+        copia.write_bytes(DADOS.read_bytes())
+        monkeypatch.setattr(precisao_module, "DATA_FILE", copia)
+        chaves = list(dados["por_prova"])
+        do_json = [_consultar(chave) for chave in chaves]
+        quente_json = catalogo.secao_quente(copia)
+
+        catalogo.escrever_catalogo_binario(copia)
+        assert catalogo._binario(copia) is not None
+        assert [_consultar(chave) for chave in chaves] == do_json
+        quente_bin = catalogo.secao_quente(copia)
+        assert quente_bin["por_area"] == quente_json["por_area"]
+        # Provas sem slope não têm transformação própria nas duas seções.
+        assert set(quente_bin["por_prova"]) == {
+            chave for chave, info in quente_json["por_prova"].items()
+            if info.get("slope") is not None
+        }
+        for chave in quente_bin["por_prova"]:
+            assert _normalizar_transformacao(
+                quente_bin["por_prova"][chave], "prova"
+            ) == _normalizar_transformacao(quente_json["por_prova"][chave], "prova")
+
+    @pytest.mark.parametrize("entrada", [None, "texto", 3, []])
+    def test_binario_responde_igual_ao_json_para_entrada_que_nao_e_dict(
+        self, dados, entrada, tmp_path, monkeypatch
+    ):
+        alterado = json.loads(json.dumps(dados))
+        alterado["por_prova"]["2023,MT,1211"] = entrada
+        copia = tmp_path / "coeficientes_data.json"
+        copia.write_text(json.dumps(alterado), encoding="utf-8")
+        monkeypatch.setattr(precisao_module, "DATA_FILE", copia)
+        do_json = _consultar("2023,MT,1211")
+
+        catalogo.escrever_catalogo_binario(copia)
+        assert catalogo._binario(copia) is not None
+        assert _consultar("2023,MT,1211") == do_json
+        assert do_json == verificar_precisao_prova(2023, "MT", 999999)
+
+    def test_binario_desatualizado_e_ignorado(self, tmp_path, monkeypatch):
+        copia = tmp_path / "coeficientes_data.json"
+        copia.write_bytes(DADOS.read_bytes())
+        catalogo.escrever_catalogo_binario(copia)
+        copia.write_text(
+            json.dumps({"schema_version": 3, "por_prova": {}}), encoding="utf-8"
+        )
+        monkeypatch.setattr(precisao_module, "DATA_FILE", copia)
+        assert catalogo._binario(copia) is None
+        assert verificar_precisao_prova(2023, "MT", 1211)["status"] == "nao_calibrado"
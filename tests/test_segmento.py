@@ -0,0 +1,106 @@
+# SPDX-License-Identifier: PolyForm-Noncommercial-1.0.0
+"""Segmento compartilhado entre processos (``segmento.py``)."""
+
+from __future__ import annotations
+
+import json
+
+import numpy as np
+import pytest
+
+import _utils
+
+_utils.add_src_to_path()
+
+from tri_enem import CalculadorTRI  # noqa: E402
+from tri_enem.segmento import CAMPOS_BANCO, publicar_segmento  # noqa: E402
+
+PROVAS = [
+    (2023, "MT", 1211, None),
+    (2023, "LC", 1201, 0),
+    (2023, "LC", 1201, 1),
+    (2020, "LC", 691, 1),
+    (2025, "MT", 1607, None),  # Segunda oportunidade, traduzida para 1502.
+]
+
+
+@pytest.fixture(scope="module")
+def segmento(tmp_path_factory):
+    return publicar_segmento(tmp_path_factory.mktemp("segmento") / "itens.seg")
+
+
+@pytest.mark.parametrize("ano, area, co_prova, tp_lingua", PROVAS)
+def test_bancos_e_thetas_iguais_aos_do_calculador(segmento, ano, area, co_prova, tp_lingua):
+    calc = CalculadorTRI(segmento=str(segmento))
+    esperado = CalculadorTRI().carregar_itens(ano, area, co_prova, tp_lingua)
+    itens = calc.carregar_itens(ano, area, co_prova, tp_lingua)
+
+    for nome in CAMPOS_BANCO:
+        np.testing.assert_array_equal(getattr(itens, nome), getattr(esperado, nome))
+    assert itens.gabarito_texto == esperado.gabarito_texto
+    assert itens.chave == esperado.chave
+    assert itens.assinatura == esperado.assinatura
+
+    matriz = np.random.default_rng(0).integers(0, 2, (10, len(itens)))
+    np.testing.assert_array_equal(
+        calc.estimar_theta_eap_batch(matriz, itens),
+        CalculadorTRI().estimar_theta_eap_batch(matriz, esperado),
+    )
+    assert calc.listar_provas(ano) == CalculadorTRI().listar_provas(ano)
+    assert calc._cache_colunas == {}
+
+
+def test_bancos_e_tabelas_sao_views_somente_leitura(segmento):
+    calc = CalculadorTRI(segmento=str(segmento))
+    itens = calc.carregar_itens(2023, "MT", 1211)
+    tabela = calc._tabela(itens)
+    for array in (itens.param_a, tabela.delta, tabela.base):
+        assert not array.flags.writeable
+        assert not array.flags.owndata
+
+
+def test_prova_fora_do_segmento_mantem_o_erro(segmento):
+    calc = CalculadorTRI(segmento=str(segmento))
+    with pytest.raises(ValueError, match="Prova não encontrada"):
+        calc.carregar_itens(2023, "MT", 999999)
+
+
+def test_recusa_manifesto_diferente(segmento, tmp_path):
+    raiz = CalculadorTRI().base_path
+    manifesto = json.loads((raiz / "manifest.json").read_text("utf-8"))
+    manifesto["years"] = [2023]
+    (tmp_path / "manifest.json").write_text(json.dumps(manifesto), "utf-8")
+    with pytest.raises(ValueError, match="desatualizado"):
+        CalculadorTRI(str(tmp_path), segmento=str(segmento))
+
+
+def test_recusa_outra_grade_de_quadratura(segmento):
+    class Calculador40(CalculadorTRI):
+        N_QUADRATURA = 40
+
+    with pytest.raises(ValueError, match="quadratura"):
+        Calculador40(segmento=str(segmento))
+
+
+def test_recusa_arquivo_que_nao_e_segmento():
+    pacote = CalculadorTRI().base_path / "itens.bin"
+    with pytest.raises(ValueError, match="não é um segmento"):
+        CalculadorTRI(segmento=str(pacote))
+
+
+def test_republicar_nao_afeta_quem_ja_abriu(segmento, tmp_path):
+    destino = tmp_path / "itens.seg"
+    destino.write_bytes(segmento.read_bytes())
+    calc = CalculadorTRI(segmento=str(destino))
+    publicar_segmento(destino)
+    assert calc.calcular_nota(2023, "MT", 1211, "A" * 45)["nota"] == (
+        CalculadorTRI().calcular_nota(2023, "MT", 1211, "A" * 45)["nota"]
+    )
+    assert [p.name for p in tmp_path.iterdir()] == ["itens.seg"]
+
+
+def test_configuracao_preserva_o_segmento(segmento):
+    calc = CalculadorTRI(segmento=str(segmento))
+    copia = CalculadorTRI(**calc._configuracao())
+    assert copia._segmento is not None
+    assert copia._configuracao() == calc._configuracao()
@@ -3,6 +3,9 @@
 
 from __future__ import annotations
 
+import json
+
+import numpy as np
 import pytest
 
 import _utils
@@ -10,6 +13,16 @@ import _utils
 _utils.add_src_to_path()
 
 from tri_enem import SimuladorNota  # noqa: E402
+from tri_enem.simulador import (  # noqa: E402
+    STATUS_ENTRADA_INVALIDA,
+    STATUS_OK,
+    STATUS_PROVA_AMBIGUA,
+    STATUS_PROVA_NAO_ENCONTRADA,
+    STATUS_RESPOSTAS_INVALIDAS,
+    STATUS_SEM_ITENS,
+)
+
+LINGUAS = {0: "ingles", 1: "espanhol"}
 
 
 def test_nao_escolhe_primeira_prova_quando_ha_ambiguidade():
@@ -34,3 +47,90 @@ def test_cor_sem_aplicacao_nao_assume_primeira_aplicacao():
     simulador = SimuladorNota()
     with pytest.raises(ValueError, match="tipo_aplicacao"):
         simulador.calcular("MT", 2023, "A" * 45, cor_prova="azul")
+
+
+def _registros_golden():
+    caminho = _utils.ROOT / "tests" / "fixtures" / "golden_notas.json"
+    golden = json.loads(caminho.read_text(encoding="utf-8"))
+    return [
+        {
+            "area": caso["area"],
+            "ano": caso["ano"],
+            "respostas": caso["respostas"],
+            "co_prova": caso["co_prova"],
+            "lingua": LINGUAS.get(caso["tp_lingua"]),
+        }
+        for caso in golden
+        if caso["area"] != "LC" or caso["tp_lingua"] is not None
+    ]
+
+
+def test_lote_igual_a_calcular_linha_a_linha():
+    simulador = SimuladorNota()
+    registros = _registros_golden()
+    lote = simulador.calcular_lote(registros)
+    assert len(lote) == len(registros)
+    assert lote.ok.all()
+    for i, registro in enumerate(registros):
+        esperado = simulador.calcular(
+            registro["area"], registro["ano"], registro["respostas"],
+            registro["lingua"], co_prova=registro["co_prova"],
+        )
+        assert lote.nota[i] == pytest.approx(esperado.nota, abs=1e-6)
+        assert lote.theta[i] == pytest.approx(esperado.theta, abs=1e-9)
+        assert lote.acertos[i] == esperado.acertos
+        assert lote.total_itens[i] == esperado.total_itens
+        assert lote.co_prova[i] == esperado.co_prova
+
+
+def test_lote_registra_status_por_linha_sem_interromper():
+    base = {"area": "MT", "ano": 2023, "respostas": "A" * 45}
+    registros = [
+        dict(base, cor_prova="azul", tipo_aplicacao="1ª aplicação"),
+        base,
+        dict(base, cor_prova="azul"),
+        dict(base, cor_prova="verde", tipo_aplicacao="1a_aplicacao"),
+        dict(base, co_prova=999999),
+        dict(base, co_prova=1211, respostas="A" * 44),
+        dict(base, co_prova=1211, respostas=None),
+        dict(base, area="LC", co_prova=1201, lingua="frances"),
+        dict(base, area="LC", ano=2012, co_prova=165, lingua="espanhol"),
+        dict(base, ano=None),
+    ]
+    lote = SimuladorNota().calcular_lote(registros)
+    assert lote.status.tolist() == [
+        STATUS_OK,
+        STATUS_PROVA_AMBIGUA,
+        STATUS_ENTRADA_INVALIDA,
+        STATUS_PROVA_NAO_ENCONTRADA,
+        STATUS_SEM_ITENS,
+        STATUS_RESPOSTAS_INVALIDAS,
+        STATUS_RESPOSTAS_INVALIDAS,
+        STATUS_ENTRADA_INVALIDA,
+        STATUS_SEM_ITENS,
+        STATUS_ENTRADA_INVALIDA,
+    ]
+    assert lote.co_prova[0] == 1211 and lote.mensagem[0] is None
+    assert "45 itens" in lote.mensagem[5]
+    assert "não oferece espanhol" in lote.mensagem[8]
+    assert np.isnan(lote.nota[1:]).all()
+
+
+def test_lote_aceita_dataframe_e_colunas():
+    pd = pytest.importorskip("pandas")
+    registros = _registros_golden()[:12] + [
+        {"area": "MT", "ano": 2023, "respostas": "A" * 45,
+         "cor_prova": "rosa", "tipo_aplicacao": "digital"},
+    ]
+    simulador = SimuladorNota()
+    por_registro = simulador.calcular_lote(registros)
+    tabela = pd.DataFrame(registros)
+    por_tabela = simulador.calcular_lote(tabela)
+    por_colunas = simulador.calcular_lote({nome: tabela[nome].tolist() for nome in tabela})
+    for resultado in (por_tabela, por_colunas):
+        assert resultado.status.tolist() == por_registro.status.tolist()
+        np.testing.assert_array_equal(resultado.nota, por_registro.nota)
+    assert list(por_tabela.para_dataframe().columns) == list(por_tabela.colunas())
+    assert len(simulador.calcular_lote([])) == 0
+    with pytest.raises(ValueError, match="respostas"):
+        simulador.calcular_lote({"area": ["MT"], "ano": [2023]})
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: PolyForm-Noncommercial-1.0.0
+"""Mede o custo dos caminhos quentes do motor TRI com os itens empacotados.
+
+Cada cenário compara a implementação atual com a forma ingênua equivalente
+(reestimação completa) e confere que os resultados coincidem antes de
+reportar o tempo. Não depende dos microdados do INEP.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from tri_enem import CalculadorTRI  # noqa: E402
+
+ANO = 2023
+AREA = "MT"
+CO_PROVA = 1211
+RESPOSTAS = "CEAEACCCDABCDAACEDDBAAEBABDDEEBDAECABDBCBCADE"
+
+
+def cronometrar(funcao: Callable[[], object], repeticoes: int) -> float:
+    """Melhor tempo por chamada, em segundos, após uma chamada de aquecimento."""
+    funcao()
+    melhor = float("inf")
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        funcao()
+        melhor = min(melhor, time.perf_counter() - inicio)
+    return melhor
+
+
+def _inversoes_por_reestimacao(
+    calc: CalculadorTRI, respostas: List[int], itens
+) -> np.ndarray:
+    """Referência: uma estimação EAP completa por item invertido."""
+    resultado = np.empty(len(itens))
+    for idx in range(len(itens)):
+        modificada = list(respostas)
+        modificada[idx] = 1 - modificada[idx]
+        resultado[idx] = calc.estimar_theta_eap(modificada, itens)
+    return resultado
+
+
+def cenario_inversoes(calc: CalculadorTRI, repeticoes: int) -> Dict[str, float]:
+    itens, respostas, _ = calc._preparar_calculo(ANO, AREA, CO_PROVA, RESPOSTAS)
+    referencia = _inversoes_por_reestimacao(calc, respostas, itens)
+    _, invertidos = calc.estimar_thetas_invertidos(respostas, itens)
+    ativos = itens.ativos
+    divergencia = float(np.max(np.abs(referencia[ativos] - invertidos[ativos])))
+    if divergencia > 1e-9:
+        raise RuntimeError(f"inversões divergem da reestimação: {divergencia}")
+    return {
+        "ingenuo": cronometrar(
+            lambda: _inversoes_por_reestimacao(calc, respostas, itens),
+            repeticoes,
+        ),
+        "atual": cronometrar(
+            lambda: calc.estimar_thetas_invertidos(respostas, itens),
+            repeticoes,
+        ),
+        "divergencia": divergencia,
+    }
+
+
+def cenario_analise_lote(calc: CalculadorTRI, repeticoes: int) -> Dict[str, float]:
+    itens = calc.carregar_itens(ANO, AREA, CO_PROVA)
+    gerador = np.random.default_rng(0)
+    matriz = (gerador.random((500, len(itens))) < 0.5).astype(np.int8)
+
+    def por_participante() -> np.ndarray:
+        """Referência: análise individual, convertendo cada θ para nota."""
+        linhas = []
+        for linha in matriz:
+            theta, invertidos = calc.estimar_thetas_invertidos(linha, itens)
+            nota = calc.transformar_escala(theta, ANO, AREA, CO_PROVA)
+            linhas.append([
+                calc.transformar_escala(t, ANO, AREA, CO_PROVA) - nota
+                for t in invertidos
+            ])
+        resultado = np.asarray(linhas)
+        resultado[:, itens.abandonado] = 0.0
+        return resultado
+
+    referencia = por_participante()
+    lote = calc.analisar_todas_questoes_batch(ANO, AREA, CO_PROVA, matriz)
+    divergencia = float(np.max(np.abs(referencia - lote["delta_nota"])))
+    if divergencia > 1e-6:
+        raise RuntimeError(f"análise em lote diverge: {divergencia}")
+    return {
+        "ingenuo": cronometrar(por_participante, repeticoes),
+        "atual": cronometrar(
+            lambda: calc.analisar_todas_questoes_batch(ANO, AREA, CO_PROVA, matriz),
+            repeticoes,
+        ),
+        "divergencia": divergencia,
+    }
+
+
+def cenario_preparacao_lote(calc: CalculadorTRI, repeticoes: int) -> Dict[str, float]:
+    gerador = np.random.default_rng(0)
+    letras = np.array(list("ABCDE.*"))
+    respostas = ["".join(linha) for linha in gerador.choice(letras, (5000, 45))]
+
+    def por_linha() -> np.ndarray:
+        """Referência: `_preparar_calculo` completo para cada string."""
+        return np.asarray([
+            calc._preparar_calculo(ANO, AREA, CO_PROVA, texto)[1]
+            for texto in respostas
+        ])
+
+    referencia = por_linha()
+    _, matriz, _ = calc.parear_respostas_batch(ANO, AREA, CO_PROVA, respostas)
+    divergencia = float(np.max(np.abs(referencia - matriz)))
+    if divergencia != 0:
+        raise RuntimeError(f"pareamento em lote diverge: {divergencia}")
+    return {
+        "ingenuo": cronometrar(por_linha, repeticoes),
+        "atual": cronometrar(
+            lambda: calc.parear_respostas_batch(ANO, AREA, CO_PROVA, respostas),
+            repeticoes,
+        ),
+        "divergencia": divergencia,
+    }
+
+
+CENARIOS = {
+    "inversoes": cenario_inversoes,
+    "analise_lote": cenario_analise_lote,
+    "preparacao_lote": cenario_preparacao_lote,
+}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--cenarios", nargs="+", choices=sorted(CENARIOS),
+        default=sorted(CENARIOS),
+    )
+    parser.add_argument("--repeticoes", type=int, default=20)
+    args = parser.parse_args()
+    if args.repeticoes < 1:
+        parser.error("--repeticoes deve ser pelo menos 1")
+
+    calc = CalculadorTRI()
+    print(f"{'cenário':<16} {'ingênuo':>12} {'atual':>12} {'ganho':>8} {'diverg.':>10}")
+    for nome in args.cenarios:
+        medida = CENARIOS[nome](calc, args.repeticoes)
+        print(
+            f"{nome:<16} {medida['ingenuo'] * 1e3:>10.3f}ms "
+            f"{medida['atual'] * 1e3:>10.3f}ms "
+            f"{medida['ingenuo'] / medida['atual']:>7.1f}x "
+            f"{medida['divergencia']:>10.1e}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -8,6 +8,7 @@ import argparse
 import hashlib
 import json
 import os
+import sys
 import tempfile
 from pathlib import Path
 from typing import Any
@@ -15,6 +16,10 @@ from typing import Any
 import pandas as pd
 
 ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from tri_enem.pacote_itens import ARQUIVO_PACOTE, escrever_pacote_itens  # noqa: E402
+
 DESTINO_PADRAO = ROOT / "src" / "tri_enem" / "data" / "itens"
 ANOS = tuple(range(2009, 2026))
 COLUNAS_OBRIGATORIAS = {
@@ -76,7 +81,11 @@ def gerar_dados_itens(
     microdados_dir: Path,
     destino: Path = DESTINO_PADRAO,
 ) -> dict[str, Any]:
-    """Normaliza os 17 CSVs e os substitui somente após validar o conjunto."""
+    """Normaliza os 17 CSVs e os substitui somente após validar o conjunto.
+
+    Gera também ``itens.bin``, o pacote colunar lido por ``mmap`` em tempo
+    de execução, conferido contra o manifesto recém-escrito.
+    """
     microdados_dir = microdados_dir.resolve()
     destino = destino.resolve()
     entradas = []
@@ -111,6 +120,7 @@ def gerar_dados_itens(
             json.dumps(manifesto, ensure_ascii=False, indent=2) + "\n",
             encoding="utf-8",
         )
+        escrever_pacote_itens(temp)
 
         destino.mkdir(parents=True, exist_ok=True)
         for entrada in entradas:
@@ -118,6 +128,9 @@ def gerar_dados_itens(
             alvo = destino / relativo
             alvo.parent.mkdir(parents=True, exist_ok=True)
             os.replace(temp / relativo, alvo)
+        # O pacote guarda o sha256 do manifesto: até o manifesto novo entrar,
+        # o motor o recusa e lê os CSVs.
+        os.replace(temp / ARQUIVO_PACOTE, destino / ARQUIVO_PACOTE)
         os.replace(temp / "manifest.json", destino / "manifest.json")
     return manifesto
 
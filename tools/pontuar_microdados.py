@@ -0,0 +1,390 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: PolyForm-Noncommercial-1.0.0
+"""Calcula θ e nota de todos os participantes de um arquivo de microdados.
+
+O arquivo é lido em blocos de linhas (memória limitada pelo bloco, e não pelo
+tamanho do arquivo). Em cada bloco, as linhas válidas de cada área são
+agrupadas por (CO_PROVA, TP_LINGUA) e estimadas de uma vez pelo EAP em lote;
+o resultado de cada bloco é gravado antes da leitura do próximo.
+
+Com ``--workers N`` os grupos de cada bloco são estimados em N processos. O
+processo principal continua lendo o arquivo e pareando as respostas; cada
+worker recebe só a matriz int8 de acertos do grupo e devolve θ e nota, na
+mesma ordem da execução em um processo.
+"""
+
+from __future__ import annotations
+
+import argparse
+import concurrent.futures
+import contextlib
+import multiprocessing
+import os
+import sys
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, TextIO, Tuple
+
+import numpy as np
+import pandas as pd
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+sys.path.insert(0, str(ROOT))
+
+from tri_enem import CalculadorTRI  # noqa: E402
+from tri_enem.tradutor import filtrar_respostas_lc_lote, obter_config_lc  # noqa: E402
+from tools.recalibrar_validacao import (  # noqa: E402
+    AREAS,
+    _id_coluna,
+    _linhas_validas,
+    localizar_microdados,
+)
+
+COLUNAS_SAIDA = ("SG_AREA", "CO_PROVA", "TP_LINGUA", "THETA", "NOTA")
+# Acrescentadas com intervalo=True (--com-intervalo).
+COLUNAS_INTERVALO = ("DP_THETA", "NOTA_INF", "NOTA_SUP")
+# Variáveis lidas pelas bibliotecas BLAS ao carregar o NumPy.
+VARIAVEIS_BLAS = (
+    "OMP_NUM_THREADS",
+    "OPENBLAS_NUM_THREADS",
+    "MKL_NUM_THREADS",
+    "BLIS_NUM_THREADS",
+    "VECLIB_MAXIMUM_THREADS",
+    "NUMEXPR_NUM_THREADS",
+)
+
+# (area, co_prova, tp_lingua): identifica o banco de itens dentro do ano.
+ChaveGrupo = Tuple[str, int, Optional[int]]
+
+
+def agrupar_bloco(
+    calc: CalculadorTRI,
+    chunk: pd.DataFrame,
+    ano: int,
+    area: str,
+    id_col: Optional[str],
+    diagnostico: Dict[str, Any],
+) -> List[Tuple[ChaveGrupo, np.ndarray, np.ndarray]]:
+    """Linhas válidas de uma área em um bloco, por (CO_PROVA, TP_LINGUA).
+
+    Presentes na área cujas respostas ``_linhas_validas`` recusa (prova ou
+    respostas ausentes, caracteres fora de A-E, idioma incompatível) são
+    contados em ``diagnostico["respostas_recusadas"]``, por área.
+
+    Returns:
+        Lista de (chave do grupo, identificadores, matriz int8 de acertos)
+    """
+    dados = _linhas_validas(chunk, ano, area, id_col, exigir_nota=False)
+    presenca = f"TP_PRESENCA_{area}"
+    if presenca in chunk.columns:
+        presentes = int(pd.to_numeric(chunk[presenca], errors="coerce").eq(1).sum())
+        if presentes > len(dados):
+            diagnostico["respostas_recusadas"][area] += presentes - len(dados)
+    if dados.empty:
+        return []
+    dados = dados.assign(
+        respostas=dados["respostas"].astype(str),
+        prova=dados["prova"].astype(int),
+        lingua=dados["lingua"].astype("Int64"),
+    )
+
+    grupos = []
+    for (prova, lingua), grupo in dados.groupby(
+        ["prova", "lingua"], dropna=False, sort=True
+    ):
+        tp_lingua = None if pd.isna(lingua) else int(lingua)
+        try:
+            itens = calc.carregar_itens(ano, area, int(prova), tp_lingua)
+        except (FileNotFoundError, KeyError, ValueError):
+            diagnostico["sem_itens"][f"{ano},{area},{int(prova)}"] += len(grupo)
+            continue
+        respostas = grupo["respostas"].tolist()
+        erros_lc = False
+        if area == "LC":
+            # Reduz LC de 50 para 45 caracteres (mesmas regras do escalar).
+            respostas, erros_lc = filtrar_respostas_lc_lote(
+                respostas, tp_lingua if tp_lingua is not None else 0,
+                obter_config_lc(ano),
+            )
+        matriz, erros = itens.acertos_lote(respostas)
+        erros = erros | erros_lc
+        if erros.any():
+            diagnostico["respostas_invalidas"] += int(erros.sum())
+        grupos.append((
+            (area, int(prova), tp_lingua),
+            grupo["identificador"].to_numpy()[~erros],
+            matriz[~erros],
+        ))
+    return grupos
+
+
+def estimar_grupo(
+    calc: CalculadorTRI, ano: int, chave: ChaveGrupo, matriz: np.ndarray,
+    intervalo: bool = False,
+) -> Dict[str, np.ndarray]:
+    """Colunas THETA e NOTA (e as de ``COLUNAS_INTERVALO``) de uma prova."""
+    area, prova, tp_lingua = chave
+    itens = calc.carregar_itens(ano, area, prova, tp_lingua)
+    if not intervalo:
+        thetas = calc.estimar_theta_eap_batch(matriz, itens)
+        return {
+            "THETA": thetas,
+            "NOTA": calc.transformar_escala_batch(thetas, ano, area, prova),
+        }
+    # Mesma passagem pela posterior: sem segunda avaliação da verossimilhança.
+    resumo = calc.estimar_theta_eap_batch(matriz, itens, posterior=True)
+    return {
+        "THETA": resumo["theta"],
+        "NOTA": calc.transformar_escala_batch(resumo["theta"], ano, area, prova),
+        "DP_THETA": resumo["dp"],
+        "NOTA_INF": calc.transformar_escala_batch(resumo["theta_inf"], ano, area, prova),
+        "NOTA_SUP": calc.transformar_escala_batch(resumo["theta_sup"], ano, area, prova),
+    }
+
+
+def _resultado_grupo(
+    chave: ChaveGrupo, identificadores: np.ndarray, colunas: Dict[str, np.ndarray]
+) -> pd.DataFrame:
+    area, prova, tp_lingua = chave
+    return pd.DataFrame({
+        "identificador": identificadores,
+        "SG_AREA": area,
+        "CO_PROVA": prova,
+        "TP_LINGUA": pd.array([tp_lingua] * len(identificadores), dtype="Int64"),
+        **colunas,
+    })
+
+
+# Estado de cada worker, preenchido por _iniciar_worker.
+_CALC_WORKER: Optional[CalculadorTRI] = None
+_ANO_WORKER: Optional[int] = None
+
+
+def _aquecer(calc: CalculadorTRI, ano: int, areas: Sequence[str]) -> None:
+    """Carrega os bancos e tabelas de todas as provas do ano."""
+    for area in areas:
+        try:
+            provas = calc.listar_provas(ano, area)[area]
+        except FileNotFoundError:
+            continue
+        for prova in provas:
+            # None: LC de 2009, sem opção de idioma.
+            for tp_lingua in ((None, 0, 1) if area == "LC" else (None,)):
+                with contextlib.suppress(KeyError, ValueError):
+                    calc._tabela(calc.carregar_itens(ano, area, prova, tp_lingua))
+
+
+def _iniciar_worker(
+    configuracao: Dict[str, Any], ano: int, areas: Sequence[str]
+) -> None:
+    global _CALC_WORKER, _ANO_WORKER
+    _CALC_WORKER = CalculadorTRI(**configuracao)
+    _ANO_WORKER = ano
+    _aquecer(_CALC_WORKER, ano, areas)
+
+
+def _estimar_no_worker(
+    chave: ChaveGrupo, matriz: np.ndarray, intervalo: bool
+) -> Dict[str, np.ndarray]:
+    return estimar_grupo(_CALC_WORKER, _ANO_WORKER, chave, matriz, intervalo)
+
+
+@contextlib.contextmanager
+def _threads_blas(threads: int) -> Iterator[None]:
+    """Fixa as threads BLAS dos processos iniciados dentro do bloco.
+
+    As bibliotecas BLAS leem essas variáveis uma vez, ao carregar; por isso os
+    workers são iniciados com ``spawn`` (processo novo, que herda o ambiente)
+    e o ambiente do processo principal é restaurado na saída.
+    """
+    anteriores = {nome: os.environ.get(nome) for nome in VARIAVEIS_BLAS}
+    os.environ.update({nome: str(threads) for nome in VARIAVEIS_BLAS})
+    try:
+        yield
+    finally:
+        for nome, valor in anteriores.items():
+            if valor is None:
+                os.environ.pop(nome, None)
+            else:
+                os.environ[nome] = valor
+
+
+def pontuar_microdados(
+    calc: CalculadorTRI,
+    caminho: Path,
+    ano: int,
+    saida: TextIO,
+    areas: Sequence[str] = AREAS,
+    chunk_size: int = 250_000,
+    progresso: bool = True,
+    workers: int = 1,
+    intervalo: bool = False,
+) -> Dict[str, Any]:
+    """Pontua o arquivo bloco a bloco, gravando CSV (';') em ``saida``.
+
+    Com ``workers > 1`` os grupos são estimados em processos com uma thread
+    BLAS cada. Enquanto os workers estimam um bloco, o processo principal lê
+    e pareia o seguinte; no máximo dois blocos ficam em memória. A saída é
+    idêntica à de ``workers=1``, inclusive na ordem das linhas.
+
+    Returns:
+        Dict com 'linhas_lidas', 'linhas_pontuadas', 'segundos',
+        'linhas_por_segundo', 'sem_itens' (participantes de provas sem
+        parâmetros, por "ano,area,prova"), 'respostas_recusadas'
+        (presentes sem respostas utilizáveis, por área) e
+        'respostas_invalidas' (strings que não casam com a prova, por
+        exemplo em comprimento).
+    """
+    header = pd.read_csv(caminho, encoding="latin1", sep=";", nrows=0)
+    id_col = _id_coluna(header.columns)
+    usecols = []
+    for area in areas:
+        usecols.extend([
+            f"TP_PRESENCA_{area}",
+            f"CO_PROVA_{area}",
+            f"TX_RESPOSTAS_{area}",
+        ])
+    usecols.extend(["TP_LINGUA", id_col])
+    usecols = list(dict.fromkeys(col for col in usecols if col in header.columns))
+
+    if workers < 1:
+        raise ValueError("workers deve ser pelo menos 1")
+
+    diagnostico: Dict[str, Any] = {
+        "sem_itens": defaultdict(int),
+        "respostas_recusadas": defaultdict(int),
+        "respostas_invalidas": 0,
+    }
+    nome_id = id_col or "LINHA"
+    lidas = pontuadas = 0
+    inicio = time.perf_counter()
+    colunas = COLUNAS_SAIDA + (COLUNAS_INTERVALO if intervalo else ())
+    saida.write(";".join((nome_id,) + colunas) + "\n")
+
+    def gravar(grupos, estimativas) -> None:
+        nonlocal pontuadas
+        for (chave, identificadores, _), estimativa in zip(grupos, estimativas):
+            _resultado_grupo(chave, identificadores, estimativa).rename(
+                columns={"identificador": nome_id}
+            ).to_csv(saida, sep=";", index=False, header=False)
+            pontuadas += len(identificadores)
+
+    with contextlib.ExitStack() as pilha:
+        executor = None
+        if workers > 1:
+            pilha.enter_context(_threads_blas(1))
+            executor = pilha.enter_context(concurrent.futures.ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_iniciar_worker,
+                initargs=(calc._configuracao(), ano, tuple(areas)),
+            ))
+        pendente = None
+        for numero_chunk, chunk in enumerate(pd.read_csv(
+            caminho,
+            encoding="latin1",
+            sep=";",
+            usecols=usecols,
+            dtype={id_col: str} if id_col else None,
+            chunksize=chunk_size,
+            low_memory=False,
+        ), start=1):
+            chunk.index = np.arange(lidas, lidas + len(chunk))
+            lidas += len(chunk)
+            grupos = [
+                grupo
+                for area in areas
+                for grupo in agrupar_bloco(calc, chunk, ano, area, id_col, diagnostico)
+            ]
+            del chunk
+            if executor is None:
+                gravar(grupos, (
+                    estimar_grupo(calc, ano, chave, matriz, intervalo)
+                    for chave, _, matriz in grupos
+                ))
+            else:
+                futuros = [
+                    executor.submit(_estimar_no_worker, chave, matriz, intervalo)
+                    for chave, _, matriz in grupos
+                ]
+                if pendente is not None:
+                    gravar(pendente[0], (f.result() for f in pendente[1]))
+                pendente = (grupos, futuros)
+            if progresso and numero_chunk % 5 == 0:
+                decorrido = time.perf_counter() - inicio
+                print(
+                    f"  {lidas:,} linhas; {lidas / decorrido:,.0f} linhas/s",
+                    file=sys.stderr,
+                    flush=True,
+                )
+        if pendente is not None:
+            gravar(pendente[0], (f.result() for f in pendente[1]))
+
+    segundos = time.perf_counter() - inicio
+    return {
+        "linhas_lidas": lidas,
+        "linhas_pontuadas": pontuadas,
+        "segundos": segundos,
+        "linhas_por_segundo": lidas / segundos if segundos > 0 else 0.0,
+        "sem_itens": dict(sorted(diagnostico["sem_itens"].items())),
+        "respostas_recusadas": dict(diagnostico["respostas_recusadas"]),
+        "respostas_invalidas": diagnostico["respostas_invalidas"],
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    origem = parser.add_mutually_exclusive_group(required=True)
+    origem.add_argument("--microdados", type=Path,
+                        help="arquivo MICRODADOS_ENEM_<ano>.csv")
+    origem.add_argument("--microdados-dir", type=Path,
+                        help="estrutura de download do INEP")
+    parser.add_argument("--ano", required=True, type=int)
+    parser.add_argument("--saida", required=True, type=Path)
+    parser.add_argument("--areas", nargs="+", choices=AREAS, default=list(AREAS))
+    parser.add_argument("--itens-path", type=Path)
+    parser.add_argument("--chunk-size", type=int, default=250_000)
+    parser.add_argument("--workers", type=int, default=1,
+                        help="processos de estimação (1 = no próprio processo)")
+    parser.add_argument("--com-intervalo", action="store_true",
+                        help="inclui DP_THETA e o intervalo de credibilidade de 95%%")
+    args = parser.parse_args()
+    if args.chunk_size < 1:
+        parser.error("--chunk-size deve ser pelo menos 1")
+    if args.workers < 1:
+        parser.error("--workers deve ser pelo menos 1")
+
+    caminho = args.microdados or localizar_microdados(args.microdados_dir, args.ano)
+    calc = CalculadorTRI(str(args.itens_path) if args.itens_path else None)
+    print(f"{args.ano}: pontuando {caminho.name}", file=sys.stderr, flush=True)
+    with open(args.saida, "w", encoding="utf-8", newline="") as saida:
+        resumo = pontuar_microdados(
+            calc, caminho, args.ano, saida, args.areas, args.chunk_size,
+            workers=args.workers, intervalo=args.com_intervalo,
+        )
+    for chave, quantidade in resumo["sem_itens"].items():
+        print(f"  sem itens: {chave} ({quantidade:,} participantes)", file=sys.stderr)
+    for area, quantidade in resumo["respostas_recusadas"].items():
+        print(
+            f"  respostas recusadas: {area} ({quantidade:,} presentes)",
+            file=sys.stderr,
+        )
+    if resumo["respostas_invalidas"]:
+        print(
+            f"  respostas inválidas: {resumo['respostas_invalidas']:,}",
+            file=sys.stderr,
+        )
+    print(
+        f"Concluído: {resumo['linhas_pontuadas']:,} notas de "
+        f"{resumo['linhas_lidas']:,} linhas em {resumo['segundos']:.1f}s "
+        f"({resumo['linhas_por_segundo']:,.0f} linhas/s)",
+        file=sys.stderr,
+        flush=True,
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
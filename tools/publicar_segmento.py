@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: PolyForm-Noncommercial-1.0.0
+"""Publica o segmento compartilhado de bancos e tabelas para os workers."""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from tri_enem.segmento import publicar_segmento  # noqa: E402
+
+DESTINO_PADRAO = Path("/dev/shm/tri_enem_segmento.bin")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--destino", type=Path, default=DESTINO_PADRAO,
+        help=f"arquivo do segmento (padrão: {DESTINO_PADRAO})",
+    )
+    parser.add_argument(
+        "--itens-dir", type=Path, default=None,
+        help="pasta de itens com manifest.json (padrão: a empacotada)",
+    )
+    args = parser.parse_args()
+    inicio = time.perf_counter()
+    destino = publicar_segmento(
+        args.destino, None if args.itens_dir is None else str(args.itens_dir)
+    )
+    print(
+        f"Segmento publicado em {destino} "
+        f"({destino.stat().st_size / 1024 / 1024:.2f} MiB, "
+        f"{time.perf_counter() - inicio:.1f} s)."
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
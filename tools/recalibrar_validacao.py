@@ -33,6 +33,7 @@ ROOT = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(ROOT / "src"))
 
 from tri_enem import CalculadorTRI, MapeadorProvas  # noqa: E402
+from tri_enem.catalogo import escrever_catalogo_binario  # noqa: E402
 from tri_enem.calibracao_modelos import (  # noqa: E402
     ROTULOS_FAIXAS,
     classificar_validacao,
@@ -260,19 +261,29 @@ def _linhas_validas(
     ano: int,
     area: str,
     id_col: str | None,
+    exigir_nota: bool = True,
 ) -> pd.DataFrame:
+    """Participantes presentes com respostas utilizáveis na área.
+
+    Com ``exigir_nota=False`` a nota oficial não é exigida (pontuação de
+    microdados sem NU_NOTA, ver ``tools/pontuar_microdados.py``).
+    """
     pres = f"TP_PRESENCA_{area}"
     prova = f"CO_PROVA_{area}"
     nota = f"NU_NOTA_{area}"
     resp = f"TX_RESPOSTAS_{area}"
-    obrigatorias = (pres, prova, nota, resp)
+    obrigatorias = (pres, prova, nota, resp) if exigir_nota else (pres, prova, resp)
     if not all(col in chunk.columns for col in obrigatorias):
         return pd.DataFrame()
 
     trabalho = pd.DataFrame({
         "presenca": pd.to_numeric(chunk[pres], errors="coerce"),
         "prova": pd.to_numeric(chunk[prova], errors="coerce"),
-        "nota": pd.to_numeric(chunk[nota], errors="coerce"),
+        "nota": (
+            pd.to_numeric(chunk[nota], errors="coerce")
+            if nota in chunk.columns
+            else pd.Series(np.nan, index=chunk.index)
+        ),
         "respostas": chunk[resp],
     })
     if area == "LC" and ano != 2009 and "TP_LINGUA" in chunk.columns:
@@ -285,11 +296,14 @@ def _linhas_validas(
     valido = (
         trabalho["presenca"].eq(1)
         & trabalho["prova"].notna()
-        & trabalho["nota"].notna()
-        & np.isfinite(trabalho["nota"])
-        & trabalho["nota"].gt(0)
         & trabalho["respostas"].notna()
     )
+    if exigir_nota:
+        valido &= (
+            trabalho["nota"].notna()
+            & np.isfinite(trabalho["nota"])
+            & trabalho["nota"].gt(0)
+        )
     if area == "LC" and ano != 2009:
         valido &= trabalho["lingua"].isin([0, 1])
     respostas = trabalho["respostas"].astype("string").str.upper()
@@ -1254,6 +1268,7 @@ def publicar_atomico(
 ) -> None:
     destinos = {
         "catalogo": ROOT / "src" / "tri_enem" / "coeficientes_data.json",
+        "catalogo_binario": ROOT / "src" / "tri_enem" / "coeficientes_data.bin",
         "holdout": ROOT / "tests" / "fixtures" / "validation_holdout.jsonl.gz",
         "manifesto": ROOT / "tests" / "fixtures" / "validation_manifest.json",
         "relatorio": ROOT / "docs" / "VALIDATION_REPORT.md",
@@ -1262,6 +1277,7 @@ def publicar_atomico(
         temp = Path(temporario)
         arquivos = {
             "catalogo": temp / "coeficientes_data.json",
+            "catalogo_binario": temp / "coeficientes_data.bin",
             "holdout": temp / "validation_holdout.jsonl.gz",
             "manifesto": temp / "validation_manifest.json",
             "relatorio": temp / "VALIDATION_REPORT.md",
@@ -1272,6 +1288,11 @@ def publicar_atomico(
             ) + "\n",
             encoding="utf-8",
         )
+        # Formato de execução: ligado ao JSON acima pelo sha256, é ignorado
+        # pelo pacote se os dois saírem de sincronia.
+        escrever_catalogo_binario(
+            arquivos["catalogo"], arquivos["catalogo_binario"]
+        )
         with gzip.open(arquivos["holdout"], "wt", encoding="utf-8") as saida:
             for caso in holdout:
                 saida.write(